@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Mesure le coût de démarrage à froid de l'encodeur : temps d'import, latence du
+premier encodage et dépendances lourdes chargées. Chaque mesure s'exécute dans
+un interpréteur neuf.
+
+Usage (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m benchmarks.cold_start --runs 5
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+import click
+
+HEAVY_MODULES = ("cv2", "numpy", "PIL")
+
+_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+from graphic_protocol.encoder.data_encoder import DataEncoder
+from graphic_protocol.encoder.new_matrix import EncodingMatrix
+from graphic_protocol.encoder.renderer import MatrixRenderer
+from graphic_protocol.encoder.vector_renderer import VectorRenderer
+from graphic_protocol.encoder.matrix import EncodingMatrix as ListEncodingMatrix
+t1 = time.perf_counter()
+matrix = ListEncodingMatrix(text="https://example.com/ticket?id=42", error_correction="M")
+svg = VectorRenderer(matrix).to_svg()
+t2 = time.perf_counter()
+after_encode = [name for name in {heavy!r} if name in sys.modules]
+MatrixRenderer(matrix).render_to_bytes()
+t3 = time.perf_counter()
+after_raster = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{
+    "import_ms": (t1 - t0) * 1000,
+    "first_encode_ms": (t2 - t1) * 1000,
+    "first_raster_ms": (t3 - t2) * 1000,
+    "heavy_after_encode": after_encode,
+    "heavy_after_raster": after_raster,
+}}))
+""".format(heavy=HEAVY_MODULES)
+
+
+def src_path() -> str:
+    """Chemin du dossier src du dépôt."""
+    return os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def measure_once() -> Dict[str, object]:
+    """
+    Lance une mesure dans un nouvel interpréteur.
+
+    Returns:
+        dict: Temps (ms) et modules lourds chargés après encodage puis après rendu PNG
+    """
+    env = dict(os.environ, PYTHONPATH=src_path())
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE], env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+@click.command()
+@click.option("--runs", default=5, show_default=True, help="Nombre d'interpréteurs lancés")
+def main(runs: int) -> None:
+    results: List[Dict[str, object]] = [measure_once() for _ in range(runs)]
+    for key in ("import_ms", "first_encode_ms", "first_raster_ms"):
+        values = [float(r[key]) for r in results]
+        click.echo(f"{key:<16} médiane {statistics.median(values):8.2f} ms  max {max(values):8.2f} ms")
+    click.echo(f"lourds après encodage : {results[0]['heavy_after_encode'] or 'aucun'}")
+    click.echo(f"lourds après rendu PNG : {results[0]['heavy_after_raster']}")
+    if results[0]["heavy_after_encode"]:
+        raise SystemExit("Régression : l'encodeur charge une dépendance lourde")
+
+
+if __name__ == "__main__":
+    main()
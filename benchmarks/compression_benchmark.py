@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Mesure la réduction de version obtenue par la compression deflate des charges utiles.
+
+Usage (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m benchmarks.compression_benchmark
+"""
+
+import json
+import random
+from typing import Dict, List, Optional
+
+from graphic_protocol.encoder.data_encoder import DataEncoder, EncodingMode
+
+
+def _json_corpus(rng: random.Random, count: int) -> List[str]:
+    """Génère des documents JSON courts et répétitifs (événements, tickets)."""
+    statuses = ["pending", "active", "done", "cancelled"]
+    corpus = []
+    for i in range(count):
+        document = {
+            "id": rng.randint(1, 10**6),
+            "type": "ticket",
+            "status": rng.choice(statuses),
+            "created_at": f"2024-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T10:00:00Z",
+            "data": {"name": f"Client {i}", "value": rng.randint(0, 999)},
+        }
+        corpus.append(json.dumps(document, separators=(",", ":")))
+    return corpus
+
+
+def _url_corpus(rng: random.Random, count: int) -> List[str]:
+    """Génère des URLs avec paramètres de suivi."""
+    hosts = ["example.com", "shop.example.fr", "www.example.org"]
+    corpus = []
+    for _ in range(count):
+        corpus.append(
+            f"https://{rng.choice(hosts)}/products/{rng.randint(1, 99999)}.html"
+            f"?id={rng.randint(1, 10**6)}&utm_source=label&utm_medium=print&utm_campaign=spring"
+        )
+    return corpus
+
+
+def _prose_corpus(rng: random.Random, count: int) -> List[str]:
+    """Génère de courtes phrases (peu compressibles, sert de témoin)."""
+    words = ["protocole", "graphique", "matrice", "module", "message", "code", "lecture", "image"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(4, 12))) for _ in range(count)]
+
+
+def benchmark_corpus(texts: List[str], error_correction: str = 'L',
+                     preset_dictionary: Optional[bytes] = None) -> Dict[str, float]:
+    """
+    Encode chaque texte avec et sans compression et compare les versions obtenues.
+
+    Args:
+        texts: Textes à encoder
+        error_correction: Niveau de correction d'erreur
+        preset_dictionary: Dictionnaire prédéfini (None pour celui par défaut)
+
+    Returns:
+        dict: Statistiques agrégées (versions moyennes, taux de compression, etc.)
+    """
+    kwargs = {} if preset_dictionary is None else {"preset_dictionary": preset_dictionary}
+    raw_versions = []
+    compressed_versions = []
+    raw_bits = 0
+    compressed_bits = 0
+    deflated = 0
+    for text in texts:
+        raw = DataEncoder(text, error_correction=error_correction)
+        packed = DataEncoder(text, error_correction=error_correction, compression=True, **kwargs)
+        raw_versions.append(raw.version.version_number)
+        compressed_versions.append(packed.version.version_number)
+        raw_bits += len(raw.encode()[0])
+        compressed_bits += len(packed.encode()[0])
+        deflated += packed.mode == EncodingMode.DEFLATE
+
+    count = len(texts)
+    return {
+        "samples": count,
+        "deflate_ratio": deflated / count,
+        "raw_version": sum(raw_versions) / count,
+        "compressed_version": sum(compressed_versions) / count,
+        "versions_saved": sum(r - c for r, c in zip(raw_versions, compressed_versions)) / count,
+        "bits_ratio": compressed_bits / raw_bits,
+    }
+
+
+def main(seed: int = 0, count: int = 200) -> None:
+    rng = random.Random(seed)
+    corpora = {
+        "json": _json_corpus(rng, count),
+        "urls": _url_corpus(rng, count),
+        "prose": _prose_corpus(rng, count),
+    }
+    print(f"{'corpus':<8} {'deflate':>8} {'v. brute':>9} {'v. comp.':>9} {'gain':>6} {'bits':>6}")
+    for name, texts in corpora.items():
+        stats = benchmark_corpus(texts)
+        print(
+            f"{name:<8} {stats['deflate_ratio']:>8.0%} {stats['raw_version']:>9.2f} "
+            f"{stats['compressed_version']:>9.2f} {stats['versions_saved']:>6.2f} {stats['bits_ratio']:>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
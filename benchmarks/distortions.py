@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Générateur déterministe d'un corpus de symboles distordus.
+
+Chaque échantillon est entièrement déterminé par (graine, indice) : le corpus
+n'est jamais stocké, chaque processus peut régénérer n'importe quel échantillon.
+"""
+
+from typing import List, NamedTuple, Tuple
+
+import cv2
+import numpy as np
+
+from graphic_protocol.encoder.matrix import EncodingMatrix
+from graphic_protocol.encoder.renderer import MatrixRenderer
+
+# Distorsions disponibles, chacune avec deux niveaux de sévérité
+DISTORTIONS: Tuple[str, ...] = ("clean", "rotation", "perspective", "blur", "noise", "jpeg", "lighting")
+SEVERITIES: Tuple[str, ...] = ("low", "high")
+
+_WORDS = (
+    "protocole", "graphique", "matrice", "module", "message", "ticket", "lecture",
+    "image", "code", "marqueur", "version", "https://example.com/p?id=", "2024",
+)
+
+
+class Sample(NamedTuple):
+    """Échantillon du corpus : image BGR, texte attendu et catégorie de distorsion."""
+    index: int
+    bucket: str
+    text: str
+    image: np.ndarray
+
+
+def bucket_names() -> List[str]:
+    """Liste les catégories (distorsion:sévérité) dans l'ordre de génération."""
+    names = ["clean"]
+    names.extend(f"{d}:{s}" for d in DISTORTIONS[1:] for s in SEVERITIES)
+    return names
+
+
+class DistortionGenerator:
+    """
+    Produit des images de symboles rendus par MatrixRenderer puis distordus
+    (rotation, perspective, flou, bruit, artefacts JPEG, gradient d'éclairage).
+    """
+
+    def __init__(self, seed: int = 0, error_correction: str = 'M'):
+        """
+        Args:
+            seed: Graine du corpus
+            error_correction: Niveau de correction d'erreur des symboles générés
+        """
+        self.seed = seed
+        self.error_correction = error_correction
+        self.buckets = bucket_names()
+
+    def generate(self, index: int) -> Sample:
+        """
+        Génère l'échantillon `index` (toujours identique pour une même graine).
+
+        Args:
+            index: Indice de l'échantillon
+
+        Returns:
+            Sample: Échantillon généré
+        """
+        rng = np.random.default_rng([self.seed, index])
+        bucket = self.buckets[index % len(self.buckets)]
+        text = " ".join(rng.choice(_WORDS, size=int(rng.integers(1, 6))))
+
+        matrix = EncodingMatrix(text=text, error_correction=self.error_correction)
+        renderer = MatrixRenderer(matrix, module_size=int(rng.integers(4, 9)), margin=4)
+        image = cv2.cvtColor(np.asarray(renderer.render_to_image()), cv2.COLOR_RGB2BGR)
+
+        if bucket != "clean":
+            distortion, severity = bucket.split(":")
+            image = getattr(self, f"_{distortion}")(image, rng, severity == "high")
+        return Sample(index, bucket, text, image)
+
+    @staticmethod
+    def _pad(image: np.ndarray, ratio: float = 0.2) -> np.ndarray:
+        """Ajoute une bordure blanche pour que les transformations géométriques ne coupent pas le symbole."""
+        pad = int(image.shape[0] * ratio)
+        return cv2.copyMakeBorder(image, pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=(255, 255, 255))
+
+    def _rotation(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        image = self._pad(image)
+        limit = 45.0 if high else 8.0
+        angle = float(rng.uniform(-limit, limit))
+        height, width = image.shape[:2]
+        transform = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        return cv2.warpAffine(image, transform, (width, height), flags=cv2.INTER_LINEAR,
+                              borderValue=(255, 255, 255))
+
+    def _perspective(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        image = self._pad(image)
+        height, width = image.shape[:2]
+        jitter = (0.08 if high else 0.03) * width
+        source = np.float32([[0, 0], [width, 0], [width, height], [0, height]])
+        target = source + rng.uniform(-jitter, jitter, size=(4, 2)).astype(np.float32)
+        transform = cv2.getPerspectiveTransform(source, target)
+        return cv2.warpPerspective(image, transform, (width, height), flags=cv2.INTER_LINEAR,
+                                   borderValue=(255, 255, 255))
+
+    def _blur(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        sigma = float(rng.uniform(1.5, 3.0) if high else rng.uniform(0.5, 1.2))
+        return cv2.GaussianBlur(image, (0, 0), sigma)
+
+    def _noise(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        sigma = 40.0 if high else 12.0
+        noisy = image.astype(np.float32) + rng.normal(0.0, sigma, size=image.shape[:2])[..., None]
+        return np.clip(noisy, 0, 255).astype(np.uint8)
+
+    def _jpeg(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        quality = int(rng.integers(5, 20) if high else rng.integers(40, 75))
+        ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise RuntimeError("Échec de l'encodage JPEG")
+        return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+
+    def _lighting(self, image: np.ndarray, rng: np.random.Generator, high: bool) -> np.ndarray:
+        height, width = image.shape[:2]
+        angle = float(rng.uniform(0, 2 * np.pi))
+        ys, xs = np.mgrid[0:height, 0:width].astype(np.float32)
+        ramp = (np.cos(angle) * xs / width + np.sin(angle) * ys / height)
+        ramp = (ramp - ramp.min()) / max(float(np.ptp(ramp)), 1e-6)
+        darkest = 0.3 if high else 0.7
+        gain = 1.0 - (1.0 - darkest) * ramp
+        return np.clip(image.astype(np.float32) * gain[..., None], 0, 255).astype(np.uint8)
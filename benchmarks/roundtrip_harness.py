@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Banc de mesure aller-retour : ImageDetector + MatrixDecoder sur le corpus distordu.
+
+Rapporte le débit (décodages par seconde), les centiles de latence et le taux de
+réussite par catégorie de distorsion, afin de juger une optimisation du détecteur
+à la fois sur la vitesse et sur la précision.
+
+Usage (depuis la racine du dépôt) :
+    PYTHONPATH=src python -m benchmarks.roundtrip_harness --samples 2000 --workers 4
+"""
+
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import click
+import numpy as np
+
+from benchmarks.distortions import DistortionGenerator, bucket_names
+from graphic_protocol.decoder.image_detector import ImageDetector
+from graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+# État propre à chaque processus de travail, initialisé une seule fois
+_worker: Dict[str, object] = {}
+
+
+def _init_worker(seed: int, error_correction: str) -> None:
+    _worker["generator"] = DistortionGenerator(seed, error_correction)
+    _worker["detector"] = ImageDetector()
+    _worker["decoder"] = MatrixDecoder()
+
+
+def _run_sample(index: int) -> Tuple[str, bool, float]:
+    """
+    Génère puis décode un échantillon ; seule la détection et le décodage sont chronométrés.
+
+    Returns:
+        Tuple (catégorie, succès, latence en secondes)
+    """
+    sample = _worker["generator"].generate(index)
+    detector: ImageDetector = _worker["detector"]
+    decoder: MatrixDecoder = _worker["decoder"]
+
+    start = time.perf_counter()
+    try:
+        result = detector.detect_with_confidence(sample.image)
+        text: Optional[str] = decoder.decode(*result) if result is not None else None
+    except Exception:
+        text = None
+    latency = time.perf_counter() - start
+    return sample.bucket, text == sample.text, latency
+
+
+def run_harness(samples: int, workers: int = 1, seed: int = 0,
+                error_correction: str = 'M') -> Dict[str, Dict[str, float]]:
+    """
+    Exécute le banc sur `samples` échantillons répartis sur `workers` processus.
+
+    Returns:
+        dict: Statistiques par catégorie, plus une entrée 'total'
+    """
+    results: Dict[str, List[Tuple[bool, float]]] = defaultdict(list)
+    started = time.perf_counter()
+    if workers <= 1:
+        _init_worker(seed, error_correction)
+        outcomes = map(_run_sample, range(samples))
+        for bucket, ok, latency in outcomes:
+            results[bucket].append((ok, latency))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(seed, error_correction)) as pool:
+            chunksize = max(1, samples // (workers * 8))
+            for bucket, ok, latency in pool.map(_run_sample, range(samples), chunksize=chunksize):
+                results[bucket].append((ok, latency))
+    elapsed = time.perf_counter() - started
+
+    report = {}
+    all_outcomes = []
+    for bucket in bucket_names():
+        if bucket in results:
+            report[bucket] = _summarize(results[bucket])
+            all_outcomes.extend(results[bucket])
+    report["total"] = _summarize(all_outcomes)
+    report["total"]["throughput"] = samples / elapsed
+    return report
+
+
+def _summarize(outcomes: List[Tuple[bool, float]]) -> Dict[str, float]:
+    latencies = np.array([latency for _, latency in outcomes]) * 1000.0
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "samples": len(outcomes),
+        "success_rate": sum(ok for ok, _ in outcomes) / len(outcomes),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        # Débit d'un seul cœur, déduit de la latence moyenne
+        "decodes_per_sec": 1000.0 / max(float(latencies.mean()), 1e-9),
+    }
+
+
+@click.command()
+@click.option("--samples", default=2000, show_default=True, help="Nombre d'échantillons")
+@click.option("--workers", default=1, show_default=True, help="Nombre de processus")
+@click.option("--seed", default=0, show_default=True, help="Graine du corpus")
+@click.option("--error-correction", default="M", show_default=True,
+              type=click.Choice(["L", "M", "Q", "H"]), help="Niveau de correction d'erreur")
+def main(samples: int, workers: int, seed: int, error_correction: str) -> None:
+    report = run_harness(samples, workers, seed, error_correction)
+    click.echo(f"{'catégorie':<18} {'n':>6} {'réussite':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'déc/s':>8}")
+    for bucket, stats in report.items():
+        click.echo(
+            f"{bucket:<18} {stats['samples']:>6} {stats['success_rate']:>9.1%} {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['decodes_per_sec']:>8.0f}"
+        )
+    click.echo(f"\nDébit global : {report['total']['throughput']:.0f} échantillons/s ({workers} processus)")
+
+
+if __name__ == "__main__":
+    main()
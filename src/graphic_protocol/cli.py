@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Interface en ligne de commande du protocole graphique.
+
+    graphic-protocol encode "Bonjour"                 # un seul message
+    cat messages.txt | graphic-protocol encode        # un message par ligne
+    cat items.jsonl | graphic-protocol encode --jsonl # {"text": ..., "id": ...}
+    graphic-protocol decode scans/ "photos/*.png"     # dossiers et motifs glob
+    find scans -name '*.png' | graphic-protocol decode
+    graphic-protocol decode --tiled planche.npy       # tous les symboles d'un grand scan
+
+Les éléments sont répartis sur N processus : les coûts de démarrage (imports,
+détecteur, décodeur) sont payés une fois par processus et non par élément.
+Chaque résultat est écrit sur la sortie standard sous forme d'une ligne JSON.
+"""
+
+import glob
+import json
+import os
+import re
+import sys
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+import click
+from tqdm import tqdm
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff")
+
+# État propre à chaque processus de travail, initialisé une seule fois
+_state: Dict[str, Any] = {}
+
+
+def _read_items(stream, jsonl: bool, key: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lit les éléments depuis un flux texte : une valeur par ligne, ou un objet JSON
+    par ligne si `jsonl` est vrai. Les lignes vides sont ignorées.
+
+    Raises:
+        click.ClickException: Si une ligne n'est pas un objet JSON valide contenant `key`
+    """
+    for number, line in enumerate(stream, start=1):
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        if jsonl:
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise click.ClickException(f"Ligne {number}: JSON invalide ({e.msg}, colonne {e.colno})")
+            if not isinstance(item, dict) or key not in item:
+                raise click.ClickException(f"Ligne {number}: champ '{key}' manquant: {line}")
+            yield item
+        else:
+            yield {key: line}
+
+
+def _expand_inputs(inputs: Iterable[str]) -> Iterator[str]:
+    """Développe les dossiers (images triées) et motifs glob en chemins de fichiers."""
+    for entry in inputs:
+        if os.path.isdir(entry):
+            for name in sorted(os.listdir(entry)):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    yield os.path.join(entry, name)
+        elif glob.has_magic(entry):
+            yield from sorted(glob.glob(entry, recursive=True))
+        else:
+            yield entry
+
+
+def _run_batch(worker: Callable[[Tuple[int, Dict[str, Any]]], Dict[str, Any]],
+               initializer: Callable[..., None], initargs: tuple,
+               items: Iterable[Dict[str, Any]], workers: int, ordered: bool,
+               progress: bool, unit: str) -> int:
+    """
+    Traite les éléments (en parallèle si workers > 1) et écrit les résultats en JSONL.
+
+    Returns:
+        int: Nombre d'éléments en erreur
+    """
+    indexed = enumerate(items)
+    errors = 0
+    with tqdm(disable=not progress, file=sys.stderr, unit=unit) as bar:
+        if workers <= 1:
+            initializer(*initargs)
+            results: Iterable[Dict[str, Any]] = map(worker, indexed)
+            errors = _emit(results, bar)
+        else:
+            with Pool(workers, initializer=initializer, initargs=initargs) as pool:
+                mapper = pool.imap if ordered else pool.imap_unordered
+                errors = _emit(mapper(worker, indexed, chunksize=8), bar)
+    return errors
+
+
+def _emit(results: Iterable[Dict[str, Any]], bar: tqdm) -> int:
+    errors = 0
+    for result in results:
+        errors += "error" in result
+        click.echo(json.dumps(result, ensure_ascii=False))
+        bar.update(1)
+    return errors
+
+
+def _init_encoder(options: Dict[str, Any]) -> None:
+    _state["encode"] = options
+
+
+def _safe_name(value: Any) -> str:
+    """Nettoie un identifiant pour en faire un nom de fichier."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", str(value)).strip("._") or "item"
+
+
+def _encode_item(indexed: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+    from .encoder.matrix import EncodingMatrix
+
+    index, item = indexed
+    options = _state["encode"]
+    result: Dict[str, Any] = {"index": index}
+    if "id" in item:
+        result["id"] = item["id"]
+    try:
+        matrix = EncodingMatrix(
+            text=str(item["text"]),
+            error_correction=options["error_correction"],
+            compression=options["compress"],
+        )
+        filename = _safe_name(item["id"]) if "id" in item else f"{index:06d}"
+        render_options = {
+            "module_size": options["module_size"],
+            "margin": options["margin"],
+        }
+        if options["format"] == "png":
+            from .encoder.renderer import MatrixRenderer
+            path = MatrixRenderer(matrix, **render_options).render(filename, options["output_dir"])
+        else:
+            from .encoder.vector_renderer import VectorRenderer
+            path = VectorRenderer(matrix, **render_options).render(
+                filename, options["output_dir"], format=options["format"]
+            )
+        result.update(path=path, version=matrix.version.version_number, size=matrix.size)
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def _init_decoder() -> None:
+    from .decoder.image_detector import ImageDetector
+    from .decoder.matrix_decoder import MatrixDecoder
+
+    _state["detector"] = ImageDetector()
+    _state["decoder"] = MatrixDecoder()
+    _state.pop("tiled", None)
+
+
+def _init_tiled_decoder(options: Dict[str, Any]) -> None:
+    from .decoder.tiled import TiledDecoder
+
+    _state["tiled"] = TiledDecoder(**options)
+
+
+def _decode_item(indexed: Tuple[int, Dict[str, Any]]) -> Dict[str, Any]:
+    index, item = indexed
+    result: Dict[str, Any] = {"index": index, "path": item["path"]}
+    if "id" in item:
+        result["id"] = item["id"]
+    try:
+        if "tiled" in _state:
+            result["symbols"] = [symbol._asdict() for symbol in _state["tiled"].decode_file(item["path"])]
+            return result
+        detected = _state["detector"].detect_with_confidence(item["path"])
+        if detected is None:
+            raise ValueError("Aucune matrice détectée dans l'image")
+        result["text"] = _state["decoder"].decode(*detected)
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+_batch_options = [
+    click.option("--workers", "-j", default=1, show_default=True, type=click.IntRange(min=1),
+                 help="Nombre de processus de travail"),
+    click.option("--ordered/--unordered", default=True, show_default=True,
+                 help="Conserver l'ordre d'entrée dans la sortie"),
+    click.option("--progress/--no-progress", default=None,
+                 help="Barre de progression sur stderr (par défaut : si stderr est un terminal)"),
+]
+
+
+def batch_options(func):
+    for option in reversed(_batch_options):
+        func = option(func)
+    return func
+
+
+@click.group()
+def cli() -> None:
+    """Encode et décode des symboles du protocole graphique."""
+
+
+@cli.command()
+@click.argument("text", required=False)
+@click.option("--jsonl", is_flag=True, help="Lire un objet JSON par ligne ({\"text\": ..., \"id\": ...})")
+@click.option("--output-dir", "-o", default="output", show_default=True, help="Dossier de sortie")
+@click.option("--format", "fmt", type=click.Choice(["png", "svg", "pdf"]), default="png", show_default=True)
+@click.option("--error-correction", "-e", type=click.Choice(["L", "M", "Q", "H"]), default="M", show_default=True)
+@click.option("--compress", is_flag=True, help="Compresser les charges utiles (deflate)")
+@click.option("--module-size", default=10, show_default=True, type=click.IntRange(min=1))
+@click.option("--margin", default=4, show_default=True, type=click.IntRange(min=0))
+@batch_options
+def encode(text: Optional[str], jsonl: bool, output_dir: str, fmt: str, error_correction: str,
+           compress: bool, module_size: int, margin: int, workers: int, ordered: bool,
+           progress: Optional[bool]) -> None:
+    """Encode TEXT, ou chaque ligne de l'entrée standard, en symbole."""
+    items = [{"text": text}] if text is not None else _read_items(sys.stdin, jsonl, "text")
+    options = {
+        "output_dir": output_dir,
+        "format": fmt,
+        "error_correction": error_correction,
+        "compress": compress,
+        "module_size": module_size,
+        "margin": margin,
+    }
+    progress = sys.stderr.isatty() if progress is None else progress
+    errors = _run_batch(_encode_item, _init_encoder, (options,), items, workers, ordered, progress, "code")
+    if errors:
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("inputs", nargs=-1)
+@click.option("--jsonl", is_flag=True, help="Lire un objet JSON par ligne ({\"path\": ..., \"id\": ...})")
+@click.option("--tiled", is_flag=True,
+              help="Grands scans : décodage par tuiles, tous les symboles avec leur position")
+@click.option("--tile-size", default=2048, show_default=True, type=click.IntRange(min=64))
+@click.option("--tile-overlap", default=512, show_default=True, type=click.IntRange(min=0))
+@click.option("--threads", default=4, show_default=True, type=click.IntRange(min=1),
+              help="Threads par image en mode --tiled")
+@batch_options
+def decode(inputs: Tuple[str, ...], jsonl: bool, tiled: bool, tile_size: int, tile_overlap: int,
+           threads: int, workers: int, ordered: bool, progress: Optional[bool]) -> None:
+    """Décode les images INPUTS (fichiers, dossiers, motifs glob) ou les chemins lus sur l'entrée standard."""
+    if inputs:
+        items: Iterable[Dict[str, Any]] = ({"path": path} for path in _expand_inputs(inputs))
+    else:
+        items = _read_items(sys.stdin, jsonl, "path")
+    progress = sys.stderr.isatty() if progress is None else progress
+    if tiled:
+        if tile_overlap >= tile_size:
+            raise click.BadParameter("doit être inférieur à --tile-size", param_hint="--tile-overlap")
+        options = {"tile_size": tile_size, "overlap": tile_overlap, "workers": threads}
+        initializer, initargs = _init_tiled_decoder, (options,)
+    else:
+        initializer, initargs = _init_decoder, ()
+    errors = _run_batch(_decode_item, initializer, initargs, items, workers, ordered, progress, "image")
+    if errors:
+        sys.exit(1)
+
+
+def main() -> None:
+    cli()
+
+
+if __name__ == "__main__":
+    main()
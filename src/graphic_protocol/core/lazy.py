@@ -0,0 +1,35 @@
+import importlib
+import types
+
+
+class _LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+
+    def _load(self) -> types.ModuleType:
+        module = importlib.import_module(self.__name__)
+        # Copy the real namespace so later lookups bypass __getattr__ entirely
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr: str) -> object:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Returns a proxy for module `name` that is only imported when first used.
+
+    Heavy dependencies (numpy, PIL, cv2) are bound this way so that importing the
+    encoder never pays for them; modules using the proxy in annotations must
+    enable `from __future__ import annotations`.
+    """
+    return _LazyModule(name)
@@ -0,0 +1,394 @@
+from typing import TYPE_CHECKING, TypeVar, Protocol, runtime_checkable, Generic, Iterator, Sequence, MutableSequence, overload
+from collections.abc import Sized, Iterable
+from typing_extensions import Self
+
+if TYPE_CHECKING:
+    import numpy as np
+
+T = TypeVar('T')
+T_co = TypeVar('T_co', covariant=True)
+
+@runtime_checkable
+class Matrix(Protocol[T_co], Sized, Iterable[Sequence[T_co]]):
+    """Protocol defining the basic interface for a matrix."""
+    
+    @property
+    def rows(self) -> int:
+        """Returns the number of rows in the matrix."""
+        ...
+    
+    @property
+    def cols(self) -> int:
+        """Returns the number of columns in the matrix."""
+        ...
+    
+    def __getitem__(self, key: tuple[int, int]) -> T_co:
+        """Gets the element at the specified position."""
+        ...
+    
+    def __iter__(self) -> Iterator[Sequence[T_co]]:
+        """Returns an iterator over the rows of the matrix."""
+        ...
+    
+    def __len__(self) -> int:
+        """Returns the number of rows in the matrix."""
+        ...
+
+@runtime_checkable
+class MutableMatrix(Matrix[T], Protocol[T]):
+    """Protocol defining a mutable matrix interface."""
+    
+    def __setitem__(self, key: tuple[int, int], value: T) -> None:
+        """Sets the element at the specified position."""
+        ...
+    
+    def clear(self) -> None:
+        """Clears all elements in the matrix."""
+        ...
+    
+    def resize(self, rows: int, cols: int, fill_value: T | None = None) -> None:
+        """Resizes the matrix to the specified dimensions."""
+        ...
+
+class ListMatrix(Generic[T]):
+    """Concrete implementation of a mutable matrix using nested lists."""
+    
+    def __init__(self, rows: int, cols: int, fill_value: T | None = None) -> None:
+        self._data: list[list[T | None]] = [[fill_value for _ in range(cols)] for _ in range(rows)]
+        self._rows = rows
+        self._cols = cols
+    
+    @classmethod
+    def from_nested_lists(cls, data: list[list[T]]) -> Self:
+        """Creates a matrix from a nested list structure."""
+        if not data or not data[0]:
+            raise ValueError("Data must be non-empty")
+        
+        rows = len(data)
+        cols = len(data[0])
+        
+        if not all(len(row) == cols for row in data):
+            raise ValueError("All rows must have the same length")
+        
+        matrix = cls(rows, cols)
+        matrix._data = [[x for x in row] for row in data]  # Cast each element explicitly
+        return matrix
+    
+    @property
+    def rows(self) -> int:
+        return self._rows
+    
+    @property
+    def cols(self) -> int:
+        return self._cols
+    
+    def __getitem__(self, key: tuple[int, int]) -> T | None:
+        row, col = key
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise IndexError("Matrix index out of range")
+        return self._data[row][col]
+    
+    def __setitem__(self, key: tuple[int, int], value: T) -> None:
+        row, col = key
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise IndexError("Matrix index out of range")
+        self._data[row][col] = value
+    
+    def __iter__(self) -> Iterator[list[T | None]]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return self._rows
+    
+    def clear(self) -> None:
+        for row in range(self._rows):
+            for col in range(self._cols):
+                self._data[row][col] = None
+    
+    def resize(self, rows: int, cols: int, fill_value: T | None = None) -> None:
+        if rows < 0 or cols < 0:
+            raise ValueError("Dimensions must be non-negative")
+        
+        # Create new data structure
+        new_data = [[fill_value for _ in range(cols)] for _ in range(rows)]
+        
+        # Copy existing data
+        for i in range(min(self._rows, rows)):
+            for j in range(min(self._cols, cols)):
+                new_data[i][j] = self._data[i][j]
+        
+        self._data = new_data
+        self._rows = rows
+        self._cols = cols
+    
+    def __str__(self) -> str:
+        return "\n".join(" ".join(str(cell) for cell in row) for row in self._data)
+    
+    def __repr__(self) -> str:
+        return f"ListMatrix(rows={self._rows}, cols={self._cols})"
+
+
+class BitRow(Sequence[bool]):
+    """Zero-copy view over one row of a `BitMatrix`."""
+
+    def __init__(self, buffer: memoryview, cols: int) -> None:
+        self._buffer = buffer
+        self._cols = cols
+
+    def __len__(self) -> int:
+        return self._cols
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[bool]: ...
+
+    def __getitem__(self, index: int | slice) -> bool | list[bool]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._cols))]
+        if index < 0:
+            index += self._cols
+        if not 0 <= index < self._cols:
+            raise IndexError("Row index out of range")
+        return bool(self._buffer[index >> 3] & (0x80 >> (index & 7)))
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        if index < 0:
+            index += self._cols
+        if not 0 <= index < self._cols:
+            raise IndexError("Row index out of range")
+        if value:
+            self._buffer[index >> 3] |= 0x80 >> (index & 7)
+        else:
+            self._buffer[index >> 3] &= ~(0x80 >> (index & 7)) & 0xFF
+
+    def __iter__(self) -> Iterator[bool]:
+        for byte_index in range((self._cols + 7) >> 3):
+            byte = self._buffer[byte_index]
+            for bit in range(min(8, self._cols - (byte_index << 3))):
+                yield bool(byte & (0x80 >> bit))
+
+    def __repr__(self) -> str:
+        return "BitRow(" + "".join("1" if bit else "0" for bit in self) + ")"
+
+
+class BitMatrix:
+    """
+    Mutable boolean matrix backed by a packed bit buffer (1 bit per cell).
+
+    Rows are stored MSB-first and padded to whole bytes, which matches the layout of
+    `numpy.packbits(..., axis=1)`. Padding bits are always kept at zero so equality,
+    hashing and popcount can work on the raw buffer. A 177x177 matrix takes 4 KB,
+    against several hundred KB of pointers for `ListMatrix`.
+    """
+
+    def __init__(self, rows: int, cols: int, fill_value: bool | None = None) -> None:
+        if rows < 0 or cols < 0:
+            raise ValueError("Dimensions must be non-negative")
+        self._rows = rows
+        self._cols = cols
+        self._stride = (cols + 7) >> 3
+        self._buffer = bytearray(rows * self._stride)
+        if fill_value:
+            self.fill_region(0, 0, rows, cols, True)
+
+    @classmethod
+    def from_nested_lists(cls, data: list[list[bool | None]]) -> Self:
+        """Creates a matrix from a nested list structure (None is stored as False)."""
+        if not data or not data[0]:
+            raise ValueError("Data must be non-empty")
+
+        rows = len(data)
+        cols = len(data[0])
+
+        if not all(len(row) == cols for row in data):
+            raise ValueError("All rows must have the same length")
+
+        matrix = cls(rows, cols)
+        for i, row in enumerate(data):
+            value = 0
+            for cell in row:
+                value = (value << 1) | (1 if cell else 0)
+            matrix._write_row_int(i, value << (matrix._stride * 8 - cols))
+        return matrix
+
+    @classmethod
+    def from_numpy(cls, array: "np.ndarray") -> Self:
+        """Creates a matrix from a 2D array, any non-zero value being True."""
+        import numpy as np
+
+        if array.ndim != 2:
+            raise ValueError("Array must be two-dimensional")
+        matrix = cls(*array.shape)
+        matrix._buffer[:] = np.packbits(array.astype(bool), axis=1).tobytes()
+        return matrix
+
+    @property
+    def rows(self) -> int:
+        return self._rows
+
+    @property
+    def cols(self) -> int:
+        return self._cols
+
+    @property
+    def stride(self) -> int:
+        """Returns the number of bytes used by each row."""
+        return self._stride
+
+    @property
+    def nbytes(self) -> int:
+        """Returns the size of the packed buffer in bytes."""
+        return len(self._buffer)
+
+    def _check_index(self, row: int, col: int) -> None:
+        if not (0 <= row < self._rows and 0 <= col < self._cols):
+            raise IndexError("Matrix index out of range")
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        row, col = key
+        self._check_index(row, col)
+        return bool(self._buffer[row * self._stride + (col >> 3)] & (0x80 >> (col & 7)))
+
+    def __setitem__(self, key: tuple[int, int], value: bool) -> None:
+        row, col = key
+        self._check_index(row, col)
+        index = row * self._stride + (col >> 3)
+        if value:
+            self._buffer[index] |= 0x80 >> (col & 7)
+        else:
+            self._buffer[index] &= ~(0x80 >> (col & 7)) & 0xFF
+
+    def row(self, index: int) -> BitRow:
+        """Returns a zero-copy view over a row; writes through the view update the matrix."""
+        if not 0 <= index < self._rows:
+            raise IndexError("Matrix index out of range")
+        start = index * self._stride
+        return BitRow(memoryview(self._buffer)[start:start + self._stride], self._cols)
+
+    def __iter__(self) -> Iterator[BitRow]:
+        return (self.row(i) for i in range(self._rows))
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def _read_row_int(self, row: int) -> int:
+        start = row * self._stride
+        return int.from_bytes(self._buffer[start:start + self._stride], "big")
+
+    def _write_row_int(self, row: int, value: int) -> None:
+        start = row * self._stride
+        self._buffer[start:start + self._stride] = value.to_bytes(self._stride, "big")
+
+    def _span_mask(self, col: int, width: int) -> int:
+        """Returns the integer mask selecting columns [col, col + width) of a row."""
+        return ((1 << width) - 1) << (self._stride * 8 - col - width)
+
+    def _check_region(self, row: int, col: int, height: int, width: int) -> None:
+        if height < 0 or width < 0:
+            raise ValueError("Region dimensions must be non-negative")
+        if row < 0 or col < 0 or row + height > self._rows or col + width > self._cols:
+            raise IndexError("Region out of range")
+
+    def fill_region(self, row: int, col: int, height: int, width: int, value: bool) -> None:
+        """Sets every cell of the rectangular region to `value`."""
+        self._check_region(row, col, height, width)
+        if height == 0 or width == 0:
+            return
+        mask = self._span_mask(col, width)
+        for i in range(row, row + height):
+            current = self._read_row_int(i)
+            self._write_row_int(i, current | mask if value else current & ~mask)
+
+    def copy_region(self, source: "BitMatrix", src_row: int, src_col: int,
+                    height: int, width: int, dst_row: int = 0, dst_col: int = 0) -> None:
+        """Copies a rectangular region of `source` into this matrix."""
+        source._check_region(src_row, src_col, height, width)
+        self._check_region(dst_row, dst_col, height, width)
+        if height == 0 or width == 0:
+            return
+        src_shift = source._stride * 8 - src_col - width
+        dst_shift = self._stride * 8 - dst_col - width
+        bits = (1 << width) - 1
+        mask = bits << dst_shift
+        # Reading the whole source block first keeps overlapping self-copies correct
+        block = [(source._read_row_int(src_row + i) >> src_shift) & bits for i in range(height)]
+        for i, value in enumerate(block):
+            current = self._read_row_int(dst_row + i)
+            self._write_row_int(dst_row + i, (current & ~mask) | (value << dst_shift))
+
+    def _check_shape(self, other: "BitMatrix") -> None:
+        if not isinstance(other, BitMatrix):
+            raise TypeError("Operand must be a BitMatrix")
+        if other._rows != self._rows or other._cols != self._cols:
+            raise ValueError("Matrices must have the same dimensions")
+
+    def __ixor__(self, other: "BitMatrix") -> Self:
+        """XORs `other` into this matrix in place (e.g. to apply a mask)."""
+        self._check_shape(other)
+        value = int.from_bytes(self._buffer, "big") ^ int.from_bytes(other._buffer, "big")
+        self._buffer[:] = value.to_bytes(len(self._buffer), "big")
+        return self
+
+    def __xor__(self, other: "BitMatrix") -> "BitMatrix":
+        result = self.copy()
+        result ^= other
+        return result
+
+    def popcount(self) -> int:
+        """Returns the number of True cells."""
+        return int.from_bytes(self._buffer, "big").bit_count()
+
+    def copy(self) -> "BitMatrix":
+        matrix = BitMatrix(0, 0)
+        matrix._rows = self._rows
+        matrix._cols = self._cols
+        matrix._stride = self._stride
+        matrix._buffer = bytearray(self._buffer)
+        return matrix
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitMatrix):
+            return NotImplemented
+        return self._rows == other._rows and self._cols == other._cols and self._buffer == other._buffer
+
+    def __hash__(self) -> int:
+        # Hash of the current content: do not mutate a matrix used as a dict key
+        return hash((self._rows, self._cols, bytes(self._buffer)))
+
+    def to_numpy(self, packed: bool = True) -> "np.ndarray":
+        """
+        Exports the matrix to NumPy.
+
+        With `packed=True` (default) the result is a zero-copy, writable uint8 view of
+        shape (rows, stride) over the internal buffer. With `packed=False` a boolean
+        (rows, cols) copy is returned.
+        """
+        import numpy as np
+
+        array = np.frombuffer(self._buffer, dtype=np.uint8).reshape(self._rows, self._stride)
+        if packed:
+            return array
+        return np.unpackbits(array, axis=1, count=self._cols).astype(bool)
+
+    def clear(self) -> None:
+        self._buffer[:] = bytes(len(self._buffer))
+
+    def resize(self, rows: int, cols: int, fill_value: bool | None = None) -> None:
+        if rows < 0 or cols < 0:
+            raise ValueError("Dimensions must be non-negative")
+
+        resized = BitMatrix(rows, cols, fill_value)
+        resized.copy_region(self, 0, 0, min(self._rows, rows), min(self._cols, cols))
+
+        self._buffer = resized._buffer
+        self._rows = rows
+        self._cols = cols
+        self._stride = resized._stride
+
+    def __str__(self) -> str:
+        return "\n".join(" ".join("1" if bit else "0" for bit in row) for row in self)
+
+    def __repr__(self) -> str:
+        return f"BitMatrix(rows={self._rows}, cols={self._cols})"
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from typing import Iterator, List, Optional, Tuple
+from ..core.lazy import lazy_import
+from ..encoder.color_matrix import (
+    PALETTES, COLOR_LENGTH_BITS_COUNT, calibration_cells, color_block_layout, data_positions
+)
+from ..encoder.compression import DEFAULT_PRESET_DICTIONARY
+from ..encoder.error_correction import BlockLayout
+from .image_detector import CENTER_RATIO, Geometry, ImageDetector
+from .matrix_decoder import ERROR_CORRECTION_LEVELS, MatrixDecoder
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+# Point blanc D65 utilisé pour la conversion XYZ -> Lab
+_WHITE_D65 = (0.95047, 1.0, 1.08883)
+
+_RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041),
+)
+
+
+def rgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convertit des couleurs sRGB (0-255) en CIE Lab, de façon vectorisée.
+
+    Args:
+        rgb: Tableau (..., 3) de couleurs sRGB
+
+    Returns:
+        numpy.ndarray: Tableau (..., 3) de couleurs Lab (float64)
+    """
+    srgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    linear = np.where(srgb > 0.04045, ((srgb + 0.055) / 1.055) ** 2.4, srgb / 12.92)
+    xyz = (linear @ np.asarray(_RGB_TO_XYZ).T) / np.asarray(_WHITE_D65)
+
+    delta = 6 / 29
+    f = np.where(xyz > delta ** 3, np.cbrt(xyz), xyz / (3 * delta ** 2) + 4 / 29)
+    lab = np.empty_like(f)
+    lab[..., 0] = 116 * f[..., 1] - 16
+    lab[..., 1] = 500 * (f[..., 0] - f[..., 1])
+    lab[..., 2] = 200 * (f[..., 1] - f[..., 2])
+    return lab
+
+
+class ColorMatrixDecoder(MatrixDecoder):
+    """
+    Décode une matrice multi-couleurs (2 ou 3 bits par module) en texte.
+
+    Chaque module échantillonné est classé par recherche vectorisée du centroïde le
+    plus proche dans l'espace Lab ; les centroïdes sont mesurés sur les cellules de
+    calibration du symbole. L'écart entre les deux centroïdes les plus proches donne
+    une confiance par module, utilisée comme celle d'ImageDetector pour déclarer
+    effacés les mots de code les moins sûrs.
+
+    Dans une image quelconque (scan, photo), les symboles sont localisés par
+    ImageDetector sur la luminance : les marqueurs de position utilisent les couleurs
+    claire et sombre de la palette et se binarisent comme ceux d'un symbole monochrome.
+    """
+
+    def __init__(self, bits_per_module: int = 2,
+                 preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY,
+                 error_correction: Optional[str] = None):
+        """
+        Initialise le décodeur multi-couleurs.
+
+        Args:
+            bits_per_module: Nombre de bits par module (2 ou 3)
+            preset_dictionary: Dictionnaire prédéfini des charges utiles compressées
+            error_correction: Niveau de correction des symboles ('L', 'M', 'Q', 'H'),
+                              ou None pour le retrouver (essai des quatre niveaux)
+        """
+        super().__init__(preset_dictionary, error_correction)
+        if bits_per_module not in PALETTES:
+            raise ValueError("bits_per_module doit valoir 2 ou 3")
+        self.bits_per_module = bits_per_module
+        self.palette_size = len(PALETTES[bits_per_module])
+        self.detector = ImageDetector()
+
+    def sample_modules(self, image: np.ndarray, module_size: int, margin: int) -> np.ndarray:
+        """
+        Échantillonne la couleur moyenne de la zone centrale de chaque module d'une
+        image alignée sur la grille (rendu numérique).
+
+        Args:
+            image: Image RGB (hauteur, largeur, 3)
+            module_size: Taille en pixels d'un module
+            margin: Marge en nombre de modules
+
+        Returns:
+            numpy.ndarray: Couleurs moyennes (taille, taille, 3)
+        """
+        size = image.shape[0] // module_size - 2 * margin
+        if size < 21:
+            raise ValueError("Matrice trop petite pour être un code valide")
+
+        start = margin * module_size
+        stop = start + size * module_size
+        region = image[start:stop, start:stop].reshape(size, module_size, size, module_size, 3)
+
+        # Zone centrale (moitié du module) pour éviter les bords flous
+        lo = module_size // 4
+        hi = max(module_size - lo, lo + 1)
+        return region[:, lo:hi, :, lo:hi].mean(axis=(1, 3))
+
+    def sample_geometry(self, image: np.ndarray, geometry: Geometry) -> Optional[np.ndarray]:
+        """
+        Échantillonne la couleur moyenne de la zone centrale de chaque module d'un
+        symbole localisé par ImageDetector (mêmes centres et même zone que son
+        échantillonnage en niveaux de gris).
+
+        Args:
+            image: Image RGB (hauteur, largeur, 3)
+            geometry: Géométrie du symbole (x0, y0, taille de module, taille)
+
+        Returns:
+            numpy.ndarray: Couleurs moyennes (taille, taille, 3), ou None si le symbole
+            déborde de l'image
+        """
+        x0, y0, module_size, size = geometry
+        radius = int(module_size * CENTER_RATIO)
+        offsets = np.arange(size) + 0.5
+        xs = np.floor(x0 + offsets * module_size).astype(np.intp)
+        ys = np.floor(y0 + offsets * module_size).astype(np.intp)
+        if xs[0] - radius < 0 or ys[0] - radius < 0 \
+                or xs[-1] + radius >= image.shape[1] or ys[-1] + radius >= image.shape[0]:
+            return None
+
+        window = np.arange(-radius, radius + 1)
+        rows = ys[:, None] + window
+        cols = xs[:, None] + window
+        return image[rows[:, :, None, None], cols[None, None, :, :]].mean(axis=(1, 3))
+
+    def locate_symbols(self, image: np.ndarray) -> Iterator[Tuple[Geometry, np.ndarray]]:
+        """
+        Localise les symboles multi-couleurs d'une image RGB et échantillonne leurs modules.
+
+        Args:
+            image: Image RGB (hauteur, largeur, 3)
+
+        Yields:
+            Tuple (géométrie (x0, y0, taille de module, taille), couleurs des modules)
+        """
+        image = np.ascontiguousarray(image)
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        for geometry, _, _ in self.detector.locate_symbols(gray):
+            modules = self.sample_geometry(image, geometry)
+            if modules is not None:
+                yield geometry, modules
+
+    def classify(self, modules: np.ndarray) -> np.ndarray:
+        """
+        Classe chaque module vers l'indice de palette le plus proche.
+
+        Args:
+            modules: Couleurs RGB des modules (taille, taille, 3)
+
+        Returns:
+            numpy.ndarray: Indices de couleur (taille, taille)
+        """
+        return self._distances(modules).argmin(axis=-1)
+
+    def _distances(self, modules: np.ndarray) -> np.ndarray:
+        """Distances Lab (au carré) de chaque module aux centroïdes de la palette."""
+        size = modules.shape[0]
+        lab = rgb_to_lab(modules)
+
+        # Centroïdes : moyenne des cellules de calibration de même indice
+        centroids = np.zeros((self.palette_size, 3))
+        counts = np.zeros(self.palette_size)
+        for row, col, index in calibration_cells(size, self.palette_size):
+            centroids[index] += lab[row, col]
+            counts[index] += 1
+        centroids /= counts[:, None]
+
+        return ((lab[:, :, None, :] - centroids[None, None, :, :]) ** 2).sum(axis=-1)
+
+    def decode(self, matrix: np.ndarray, confidence: Optional[np.ndarray] = None) -> str:
+        """
+        Décode une matrice de couleurs en texte.
+
+        Args:
+            matrix: Couleurs RGB des modules (taille, taille, 3)
+            confidence: Confiance (0-1) de chaque module (taille, taille), combinée à
+                        celle de la classification des couleurs
+
+        Returns:
+            str: Texte décodé
+
+        Raises:
+            ValueError: Si la matrice ne peut pas être décodée
+        """
+        size = matrix.shape[0]
+        if size < 21:
+            raise ValueError("Matrice trop petite pour être un code valide")
+
+        distances = self._distances(matrix)
+        indices = distances.argmin(axis=-1)
+        # Confiance : écart relatif entre les deux couleurs de palette les plus proches
+        nearest = np.sqrt(np.partition(distances, 1, axis=-1)[..., :2])
+        margin = (nearest[..., 1] - nearest[..., 0]) / np.maximum(nearest.sum(axis=-1), 1e-9)
+        if confidence is not None:
+            margin = np.minimum(margin, confidence)
+
+        codewords, codeword_confidence = self._extract_symbol_codewords(indices, margin)
+        for data in self._corrected_data(codewords, codeword_confidence, size):
+            try:
+                return self._decode_data(data, COLOR_LENGTH_BITS_COUNT)
+            except (ValueError, NotImplementedError, UnicodeDecodeError):
+                continue
+        raise ValueError("Trop d'erreurs pour décoder la matrice")
+
+    def decode_image(self, image: np.ndarray, module_size: Optional[int] = None,
+                     margin: Optional[int] = None) -> str:
+        """
+        Décode une image RGB.
+
+        Avec `module_size` et `margin` (rendu numérique exact), la grille des modules
+        est lue directement ; sans eux, les symboles sont localisés dans l'image
+        (scan, photo, image redimensionnée) et le premier qui se décode est retenu.
+
+        Args:
+            image: Image RGB (hauteur, largeur, 3)
+            module_size: Taille en pixels d'un module, si elle est connue
+            margin: Marge en nombre de modules, si elle est connue
+
+        Returns:
+            str: Texte décodé
+
+        Raises:
+            ValueError: Si aucun symbole n'est détecté ou ne peut être décodé
+        """
+        if module_size is not None and margin is not None:
+            return self.decode(self.sample_modules(image, module_size, margin))
+
+        error = ValueError("Aucun symbole multi-couleurs détecté dans l'image")
+        for _, modules in self.locate_symbols(image):
+            try:
+                return self.decode(modules)
+            except ValueError as e:
+                error = e
+        raise error
+
+    def _block_layouts(self, size: int) -> List[BlockLayout]:
+        """Découpages en blocs possibles d'une matrice multi-couleurs, un par niveau essayé."""
+        levels = (self.error_correction,) if self.error_correction else ERROR_CORRECTION_LEVELS
+        return [color_block_layout(size, self.bits_per_module, level) for level in levels]
+
+    def _extract_symbol_codewords(self, indices: np.ndarray,
+                                  confidence: np.ndarray) -> Tuple[bytes, np.ndarray]:
+        """
+        Lit les indices des cellules de données dans l'ordre de placement, les déplie
+        en bits (bit de poids fort en premier) et les regroupe en mots de code.
+        La confiance d'un mot de code est celle de son module le moins sûr.
+        """
+        positions = np.array(data_positions(indices.shape[0], self.palette_size))
+        values = indices[positions[:, 0], positions[:, 1]].astype(np.uint8)
+        shifts = np.arange(self.bits_per_module - 1, -1, -1, dtype=np.uint8)
+        bits = (values[:, None] >> shifts[None, :]) & 1
+        count = len(positions) * self.bits_per_module // 8
+        codewords = np.packbits(bits.ravel()[:count * 8]).tobytes()
+
+        bit_confidence = np.repeat(confidence[positions[:, 0], positions[:, 1]], self.bits_per_module)
+        return codewords, bit_confidence[:count * 8].reshape(count, 8).min(axis=1)
@@ -1,5 +1,5 @@
-from image_detector import ImageDetector
-from matrix_decoder import MatrixDecoder
+from .image_detector import ImageDetector
+from .matrix_decoder import MatrixDecoder
 
 def decode_from_image(image_path: str) -> str:
     """
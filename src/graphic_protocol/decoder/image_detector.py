@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple, Optional, List, Union
+from ..core.lazy import lazy_import
+
+# OpenCV et NumPy ne sont chargés qu'au premier décodage
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+# Taille (en modules) des marqueurs de position
+MARKER_SIZE = 7
+
+# Demi-côté de la zone centrale moyennée, en fraction de la taille d'un module
+CENTER_RATIO = 0.25
+
+# Fenêtre (en modules) du seuil local pour l'échantillonnage
+LOCAL_WINDOW = 7
+
+# Géométrie d'un symbole aligné sur les axes : (x0, y0, taille de module, taille en modules)
+Geometry = Tuple[float, float, float, int]
+
+# Nombre de tailles d'image dont les tampons sont conservés par détecteur
+MAX_FRAME_WORKSPACES = 4
+
+
+@lru_cache(maxsize=None)
+def _finder_pattern() -> np.ndarray:
+    """Motif 7x7 d'un marqueur de position (partagé, en lecture seule)."""
+    pattern = np.ones((MARKER_SIZE, MARKER_SIZE), dtype=np.uint8)
+    pattern[1:-1, 1:-1] = 0
+    pattern[2:-2, 2:-2] = 1
+    pattern.setflags(write=False)
+    return pattern
+
+
+class _FrameWorkspace:
+    """Tampons réutilisés pour toutes les images d'une même taille."""
+
+    def __init__(self, height: int, width: int):
+        self.gray = np.empty((height, width), dtype=np.uint8)
+        self.dark = np.empty((height, width), dtype=bool)
+        self.binary = np.empty((height, width), dtype=np.uint8)
+        self.labels = np.empty((height, width), dtype=np.int32)
+        self.integral = np.empty((height + 1, width + 1), dtype=np.int32)
+        # L'image intégrale n'est calculée qu'à la première extraction de chaque image
+        self.integral_ready = False
+
+
+class _GridWorkspace:
+    """Tampons d'échantillonnage réutilisés pour une taille de symbole (en modules)."""
+
+    def __init__(self, size: int):
+        shape = (size, size)
+        self.offsets = np.arange(size) + 0.5
+        self.index = np.empty(shape, dtype=np.intp)
+        self.corner = np.empty(shape, dtype=np.int32)
+        self.sums = np.empty(shape, dtype=np.int32)
+        self.means = np.empty(shape, dtype=np.float32)
+        self.local_min = np.empty(shape, dtype=np.float32)
+        self.local_max = np.empty(shape, dtype=np.float32)
+        self.half = np.empty(shape, dtype=np.float32)
+        self.threshold = np.empty(shape, dtype=np.float32)
+        self.use_global = np.empty(shape, dtype=bool)
+        self.matrix = np.empty(shape, dtype=np.uint8)
+        self.confidence = np.empty(shape, dtype=np.float32)
+        self.kernel = np.ones((LOCAL_WINDOW, LOCAL_WINDOW), dtype=np.uint8)
+
+
+class ImageDetector:
+    """
+    Classe responsable de la détection et de l'extraction de la matrice depuis une image.
+    Utilise OpenCV pour la détection des marqueurs de position et la transformation perspective.
+    
+    Chaque module est échantillonné en moyennant la zone centrale de ses pixels, puis
+    comparé à un seuil local : l'écart au seuil donne une confiance par module, que
+    MatrixDecoder utilise pour déclarer effacés les mots de code les moins sûrs.
+    
+    Les tampons de travail (niveaux de gris, binarisation, étiquettes, image
+    intégrale, grilles d'échantillonnage) sont alloués une fois par taille d'image et
+    de symbole puis réutilisés : en régime établi, une détection n'alloue presque
+    rien. En contrepartie, une instance n'est pas utilisable depuis plusieurs threads
+    à la fois ; chaque thread de travail garde sa propre instance pour toute sa durée
+    de vie. Les méthodes publiques retournent des copies de la matrice et de la
+    confiance (quelques centaines d'octets), jamais les tampons eux-mêmes.
+    """
+
+    def __init__(self, fast_path: bool = True):
+        """
+        Initialise le détecteur d'image.
+        
+        Args:
+            fast_path: Essaie d'abord la voie rapide pour les symboles nets, alignés
+                       sur les axes (rendus numériques de MatrixRenderer)
+        """
+        self.fast_path = fast_path
+        self._frames: OrderedDict[Tuple[int, int], _FrameWorkspace] = OrderedDict()
+        self._grids: Dict[int, _GridWorkspace] = {}
+
+    def detect_from_image(self, image_path: str) -> Optional[np.ndarray]:
+        """
+        Détecte et extrait la matrice depuis une image.
+        
+        Args:
+            image_path: Chemin vers l'image à analyser
+            
+        Returns:
+            numpy.ndarray: Matrice binaire extraite, ou None si aucune matrice n'est détectée
+        """
+        return self.detect_from_array(self._load_image(image_path))
+
+    def detect_from_array(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Détecte et extrait la matrice depuis une image déjà chargée en mémoire.
+        
+        Args:
+            image: Image BGR (hauteur, largeur, 3) ou niveaux de gris (hauteur, largeur)
+            
+        Returns:
+            numpy.ndarray: Matrice binaire extraite, ou None si aucune matrice n'est détectée
+        """
+        result = self.detect_with_confidence(image)
+        return None if result is None else result[0]
+
+    def detect_with_confidence(self, image: Union[str, np.ndarray]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Détecte la matrice et la confiance de chaque module.
+        
+        Args:
+            image: Chemin d'une image, ou image BGR / niveaux de gris déjà chargée
+            
+        Returns:
+            Tuple contenant:
+            - Matrice binaire extraite (1 = module actif)
+            - Confiance de chaque module, entre 0 (à la limite du seuil) et 1
+            ou None si aucune matrice n'est détectée
+        """
+        if isinstance(image, str):
+            image = self._load_image(image)
+        
+        # Convertir en niveaux de gris
+        gray = self._prepare(image)
+        
+        # Voie rapide : symbole net, non tourné, grille de modules exacte
+        if self.fast_path:
+            geometry = self._detect_axis_aligned(gray)
+            if geometry is not None:
+                matrix, confidence = self._sample_grid(gray, geometry)
+                if self._has_position_markers(matrix):
+                    return matrix.copy(), confidence.copy()
+        
+        # Binariser l'image (seuil global puis adaptatif) et trouver les marqueurs de position
+        for _, matrix, confidence in self._locate_symbols(gray, adaptive=True):
+            return matrix.copy(), confidence.copy()
+        return None
+
+    def locate_symbols(self, image: np.ndarray,
+                       adaptive: bool = True) -> Iterator[Tuple[Geometry, np.ndarray, np.ndarray]]:
+        """
+        Localise et échantillonne tous les symboles d'une image (planche d'étiquettes,
+        tuile d'un grand scan), sans voie rapide.
+        
+        Un symbole qui déborde de l'image ou dont les marqueurs échantillonnés ne sont
+        pas intacts est ignoré.
+        
+        Args:
+            image: Image BGR (hauteur, largeur, 3) ou niveaux de gris (hauteur, largeur)
+            adaptive: Essaie aussi le seuil adaptatif après le seuil global d'Otsu (un
+                      même symbole peut alors être produit deux fois)
+            
+        Yields:
+            Tuple (géométrie (x0, y0, taille de module, taille), matrice binaire, confiance)
+        """
+        for geometry, matrix, confidence in self._locate_symbols(self._prepare(image), adaptive):
+            yield geometry, matrix.copy(), confidence.copy()
+
+    def _locate_symbols(self, gray: np.ndarray,
+                        adaptive: bool) -> Iterator[Tuple[Geometry, np.ndarray, np.ndarray]]:
+        """Voir `locate_symbols` ; l'image est déjà en niveaux de gris."""
+        for binary in self._binarize(gray):
+            for geometry in self._group_markers(self._find_position_markers(binary)):
+                result = self._extract_matrix(gray, geometry)
+                if result is not None and self._has_position_markers(result[0]):
+                    yield (geometry, *result)
+            if not adaptive:
+                return
+
+    def _frame_workspace(self, shape: Tuple[int, ...]) -> _FrameWorkspace:
+        """Tampons de la taille d'image donnée (les moins récemment utilisés sont libérés)."""
+        key = (shape[0], shape[1])
+        workspace = self._frames.get(key)
+        if workspace is None:
+            workspace = self._frames[key] = _FrameWorkspace(*key)
+            if len(self._frames) > MAX_FRAME_WORKSPACES:
+                self._frames.popitem(last=False)
+        else:
+            self._frames.move_to_end(key)
+        return workspace
+
+    def _grid_workspace(self, size: int) -> _GridWorkspace:
+        """Tampons d'échantillonnage d'un symbole de `size` x `size` modules."""
+        workspace = self._grids.get(size)
+        if workspace is None:
+            workspace = self._grids[size] = _GridWorkspace(size)
+        return workspace
+
+    def _prepare(self, image: np.ndarray) -> np.ndarray:
+        """
+        Début d'analyse d'une image : conversion en niveaux de gris dans le tampon de
+        sa taille, et invalidation de l'image intégrale de l'image précédente.
+        """
+        workspace = self._frame_workspace(image.shape)
+        workspace.integral_ready = False
+        if image.ndim == 3:
+            return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=workspace.gray)
+        return image
+
+    def _load_image(self, image_path: str) -> np.ndarray:
+        """Charge une image, ou lève ValueError si elle est illisible."""
+        image = cv2.imread(image_path)
+        if image is None:
+            raise ValueError(f"Impossible de charger l'image: {image_path}")
+        return image
+
+    def _detect_axis_aligned(self, gray: np.ndarray) -> Optional[Geometry]:
+        """
+        Voie rapide pour les symboles rendus numériquement : vérifie la zone de silence
+        au bord de l'image et les longueurs de plages du marqueur haut-gauche, et en
+        déduit la taille des modules et la position du symbole.
+        
+        Args:
+            gray: Image en niveaux de gris
+            
+        Returns:
+            Géométrie du symbole, ou None si l'une des vérifications échoue
+        """
+        dark = np.less(gray, 128, out=self._frame_workspace(gray.shape).dark)
+        
+        # Zone de silence : le bord de l'image doit être entièrement clair
+        if dark[0].any() or dark[-1].any() or dark[:, 0].any() or dark[:, -1].any():
+            return None
+        
+        return self._locate_axis_aligned(dark)
+
+    def _locate_axis_aligned(self, dark: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Localise un symbole aligné sur les axes à partir de son marqueur haut-gauche.
+        
+        Args:
+            dark: Masque booléen des pixels sombres
+            
+        Returns:
+            Tuple (x0, y0, taille de module en pixels, taille du symbole en modules),
+            ou None si la géométrie n'est pas celle d'un symbole net
+        """
+        rows_with_dark = dark.any(axis=1)
+        if not rows_with_dark.any():
+            return None
+        y0 = int(np.argmax(rows_with_dark))
+        x0 = int(np.argmax(dark[y0]))
+        
+        # Sur la diagonale du marqueur, la première plage sombre mesure un module
+        diagonal = dark[y0:, x0:].diagonal()
+        module_size = int(np.argmin(diagonal))
+        if module_size == 0:
+            return None
+        
+        # Plages 1:1:3:1:1 sur la ligne centrale du marqueur
+        center_row = dark[y0 + (MARKER_SIZE * module_size) // 2, x0:]
+        runs = self._run_lengths(center_row, 5)
+        expected = [module_size, module_size, 3 * module_size, module_size]
+        if runs is None or runs[:4] != expected or runs[4] < module_size:
+            return None
+        
+        # Étendue : bord droit du marqueur haut-droit, bord bas du marqueur bas-gauche
+        x1 = len(dark[y0]) - 1 - int(np.argmax(dark[y0, ::-1]))
+        y1 = len(dark) - 1 - int(np.argmax(dark[::-1, x0]))
+        width, height = x1 - x0 + 1, y1 - y0 + 1
+        if width != height or width % module_size:
+            return None
+        size = width // module_size
+        if size < 21:
+            return None
+        return x0, y0, module_size, size
+
+    def _sample_grid(self, gray: np.ndarray, geometry: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Voie rapide : lit le pixel central de chaque module par découpage à pas constant,
+        sans image intégrale ni seuil local. La confiance est l'écart de ce pixel au
+        seuil fixe, rapporté à la demi-amplitude (1 pour un rendu net).
+        
+        Args:
+            gray: Image en niveaux de gris
+            geometry: Géométrie exacte trouvée par `_detect_axis_aligned`
+            
+        Returns:
+            Tuple (matrice binaire, confiance), tous deux dans les tampons de la grille
+        """
+        x0, y0, module_size, size = geometry
+        workspace = self._grid_workspace(size)
+        half = module_size // 2
+        centers = gray[y0 + half:y0 + size * module_size:module_size, x0 + half:x0 + size * module_size:module_size]
+        matrix, confidence = workspace.matrix, workspace.confidence
+        np.less(centers, 128, out=matrix)
+        np.subtract(centers, 127.5, out=confidence)
+        np.abs(confidence, out=confidence)
+        np.multiply(confidence, 1 / 127.5, out=confidence)
+        return matrix, confidence
+
+    def _run_lengths(self, line: np.ndarray, count: int) -> Optional[List[int]]:
+        """
+        Longueurs des `count` premières plages alternées d'une ligne (commençant par
+        une plage sombre), ou None si la ligne en contient moins.
+        """
+        changes = np.flatnonzero(line[1:] != line[:-1]) + 1
+        bounds = np.concatenate(([0], changes, [len(line)]))
+        if len(bounds) - 1 < count or not line[0]:
+            return None
+        return np.diff(bounds[:count + 1]).tolist()
+
+    def _binarize(self, gray: np.ndarray):
+        """
+        Binarisations successives de l'image (1 = pixel sombre) : seuil global d'Otsu,
+        puis seuil adaptatif pour les éclairages inégaux.
+        """
+        workspace = self._frame_workspace(gray.shape)
+        _, binary = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU, dst=workspace.binary)
+        yield binary
+        block_size = max(31, min(gray.shape[:2]) // 8) | 1
+        yield cv2.adaptiveThreshold(
+            gray, 1, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY_INV, block_size, 5, dst=workspace.binary
+        )
+
+    def _find_position_markers(self, binary_image: np.ndarray) -> List[Tuple[float, float, float]]:
+        """
+        Trouve les marqueurs de position dans l'image binaire.
+        
+        Le carré central (3x3 modules) d'un marqueur est une composante connexe isolée,
+        pleine et carrée ; on vérifie ensuite l'anneau clair puis l'anneau sombre qui
+        l'entourent, horizontalement et verticalement.
+        
+        Args:
+            binary_image: Image binaire (1 = pixel sombre)
+            
+        Returns:
+            Liste de (centre x, centre y, taille de module) des marqueurs candidats
+        """
+        labels = self._frame_workspace(binary_image.shape).labels
+        _, _, stats, centroids = cv2.connectedComponentsWithStats(binary_image, labels=labels, connectivity=8)
+        width, height, area = (stats[1:, i] for i in (cv2.CC_STAT_WIDTH, cv2.CC_STAT_HEIGHT, cv2.CC_STAT_AREA))
+        square = (np.abs(width - height) <= np.maximum(1, width // 8)) & (area >= 0.85 * width * height) & (width >= 3)
+        
+        markers = []
+        image_height, image_width = binary_image.shape
+        for index in np.flatnonzero(square) + 1:
+            cx, cy = centroids[index]
+            module_size = (stats[index, cv2.CC_STAT_WIDTH] + stats[index, cv2.CC_STAT_HEIGHT]) / 6
+            # Profils à travers le centre : clair à ±2 modules, sombre à ±3 modules
+            offsets = np.array([-3, -2, 2, 3]) * module_size
+            xs = np.round(cx + offsets).astype(int)
+            ys = np.round(cy + offsets).astype(int)
+            if xs[0] < 0 or ys[0] < 0 or xs[-1] >= image_width or ys[-1] >= image_height:
+                continue
+            row = binary_image[int(round(cy)), xs]
+            col = binary_image[ys, int(round(cx))]
+            if row[0] and row[3] and col[0] and col[3] and not (row[1] or row[2] or col[1] or col[2]):
+                markers.append((float(cx), float(cy), float(module_size)))
+        return markers
+
+    def _group_markers(self, markers: List[Tuple[float, float, float]]) -> List[Geometry]:
+        """
+        Regroupe les marqueurs de position par trois en symboles : pour chaque marqueur
+        haut-gauche, le plus proche marqueur à droite sur la même ligne et le plus proche
+        en dessous sur la même colonne, à la même distance. Ne retenir que les plus
+        proches évite d'assembler les marqueurs de symboles voisins (planches d'étiquettes).
+        
+        Args:
+            markers: Marqueurs candidats (centre x, centre y, taille de module)
+            
+        Returns:
+            Liste des géométries de symboles possibles
+        """
+        symbols = []
+        for cx, cy, module_size in markers:
+            tolerance = module_size / 2
+            right = min(
+                (rx - cx for rx, ry, rm in markers
+                 if rx > cx and abs(ry - cy) < tolerance and abs(rm - module_size) < tolerance),
+                default=None,
+            )
+            below = min(
+                (by - cy for bx, by, bm in markers
+                 if by > cy and abs(bx - cx) < tolerance and abs(bm - module_size) < tolerance),
+                default=None,
+            )
+            if right is None or below is None or abs(right - below) >= module_size:
+                continue
+            distance = (right + below) / 2
+            # Tailles valides : 21 + 4k modules (le flou fausse l'estimation du module)
+            size = 21 + 4 * max(0, int(round((distance / module_size + MARKER_SIZE - 21) / 4)))
+            refined = distance / (size - MARKER_SIZE)
+            half = MARKER_SIZE / 2 * refined
+            symbols.append((cx - half, cy - half, refined, size))
+        return symbols
+
+    def _extract_matrix(self, gray: np.ndarray, geometry: Geometry) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Extrait la matrice et la confiance de chaque module.
+        
+        Args:
+            gray: Image en niveaux de gris
+            geometry: Géométrie du symbole
+            
+        Returns:
+            Tuple (matrice binaire, confiance), ou None si le symbole déborde de l'image
+        """
+        workspace = self._grid_workspace(geometry[3])
+        if not self._sample_modules(gray, geometry, workspace):
+            return None
+        return self._soft_threshold(workspace)
+
+    def _sample_modules(self, gray: np.ndarray, geometry: Geometry, workspace: _GridWorkspace) -> bool:
+        """
+        Intensité moyenne de la zone centrale de chaque module (dans `workspace.means`),
+        lue en quatre accès groupés à l'image intégrale de l'image.
+        
+        Returns:
+            bool: False si le symbole déborde de l'image
+        """
+        x0, y0, module_size, size = geometry
+        radius = int(module_size * CENTER_RATIO)
+        xs = np.floor(x0 + workspace.offsets * module_size).astype(np.intp)
+        ys = np.floor(y0 + workspace.offsets * module_size).astype(np.intp)
+        if xs[0] - radius < 0 or ys[0] - radius < 0 \
+                or xs[-1] + radius >= gray.shape[1] or ys[-1] + radius >= gray.shape[0]:
+            return False
+        
+        frame = self._frame_workspace(gray.shape)
+        if not frame.integral_ready:
+            cv2.integral(gray, sum=frame.integral, sdepth=cv2.CV_32S)
+            frame.integral_ready = True
+        flat = frame.integral.reshape(-1)
+        stride = frame.integral.shape[1]
+        
+        # Somme d'un rectangle : I(y2, x2) - I(y1, x2) - I(y2, x1) + I(y1, x1)
+        x1, x2 = xs - radius, xs + radius + 1
+        row1, row2 = (ys - radius) * stride, (ys + radius + 1) * stride
+        index, corner, sums = workspace.index, workspace.corner, workspace.sums
+        np.add.outer(row2, x2, out=index)
+        np.take(flat, index, out=sums, mode="clip")
+        for rows, cols, operation in ((row1, x2, np.subtract), (row2, x1, np.subtract), (row1, x1, np.add)):
+            np.add.outer(rows, cols, out=index)
+            np.take(flat, index, out=corner, mode="clip")
+            operation(sums, corner, out=sums)
+        np.multiply(sums, 1.0 / (2 * radius + 1) ** 2, out=workspace.means)
+        return True
+
+    def _soft_threshold(self, workspace: _GridWorkspace) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Seuille les moyennes des modules et mesure la confiance de chaque décision.
+        
+        Le seuil de chaque module est le milieu entre le minimum et le maximum des
+        modules voisins (fenêtre LOCAL_WINDOW x LOCAL_WINDOW), ce qui suit les gradients
+        d'éclairage ; une fenêtre sans contraste suffisant retombe sur le seuil global.
+        La confiance est l'écart au seuil rapporté à la demi-amplitude (0 à 1).
+        
+        Args:
+            workspace: Tampons de la grille, moyennes déjà calculées
+            
+        Returns:
+            Tuple (matrice binaire, confiance), tous deux dans les tampons de la grille
+        """
+        means, half, threshold = workspace.means, workspace.half, workspace.threshold
+        low, high = float(means.min()), float(means.max())
+        global_half = max((high - low) / 2, 1.0)
+        cv2.erode(means, workspace.kernel, dst=workspace.local_min, borderType=cv2.BORDER_REPLICATE)
+        cv2.dilate(means, workspace.kernel, dst=workspace.local_max, borderType=cv2.BORDER_REPLICATE)
+        np.subtract(workspace.local_max, workspace.local_min, out=half)
+        np.multiply(half, 0.5, out=half)
+        np.add(workspace.local_min, half, out=threshold)
+        
+        # Fenêtres sans contraste suffisant : seuil et demi-amplitude globaux
+        np.less(half, global_half / 2, out=workspace.use_global)
+        np.copyto(threshold, low + global_half, where=workspace.use_global)
+        np.copyto(half, global_half, where=workspace.use_global)
+        
+        matrix, confidence = workspace.matrix, workspace.confidence
+        np.less(means, threshold, out=matrix)
+        np.subtract(means, threshold, out=confidence)
+        np.abs(confidence, out=confidence)
+        np.divide(confidence, half, out=confidence)
+        np.clip(confidence, 0.0, 1.0, out=confidence)
+        return matrix, confidence
+
+    def _has_position_markers(self, matrix: np.ndarray) -> bool:
+        """Vérifie que les trois marqueurs de position de la matrice sont intacts."""
+        size = matrix.shape[0]
+        pattern = _finder_pattern()
+        corners = ((0, 0), (0, size - MARKER_SIZE), (size - MARKER_SIZE, 0))
+        return all(
+            np.array_equal(matrix[row:row + MARKER_SIZE, col:col + MARKER_SIZE], pattern)
+            for row, col in corners
+        )
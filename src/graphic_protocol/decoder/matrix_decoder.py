@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+from ..core.lazy import lazy_import
+from ..encoder.data_encoder import EncodingMode, Version
+from ..encoder.compression import DEFAULT_PRESET_DICTIONARY, decompress_payload
+from ..encoder.error_correction import BlockLayout, correct_errors, is_clean
+from ..encoder.matrix import data_positions
+
+np = lazy_import("numpy")
+
+# Niveaux essayés quand le niveau de correction du symbole est inconnu. Un mot de code
+# d'un bloc unique reste valide pour tout niveau plus faible : on essaie donc du plus
+# fort au plus faible, le premier niveau intact est le bon.
+ERROR_CORRECTION_LEVELS = ('H', 'Q', 'M', 'L')
+
+
+@lru_cache(maxsize=None)
+def _codeword_positions(size: int) -> np.ndarray:
+    """
+    Indices à plat (ligne * taille + colonne) des modules portant les mots de code,
+    dans l'ordre des bits. Partagé entre instances et threads : en lecture seule.
+    """
+    positions = np.array(data_positions(size)[:Version.codeword_count(size) * 8])
+    flat = positions[:, 0] * size + positions[:, 1]
+    flat.setflags(write=False)
+    return flat
+
+
+class _CodewordWorkspace:
+    """Tampons de lecture des mots de code, réutilisés pour une taille de matrice."""
+
+    def __init__(self, size: int):
+        self.positions = _codeword_positions(size)
+        count = len(self.positions)
+        self.bits = np.empty((count // 8, 8), dtype=np.uint8)
+        self.codewords = np.empty(count // 8, dtype=np.uint8)
+        self.bit_confidence = np.empty((count // 8, 8), dtype=np.float32)
+        self.confidence = np.empty(count // 8, dtype=np.float32)
+        self.weights = np.array([128, 64, 32, 16, 8, 4, 2, 1], dtype=np.uint8)
+
+
+class MatrixDecoder:
+    """
+    Décode une matrice binaire en texte selon le protocole graphique.
+    
+    Les tampons de lecture des mots de code sont alloués une fois par taille de
+    matrice puis réutilisés ; une instance n'est donc pas utilisable depuis plusieurs
+    threads à la fois (une instance par thread de travail). Les tables de placement,
+    de découpage en blocs et les codecs Reed-Solomon sont immuables et partagés.
+    """
+
+    def __init__(self, preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY,
+                 error_correction: Optional[str] = None):
+        """
+        Initialise le décodeur de matrice.
+        
+        Args:
+            preset_dictionary: Dictionnaire prédéfini utilisé par l'encodeur pour
+                               les charges utiles compressées (mode DEFLATE)
+            error_correction: Niveau de correction des symboles ('L', 'M', 'Q', 'H'),
+                              ou None pour le retrouver (essai des quatre niveaux)
+        """
+        self.preset_dictionary = preset_dictionary
+        self.error_correction = error_correction
+        self._workspaces: Dict[int, _CodewordWorkspace] = {}
+
+    def decode(self, matrix: np.ndarray, confidence: Optional[np.ndarray] = None) -> str:
+        """
+        Décode une matrice binaire en texte.
+        
+        Args:
+            matrix: Matrice binaire numpy (0 et 1)
+            confidence: Confiance (0-1) de chaque module, de même forme que la matrice
+                        (voir ImageDetector.detect_with_confidence). Les mots de code les
+                        moins sûrs sont alors traités comme des effacements.
+            
+        Returns:
+            str: Texte décodé
+            
+        Raises:
+            ValueError: Si la matrice ne peut pas être décodée
+        """
+        # Vérifier la taille de la matrice
+        size = matrix.shape[0]
+        if size < 21:  # Taille minimale pour version 1
+            raise ValueError("Matrice trop petite pour être un code valide")
+        version_number = Version.number_for_size(size)
+        if Version.CAPACITIES[version_number][0] != size:
+            raise ValueError(f"Taille de matrice inconnue: {size}")
+            
+        # Extraire les mots de code et leur confiance
+        codewords, codeword_confidence = self._extract_codewords(matrix, confidence)
+        
+        # Corriger puis décoder les bits en texte
+        length_bits_count = Version.length_bits_count_for(version_number)
+        for data in self._corrected_data(codewords, codeword_confidence, size):
+            try:
+                return self._decode_data(data, length_bits_count)
+            except (ValueError, NotImplementedError, UnicodeDecodeError):
+                continue
+        raise ValueError("Trop d'erreurs pour décoder la matrice")
+
+    def _extract_codewords(self, matrix: np.ndarray,
+                           confidence: Optional[np.ndarray]) -> Tuple[bytes, Optional[np.ndarray]]:
+        """
+        Lit les mots de code de la matrice en suivant le motif en zigzag.
+        
+        Args:
+            matrix: Matrice binaire numpy
+            confidence: Confiance par module, ou None
+            
+        Returns:
+            Tuple contenant:
+            - Mots de code lus
+            - Confiance de chaque mot de code (celle de son module le moins sûr), ou None
+        """
+        size = matrix.shape[0]
+        workspace = self._workspaces.get(size)
+        if workspace is None:
+            workspace = self._workspaces[size] = _CodewordWorkspace(size)
+        
+        modules = np.asarray(matrix)
+        if modules.dtype == bool:
+            modules = modules.view(np.uint8)
+        bits = workspace.bits
+        np.take(modules.reshape(-1), workspace.positions, out=bits.reshape(-1), mode="clip")
+        np.minimum(bits, 1, out=bits)
+        np.dot(bits, workspace.weights, out=workspace.codewords)
+        codewords = workspace.codewords.tobytes()
+        if confidence is None:
+            return codewords, None
+        
+        np.take(np.asarray(confidence).reshape(-1), workspace.positions,
+                out=workspace.bit_confidence.reshape(-1), mode="clip")
+        np.min(workspace.bit_confidence, axis=1, out=workspace.confidence)
+        return codewords, workspace.confidence
+
+    def _block_layouts(self, size: int) -> List[BlockLayout]:
+        """Découpages en blocs possibles d'une matrice : un par niveau de correction essayé."""
+        levels = (self.error_correction,) if self.error_correction else ERROR_CORRECTION_LEVELS
+        version_number = Version.number_for_size(size)
+        return [Version.block_layout_for(version_number, level) for level in levels]
+
+    def _corrected_data(self, codewords: bytes, confidence: Optional[np.ndarray],
+                        size: int) -> Iterator[bytes]:
+        """
+        Produit les mots de code de données corrigés pour chaque niveau de correction
+        plausible : d'abord ceux dont tous les blocs sont intacts, puis ceux que
+        Reed-Solomon parvient à corriger.
+        """
+        layouts = self._block_layouts(size)
+        damaged = []
+        for layout in layouts:
+            if is_clean(codewords, layout):
+                yield correct_errors(codewords, layout)
+            else:
+                damaged.append(layout)
+        for layout in damaged:
+            try:
+                yield correct_errors(codewords, layout, confidence)
+            except ValueError:
+                continue
+
+    def _decode_bits(self, bits: List[bool], length_bits_count: int = 8) -> str:
+        """
+        Décode une liste de bits en texte.
+        
+        Args:
+            bits: Liste de bits (booléens)
+            length_bits_count: Taille du champ longueur (8 bits pour version 1-9, 16 bits pour version 10+)
+            
+        Returns:
+            str: Texte décodé
+        """
+        data = np.packbits(np.asarray(bits, dtype=bool)).tobytes()
+        return self._decode_data(data, length_bits_count, len(bits))
+
+    def _decode_data(self, data: bytes, length_bits_count: int = 8,
+                     bit_count: Optional[int] = None) -> str:
+        """
+        Décode des mots de code de données en texte.
+        
+        L'en-tête (mode, longueur) et la charge utile sont lus directement dans un
+        entier construit à partir des octets : la charge utile n'est pas alignée sur
+        les octets (elle commence après 4 + length_bits_count bits).
+        
+        Args:
+            data: Mots de code de données (bits de poids fort en premier)
+            length_bits_count: Taille du champ longueur (8 bits pour version 1-9, 16 bits pour version 10+)
+            bit_count: Nombre de bits significatifs (par défaut, tous les bits de `data`)
+            
+        Returns:
+            str: Texte décodé
+        """
+        total = len(data) * 8
+        if bit_count is None:
+            bit_count = total
+        value = int.from_bytes(data, 'big')
+
+        def field(start: int, width: int) -> int:
+            return (value >> (total - start - width)) & ((1 << width) - 1)
+
+        # Extraire le mode d'encodage (4 premiers bits)
+        if bit_count < 4:
+            raise ValueError("Pas assez de bits pour décoder le mode")
+        mode = EncodingMode(field(0, 4))
+        
+        # Extraire la longueur des données
+        current_pos = 4
+        if bit_count < current_pos + length_bits_count:
+            raise ValueError("Pas assez de bits pour décoder la longueur")
+        data_length = field(current_pos, length_bits_count)
+        current_pos += length_bits_count
+        
+        if mode not in (EncodingMode.BYTE, EncodingMode.DEFLATE):
+            raise NotImplementedError(f"Mode d'encodage {mode} non supporté")
+        if bit_count < current_pos + data_length * 8:
+            raise ValueError("Pas assez de bits pour décoder les données")
+        payload = field(current_pos, data_length * 8).to_bytes(data_length, 'big')
+        
+        # Mode BYTE : un caractère par octet (Latin-1) ; DEFLATE : UTF-8 compressé
+        if mode == EncodingMode.BYTE:
+            return payload.decode('latin-1')
+        return decompress_payload(payload, self.preset_dictionary).decode('utf-8')
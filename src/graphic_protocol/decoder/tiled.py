@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+from ..core.lazy import lazy_import
+from ..encoder.compression import DEFAULT_PRESET_DICTIONARY
+from .image_detector import ImageDetector
+from .matrix_decoder import MatrixDecoder
+
+np = lazy_import("numpy")
+cv2 = lazy_import("cv2")
+
+# En-tête PNM binaire : magique, largeur, hauteur, valeur max (commentaires autorisés)
+_PNM_HEADER = re.compile(
+    rb"(P[56])(?:\s|#[^\n]*\n)+(\d+)(?:\s|#[^\n]*\n)+(\d+)(?:\s|#[^\n]*\n)+(\d+)\s"
+)
+
+# Écart minimal de contraste (niveaux de gris) pour qu'une tuile soit analysée
+_MIN_TILE_CONTRAST = 64
+
+
+class DecodedSymbol(NamedTuple):
+    """Symbole décodé et sa position dans la page (pixels, coin supérieur gauche)."""
+    text: str
+    x: float
+    y: float
+    width: float
+    height: float
+    module_size: float
+    size: int
+
+
+def open_scan(path: str) -> Tuple[np.ndarray, int]:
+    """
+    Ouvre un scan sans le charger en mémoire lorsque c'est possible.
+
+    Les fichiers NumPy `.npy` et PGM/PPM binaires (P5/P6) sont projetés en mémoire :
+    seules les pages du fichier effectivement lues par les tuiles sont chargées. Les
+    autres formats (compressés) sont décodés en entier par OpenCV, en niveaux de gris.
+
+    Args:
+        path: Chemin du scan
+
+    Returns:
+        Tuple contenant:
+        - Image (hauteur, largeur) ou (hauteur, largeur, 3) en ordre BGR, uint8 ou uint16
+        - Valeur du blanc : valeur maximale de l'en-tête PGM/PPM, sinon celle du type
+
+    Raises:
+        ValueError: Si le fichier ne peut pas être lu ou si son format n'est pas supporté
+    """
+    extension = os.path.splitext(path)[1].lower()
+    max_value = None
+    if extension == ".npy":
+        image = np.load(path, mmap_mode="r")
+    elif extension in (".pgm", ".ppm", ".pnm"):
+        image, max_value = _open_pnm(path)
+    else:
+        image = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            raise ValueError(f"Impossible de charger l'image: {path}")
+    _check_scan(image)
+    return image, max_value or _dtype_max(image.dtype)
+
+
+def _check_scan(image: np.ndarray) -> None:
+    """Vérifie la forme et le type des pixels d'un scan (entiers non signés 8 ou 16 bits)."""
+    if image.ndim not in (2, 3) or (image.ndim == 3 and image.shape[2] != 3):
+        raise ValueError(f"Format d'image non supporté: {image.shape}")
+    if image.dtype.kind != "u" or image.dtype.itemsize > 2:
+        raise ValueError(f"Type de pixels non supporté: {image.dtype} (uint8 ou uint16 attendu)")
+
+
+def _dtype_max(dtype: np.dtype) -> int:
+    """Valeur maximale d'un type d'entiers non signés."""
+    return (1 << (8 * dtype.itemsize)) - 1
+
+
+def _open_pnm(path: str) -> Tuple[np.ndarray, int]:
+    """Projette en mémoire un PGM (P5) ou PPM (P6) binaire ; retourne aussi sa valeur maximale."""
+    with open(path, "rb") as f:
+        head = f.read(1024)
+    match = _PNM_HEADER.match(head)
+    if match is None:
+        raise ValueError(f"En-tête PGM/PPM binaire invalide: {path}")
+    magic, width, height, maxval = match.group(1), *(int(value) for value in match.groups()[1:])
+    dtype = np.uint8 if maxval < 256 else np.dtype(">u2")
+    shape = (height, width) if magic == b"P5" else (height, width, 3)
+    image = np.memmap(path, dtype=dtype, mode="r", offset=match.end(), shape=shape)
+    # Le PPM est en RGB : vue inversée (sans copie) pour l'ordre BGR d'OpenCV
+    return (image if magic == b"P5" else image[:, :, ::-1]), maxval
+
+
+def tile_origins(length: int, tile_size: int, overlap: int) -> List[int]:
+    """
+    Positions de départ des tuiles le long d'un axe, la dernière collée au bord.
+
+    Args:
+        length: Longueur de l'axe (pixels)
+        tile_size: Taille des tuiles (pixels)
+        overlap: Recouvrement entre tuiles voisines (pixels)
+
+    Returns:
+        Liste des positions de départ
+    """
+    if length <= tile_size:
+        return [0]
+    step = tile_size - overlap
+    origins = list(range(0, length - tile_size + 1, step))
+    if origins[-1] + tile_size < length:
+        origins.append(length - tile_size)
+    return origins
+
+
+class TiledDecoder:
+    """
+    Décode tous les symboles d'un très grand scan (planche A3 à 600 DPI, par exemple)
+    sans jamais le charger entièrement.
+
+    Le scan est découpé en tuiles qui se recouvrent ; chaque tuile est copiée depuis
+    le fichier projeté en mémoire, binarisée puis analysée par un groupe de threads
+    (OpenCV libère le GIL). Le nombre de tuiles en cours est borné, ce qui borne la
+    mémoire résidente. Un symbole n'est décodé que dans une tuile qui le contient
+    entièrement : le recouvrement doit donc dépasser la taille du plus grand symbole.
+    Les symboles vus par plusieurs tuiles sont dédupliqués.
+
+    La localisation (celle d'ImageDetector) suppose des symboles alignés sur les axes
+    (scan à plat) ; les modules sont échantillonnés avec leur confiance, transmise
+    au décodeur pour la correction par effacements.
+    """
+
+    def __init__(self, tile_size: int = 2048, overlap: int = 512, workers: int = 4,
+                 max_pending: Optional[int] = None,
+                 preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY):
+        """
+        Args:
+            tile_size: Côté des tuiles (pixels)
+            overlap: Recouvrement entre tuiles voisines (pixels)
+            workers: Nombre de threads
+            max_pending: Nombre maximal de tuiles en mémoire (par défaut, 2 par thread)
+            preset_dictionary: Dictionnaire prédéfini des charges utiles compressées
+
+        Raises:
+            ValueError: Si le recouvrement n'est pas strictement inférieur à la taille des tuiles
+        """
+        if not 0 <= overlap < tile_size:
+            raise ValueError("Le recouvrement doit être compris entre 0 et la taille des tuiles")
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.workers = max(1, workers)
+        self.max_pending = max_pending or 2 * self.workers
+        self.preset_dictionary = preset_dictionary
+        self._local = threading.local()
+
+    def decode_file(self, path: str) -> List[DecodedSymbol]:
+        """
+        Décode tous les symboles d'un fichier de scan.
+
+        Args:
+            path: Chemin du scan (.npy et PGM/PPM binaires projetés en mémoire)
+
+        Returns:
+            Liste des symboles décodés, triés par position (haut en bas, gauche à droite)
+
+        Raises:
+            ValueError: Si le fichier ne peut pas être lu ou si son format n'est pas supporté
+        """
+        return self.decode_array(*open_scan(path))
+
+    def decode_array(self, page: np.ndarray, max_value: Optional[int] = None) -> List[DecodedSymbol]:
+        """
+        Décode tous les symboles d'une image (tableau en mémoire ou projeté).
+
+        Args:
+            page: Image (hauteur, largeur) ou (hauteur, largeur, 3) en ordre BGR,
+                  uint8 ou uint16
+            max_value: Valeur du blanc (par défaut, la valeur maximale du type) ; un scan
+                       12 bits enregistré sur 16 bits utilise par exemple 4095
+
+        Returns:
+            Liste des symboles décodés, triés par position (haut en bas, gauche à droite)
+
+        Raises:
+            ValueError: Si la forme ou le type des pixels n'est pas supporté
+        """
+        _check_scan(page)
+        max_value = max_value or _dtype_max(page.dtype)
+        height, width = page.shape[:2]
+        tiles = [
+            (x, y) for y in tile_origins(height, self.tile_size, self.overlap)
+            for x in tile_origins(width, self.tile_size, self.overlap)
+        ]
+
+        found: Dict[str, List[DecodedSymbol]] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for symbols in self._bounded_map(pool, page, max_value, tiles):
+                for symbol in symbols:
+                    self._add_unique(found, symbol)
+        return sorted((s for group in found.values() for s in group), key=lambda s: (s.y, s.x))
+
+    def _bounded_map(self, pool: ThreadPoolExecutor, page: np.ndarray,
+                     max_value: int, tiles: List[Tuple[int, int]]) -> Iterator[List[DecodedSymbol]]:
+        """Soumet les tuiles en gardant au plus `max_pending` tâches en vol."""
+        pending: deque = deque()
+        for x, y in tiles:
+            if len(pending) >= self.max_pending:
+                yield pending.popleft().result()
+            pending.append(pool.submit(self._decode_tile, page, max_value, x, y))
+        while pending:
+            yield pending.popleft().result()
+
+    @staticmethod
+    def _add_unique(found: Dict[str, List[DecodedSymbol]], symbol: DecodedSymbol) -> None:
+        """Ajoute un symbole sauf s'il a déjà été trouvé au même endroit par une autre tuile."""
+        same_text = found.setdefault(symbol.text, [])
+        for other in same_text:
+            if abs(other.x - symbol.x) < symbol.module_size * 2 and abs(other.y - symbol.y) < symbol.module_size * 2:
+                return
+        same_text.append(symbol)
+
+    def _thread_state(self) -> Tuple[ImageDetector, MatrixDecoder]:
+        """
+        Détecteur et décodeur propres au thread courant : leurs tampons de travail
+        ne sont pas partagés, chaque thread garde les siens pour toute sa durée de vie.
+        """
+        local = self._local
+        if not hasattr(local, "detector"):
+            local.detector = ImageDetector()
+            local.decoder = MatrixDecoder(self.preset_dictionary)
+            local.tiles = {}
+        return local.detector, local.decoder
+
+    def _read_tile(self, page: np.ndarray, x: int, y: int) -> np.ndarray:
+        """
+        Copie une tuile du scan dans le tampon de tuile du thread courant, en ordre
+        d'octets natif (les PGM/PPM 16 bits sont gros-boutistes).
+        """
+        region = page[y:y + self.tile_size, x:x + self.tile_size]
+        key = (region.shape[2:], region.dtype.newbyteorder("="))
+        buffer = self._local.tiles.get(key)
+        if buffer is None:
+            shape = (self.tile_size, self.tile_size) + region.shape[2:]
+            buffer = self._local.tiles[key] = np.empty(shape, dtype=key[1])
+        tile = buffer[:region.shape[0], :region.shape[1]]
+        np.copyto(tile, region)
+        return tile
+
+    def _decode_tile(self, page: np.ndarray, max_value: int, x: int, y: int) -> List[DecodedSymbol]:
+        """Copie, binarise et décode une tuile ; les positions sont ramenées à la page."""
+        detector, decoder = self._thread_state()
+        tile = self._read_tile(page, x, y)
+        if tile.dtype != np.uint8 or max_value != 255:
+            # Ramené sur 0-255 d'après la valeur du blanc (saturé au-delà)
+            tile = cv2.convertScaleAbs(tile, alpha=255.0 / max_value)
+        if int(tile.max()) - int(tile.min()) < _MIN_TILE_CONTRAST:
+            return []
+
+        # Seuil global d'Otsu seulement : les planches scannées sont éclairées uniformément.
+        # Un symbole qui déborde de la tuile est ignoré : une tuile voisine le contient entier.
+        symbols = []
+        for geometry, matrix, confidence in detector.locate_symbols(tile, adaptive=False):
+            try:
+                text = decoder.decode(matrix, confidence)
+            except (ValueError, NotImplementedError, UnicodeDecodeError):
+                continue
+            sx, sy, module_size, size = geometry
+            extent = size * module_size
+            symbols.append(DecodedSymbol(text, x + sx, y + sy, extent, extent, module_size, size))
+        return symbols
@@ -0,0 +1,263 @@
+import itertools
+import os
+from collections.abc import Sized
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..core.lazy import lazy_import
+from .pdf_writer import PdfWriter, HELVETICA_RESOURCES, rgb_operator, rectangles_operator, text_operator
+from .png_writer import write_png
+from .vector_renderer import merge_module_runs
+
+# Chargés au premier rendu matriciel seulement
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+ImageDraw = lazy_import("PIL.ImageDraw")
+ImageFont = lazy_import("PIL.ImageFont")
+
+# Format A4 portrait en millimètres
+A4 = (210.0, 297.0)
+
+_MM_PER_INCH = 25.4
+_POINTS_PER_MM = 72 / _MM_PER_INCH
+
+
+class SheetLayout:
+    """
+    Mise en page d'une planche d'étiquettes : grille de cellules carrées, marges de
+    page, gouttières et légendes optionnelles sous chaque symbole.
+    Toutes les longueurs sont en millimètres.
+    """
+
+    def __init__(self, page_size=A4, dpi=300, cell_size=25.0, gutter=3.0, page_margin=10.0,
+                 margin=4, captions=False, caption_height=4.0):
+        """
+        Args:
+            page_size (tuple): Largeur et hauteur de la page (mm)
+            dpi (int): Résolution du rendu matriciel
+            cell_size (float): Côté de la cellule réservée à chaque symbole (mm)
+            gutter (float): Espace entre deux cellules (mm)
+            page_margin (float): Marge autour de la grille (mm)
+            margin (int): Zone de silence autour de chaque symbole, en modules
+            captions (bool): Réserve une ligne de légende sous chaque symbole
+            caption_height (float): Hauteur de la ligne de légende (mm)
+
+        Raises:
+            ValueError: Si aucune cellule ne tient sur la page
+        """
+        self.page_size = page_size
+        self.dpi = dpi
+        self.cell_size = cell_size
+        self.gutter = gutter
+        self.page_margin = page_margin
+        self.margin = margin
+        self.captions = captions
+        self.caption_height = caption_height if captions else 0.0
+
+        width, height = page_size
+        self.columns = int((width - 2 * page_margin + gutter) // (cell_size + gutter))
+        self.rows = int((height - 2 * page_margin + gutter) // (cell_size + self.caption_height + gutter))
+        if self.columns < 1 or self.rows < 1:
+            raise ValueError("Aucune cellule ne tient sur la page avec cette mise en page")
+
+    @property
+    def per_page(self) -> int:
+        """Nombre de symboles par page."""
+        return self.columns * self.rows
+
+    def cell_origin(self, slot: int) -> Tuple[float, float]:
+        """
+        Coin supérieur gauche (mm) de la cellule `slot` (ordre de lecture).
+        """
+        row, col = divmod(slot, self.columns)
+        x = self.page_margin + col * (self.cell_size + self.gutter)
+        y = self.page_margin + row * (self.cell_size + self.caption_height + self.gutter)
+        return x, y
+
+    def to_pixels(self, length: float) -> int:
+        """Convertit une longueur en millimètres en pixels à la résolution de la planche."""
+        return int(round(length * self.dpi / _MM_PER_INCH))
+
+
+def _module_rows(matrix: Any) -> List[List[bool]]:
+    """Extrait les lignes de modules d'une matrice (EncodingMatrix, Matrix ou listes imbriquées)."""
+    rows = matrix.get_matrix() if hasattr(matrix, "get_matrix") else matrix
+    return [[cell == 1 for cell in row] for row in rows]
+
+
+class AtlasRenderer:
+    """
+    Compose des milliers de symboles sur des planches d'étiquettes.
+
+    Le rendu matriciel écrit chaque symbole directement dans un unique tampon de
+    page préalloué (aucune image par symbole) ; les pages sont produites au fur et
+    à mesure qu'elles se remplissent, la mémoire reste bornée à une page.
+    """
+
+    def __init__(self, layout: SheetLayout, color_background=(255, 255, 255), color_module=(0, 0, 0)):
+        """
+        Args:
+            layout (SheetLayout): Mise en page de la planche
+            color_background (tuple): Couleur RGB de l'arrière-plan
+            color_module (tuple): Couleur RGB des modules actifs et des légendes
+        """
+        self.layout = layout
+        self.color_background = color_background
+        self.color_module = color_module
+
+    def _pages(self, matrices: Iterable[Any], captions: Optional[Iterable[str]]) -> Iterator[List[Tuple[int, Any, str]]]:
+        """
+        Regroupe les symboles par page : listes de (emplacement, matrice, légende).
+
+        Raises:
+            ValueError: Si les légendes fournies ne sont pas aussi nombreuses que les
+                        matrices. Lorsque les deux ont une longueur, l'erreur est levée
+                        dès l'appel, avant toute page ; sinon, à l'épuisement du plus court.
+        """
+        if captions is None:
+            items = zip(matrices, (str(index) for index in itertools.count()))
+        else:
+            if isinstance(matrices, Sized) and isinstance(captions, Sized) and len(matrices) != len(captions):
+                raise ValueError(f"{len(captions)} légendes pour {len(matrices)} symboles")
+            items = zip(matrices, captions, strict=True)
+        per_page = self.layout.per_page
+        return iter(lambda: [(slot, matrix, caption) for slot, (matrix, caption)
+                             in enumerate(itertools.islice(items, per_page))], [])
+
+    def iter_pages(self, matrices: Iterable[Any], captions: Optional[Iterable[str]] = None):
+        """
+        Produit les pages matricielles au fur et à mesure.
+
+        Le même tampon (indices : 0 arrière-plan, 1 module) est réutilisé pour chaque
+        page : il doit être consommé (écrit, copié) avant de demander la suivante.
+
+        Args:
+            matrices: Matrices à placer (itérable, éventuellement un générateur)
+            captions: Légendes, dans le même ordre (par défaut, l'indice du symbole)
+
+        Yields:
+            numpy.ndarray: Tampon uint8 (hauteur, largeur) de la page
+
+        Raises:
+            ValueError: Si les légendes ne sont pas aussi nombreuses que les matrices
+        """
+        layout = self.layout
+        width, height = (layout.to_pixels(length) for length in layout.page_size)
+        page = np.zeros((height, width), dtype=np.uint8)
+        cell = layout.to_pixels(layout.cell_size)
+        caption_height = layout.to_pixels(layout.caption_height)
+
+        caption_image = caption_draw = font = None
+        if layout.captions and caption_height > 0:
+            caption_image = Image.new("1", (cell, caption_height), 0)
+            caption_draw = ImageDraw.Draw(caption_image)
+            try:
+                font = ImageFont.load_default(size=max(int(caption_height * 0.8), 6))
+            except TypeError:
+                # Pillow < 10.1 : police bitmap de taille fixe
+                font = ImageFont.load_default()
+
+        for entries in self._pages(matrices, captions):
+            page.fill(0)
+            for slot, matrix, caption in entries:
+                x_mm, y_mm = layout.cell_origin(slot)
+                x, y = layout.to_pixels(x_mm), layout.to_pixels(y_mm)
+                self._blit_symbol(page, x, y, cell, _module_rows(matrix))
+                if caption_draw is not None:
+                    caption_draw.rectangle((0, 0, cell, caption_height), fill=0)
+                    caption_draw.text((cell / 2, caption_height / 2), caption, fill=1, font=font, anchor="mm")
+                    region = page[y + cell:y + cell + caption_height, x:x + cell]
+                    np.bitwise_or(region, np.asarray(caption_image, dtype=np.uint8), out=region)
+            yield page
+
+    def _blit_symbol(self, page, x: int, y: int, cell: int, modules: Sequence[Sequence[bool]]) -> None:
+        """Écrit un symbole, centré dans sa cellule, directement dans le tampon de page."""
+        size = len(modules)
+        module_size = cell // (size + 2 * self.layout.margin)
+        if module_size < 1:
+            raise ValueError(f"Cellule trop petite pour un symbole de {size}x{size} modules")
+
+        offset = (cell - size * module_size) // 2
+        span = size * module_size
+        block = page[y + offset:y + offset + span, x + offset:x + offset + span]
+        # Chaque axe est seulement découpé : reshape donne toujours une vue du tampon
+        view = block.reshape(size, module_size, size, module_size)
+        assert np.shares_memory(view, page)
+        view[...] = np.asarray(modules, dtype=np.uint8)[:, None, :, None]
+
+    def render_png_pages(self, matrices: Iterable[Any], output_dir: str = "output",
+                         filename: str = "sheet", captions: Optional[Iterable[str]] = None,
+                         compress_level: int = 6) -> Iterator[str]:
+        """
+        Écrit chaque page en PNG 1 bit dès qu'elle est remplie.
+
+        Args:
+            matrices: Matrices à placer
+            output_dir: Dossier de sortie
+            filename: Préfixe des fichiers (suivi du numéro de page)
+            captions: Légendes, dans le même ordre
+            compress_level: Niveau de compression zlib (0-9)
+
+        Yields:
+            str: Chemin de chaque page écrite
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        palette = (self.color_background, self.color_module)
+        for number, page in enumerate(self.iter_pages(matrices, captions), start=1):
+            file_path = os.path.join(output_dir, f"{filename}_{number:03d}.png")
+            with open(file_path, "wb") as f:
+                write_png(f, page, palette=palette, compress_level=compress_level)
+            yield file_path
+
+    def write_pdf(self, matrices: Iterable[Any], stream: BinaryIO,
+                  captions: Optional[Iterable[str]] = None) -> int:
+        """
+        Écrit les planches en PDF vectoriel, page par page, dans un flux.
+
+        Args:
+            matrices: Matrices à placer
+            stream: Flux binaire accessible en écriture
+            captions: Légendes, dans le même ordre
+
+        Returns:
+            int: Nombre de pages écrites
+
+        Raises:
+            ValueError: Si les légendes ne sont pas aussi nombreuses que les matrices ; le
+                        flux est alors vide (longueurs connues) ou contient un document
+                        inachevé, jamais un PDF tronqué d'apparence valide
+        """
+        layout = self.layout
+        width, height = (length * _POINTS_PER_MM for length in layout.page_size)
+        cell = layout.cell_size * _POINTS_PER_MM
+        caption_height = layout.caption_height * _POINTS_PER_MM
+
+        # Vérifie les légendes avant d'écrire quoi que ce soit dans le flux
+        sheets = self._pages(matrices, captions)
+        pages = 0
+        with PdfWriter(stream) as writer:
+            for entries in sheets:
+                parts = [
+                    rgb_operator(self.color_background), b"\n",
+                    b"0 0 %.4f %.4f re f\n" % (width, height),
+                    rgb_operator(self.color_module), b"\n",
+                ]
+                texts = []
+                for slot, matrix, caption in entries:
+                    x_mm, y_mm = layout.cell_origin(slot)
+                    x, y = x_mm * _POINTS_PER_MM, y_mm * _POINTS_PER_MM
+                    modules = _module_rows(matrix)
+                    module_size = cell / (len(modules) + 2 * layout.margin)
+                    offset = layout.margin * module_size
+                    parts.append(rectangles_operator(
+                        merge_module_runs(modules), module_size, height, x + offset, y + offset
+                    ))
+                    if layout.captions:
+                        font_size = caption_height * 0.7
+                        text_width = len(caption) * font_size * 0.5
+                        texts.append(text_operator(
+                            caption, x + (cell - text_width) / 2, height - y - cell - font_size, font_size
+                        ))
+                parts.append(b"f\n")
+                parts.extend(texts)
+                writer.add_page(width, height, b"".join(parts), HELVETICA_RESOURCES)
+                pages += 1
+        return pages
@@ -0,0 +1,216 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from .data_encoder import DataEncoder, Version
+from .error_correction import BlockLayout, add_error_correction, block_layout, pad_data
+
+# Palettes du mode haute densité. L'indice 0 est la couleur claire (fond et
+# anneaux des marqueurs), le dernier indice la couleur sombre (marqueurs).
+PALETTE_4: Tuple[Tuple[int, int, int], ...] = (
+    (255, 255, 255),  # Blanc
+    (230, 0, 0),      # Rouge
+    (0, 0, 230),      # Bleu
+    (0, 0, 0),        # Noir
+)
+
+PALETTE_8: Tuple[Tuple[int, int, int], ...] = (
+    (255, 255, 255),  # Blanc
+    (255, 255, 0),    # Jaune
+    (0, 255, 255),    # Cyan
+    (0, 200, 0),      # Vert
+    (255, 0, 255),    # Magenta
+    (230, 0, 0),      # Rouge
+    (0, 0, 230),      # Bleu
+    (0, 0, 0),        # Noir
+)
+
+PALETTES: Dict[int, Tuple[Tuple[int, int, int], ...]] = {2: PALETTE_4, 3: PALETTE_8}
+
+# Le champ longueur est toujours sur 16 bits : la capacité d'un petit symbole
+# multi-couleurs peut dépasser 255 octets.
+COLOR_LENGTH_BITS_COUNT = 16
+
+MARKER_SIZE = 7
+
+
+def calibration_cells(size: int, palette_size: int) -> List[Tuple[int, int, int]]:
+    """
+    Positions des cellules de calibration, sous les marqueurs haut-gauche et haut-droit.
+
+    Chaque couleur de la palette apparaît deux fois, ce qui permet au décodeur
+    de mesurer la couleur imprimée réelle de chaque indice.
+
+    Args:
+        size: Taille de la matrice
+        palette_size: Nombre de couleurs de la palette
+
+    Returns:
+        Liste de tuples (ligne, colonne, indice de couleur)
+    """
+    cells = [(MARKER_SIZE, index, index) for index in range(palette_size)]
+    cells.extend((MARKER_SIZE, size - palette_size + index, index) for index in range(palette_size))
+    return cells
+
+
+def data_positions(size: int, palette_size: int) -> List[Tuple[int, int]]:
+    """
+    Liste les cellules de données dans l'ordre de placement (zigzag de bas en haut,
+    de droite à gauche, deux colonnes à la fois), hors marqueurs et calibration.
+
+    Args:
+        size: Taille de la matrice
+        palette_size: Nombre de couleurs de la palette
+
+    Returns:
+        Liste de tuples (ligne, colonne)
+    """
+    reserved: Set[Tuple[int, int]] = {(row, col) for row, col, _ in calibration_cells(size, palette_size)}
+    positions = []
+    for col in range(size - 1, -1, -2):
+        for row in range(size - 1, -1, -1):
+            for x in range(2):
+                current_col = col - x
+                if current_col < 0:
+                    continue
+                if _is_position_marker(row, current_col, size) or (row, current_col) in reserved:
+                    continue
+                positions.append((row, current_col))
+    return positions
+
+
+@lru_cache(maxsize=None)
+def color_block_layout(size: int, bits_per_module: int, error_correction: str) -> BlockLayout:
+    """
+    Découpage Reed-Solomon d'un symbole multi-couleurs.
+
+    La capacité suit le nombre de cellules de données (`bits_per_module` bits
+    chacune) ; chaque niveau de correction y réserve la même part que dans le
+    symbole monochrome de même taille.
+
+    Args:
+        size: Taille de la matrice
+        bits_per_module: Nombre de bits par module (2 ou 3)
+        error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+
+    Returns:
+        BlockLayout: Découpage retenu
+    """
+    palette_size = len(PALETTES[bits_per_module])
+    total = len(data_positions(size, palette_size)) * bits_per_module // 8
+    version_number = Version.number_for_size(size)
+    data = total * Version.data_codeword_count(version_number, error_correction) // Version.codeword_count(size)
+    return block_layout(total, data)
+
+
+def _is_position_marker(row: int, col: int, size: int) -> bool:
+    """Vérifie si une cellule appartient à l'un des trois marqueurs de position."""
+    return (row < MARKER_SIZE and col < MARKER_SIZE) or \
+           (row < MARKER_SIZE and col >= size - MARKER_SIZE) or \
+           (row >= size - MARKER_SIZE and col < MARKER_SIZE)
+
+
+class ColorEncodingMatrix:
+    """
+    Matrice d'encodage haute densité : chaque module porte 2 ou 3 bits sous la forme
+    d'un indice dans une palette de 4 ou 8 couleurs. Les mots de code reçoivent la
+    même correction Reed-Solomon que les symboles monochromes (voir `color_block_layout`).
+    """
+
+    def __init__(self, text: str, bits_per_module: int = 2, error_correction: str = 'M',
+                 compression: bool = False):
+        """
+        Initialise une matrice multi-couleurs pour encoder un message.
+
+        Args:
+            text: Le texte à encoder
+            bits_per_module: Nombre de bits par module (2 ou 3)
+            error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+            compression: Compresse le texte (deflate) si cela réduit la taille du symbole
+
+        Raises:
+            ValueError: Si bits_per_module n'est pas supporté ou si le texte est trop long
+        """
+        if bits_per_module not in PALETTES:
+            raise ValueError("bits_per_module doit valoir 2 ou 3")
+
+        self.bits_per_module = bits_per_module
+        self.palette = PALETTES[bits_per_module]
+        self.palette_size = len(self.palette)
+        self.error_correction = error_correction
+
+        self.encoder = DataEncoder(
+            text,
+            error_correction=error_correction,
+            compression=compression,
+            length_bits_count=COLOR_LENGTH_BITS_COUNT,
+        )
+        data = self.encoder.encode_data()
+        self.size, self.layout = self._select_size(len(data))
+        # Taille seule : la capacité multi-couleurs ne suit pas les tables monochromes
+        self.version = Version(Version.number_for_size(self.size), self.size, {})
+        self.codewords = add_error_correction(pad_data(data, self.layout.data_codewords), self.layout)
+        self.bits = [bool(byte >> (7 - i) & 1) for byte in self.codewords for i in range(8)]
+
+        self.matrix: List[List[Optional[int]]] = [[None for _ in range(self.size)] for _ in range(self.size)]
+        self._add_position_markers()
+        self._add_calibration_cells()
+        self._place_data()
+
+    def _select_size(self, byte_count: int) -> Tuple[int, BlockLayout]:
+        """
+        Choisit la plus petite taille de matrice dont les mots de code de données
+        suffisent, correction d'erreur comprise.
+
+        Raises:
+            ValueError: Si aucune taille supportée ne peut contenir les données
+        """
+        for _, (size, _) in sorted(Version.CAPACITIES.items()):
+            layout = color_block_layout(size, self.bits_per_module, self.error_correction)
+            if layout.data_codewords >= byte_count:
+                return size, layout
+        raise ValueError(f"Données trop longues ({byte_count} octets) pour un symbole multi-couleurs")
+
+    def _add_position_markers(self) -> None:
+        """Ajoute les trois marqueurs de position (couleurs claire et sombre de la palette)."""
+        self._draw_square(0, 0)
+        self._draw_square(0, self.size - MARKER_SIZE)
+        self._draw_square(self.size - MARKER_SIZE, 0)
+
+    def _draw_square(self, row_start: int, col_start: int) -> None:
+        """Dessine un marqueur de position avec le motif standard QR Code."""
+        dark = self.palette_size - 1
+        for i in range(MARKER_SIZE):
+            for j in range(MARKER_SIZE):
+                if (i < 1 or i > MARKER_SIZE - 2) or (j < 1 or j > MARKER_SIZE - 2):
+                    self.matrix[row_start + i][col_start + j] = dark
+                elif (i < 2 or i > MARKER_SIZE - 3) or (j < 2 or j > MARKER_SIZE - 3):
+                    self.matrix[row_start + i][col_start + j] = 0
+                else:
+                    self.matrix[row_start + i][col_start + j] = dark
+
+    def _add_calibration_cells(self) -> None:
+        """Place une cellule de chaque couleur de la palette près des marqueurs."""
+        for row, col, index in calibration_cells(self.size, self.palette_size):
+            self.matrix[row][col] = index
+
+    def _place_data(self) -> None:
+        """Regroupe les bits par `bits_per_module` et les place dans l'ordre en zigzag."""
+        bits = self.bits
+        step = self.bits_per_module
+        for position, (row, col) in enumerate(data_positions(self.size, self.palette_size)):
+            chunk = bits[position * step:(position + 1) * step]
+            value = 0
+            for k in range(step):
+                value = (value << 1) | (1 if k < len(chunk) and chunk[k] else 0)
+            self.matrix[row][col] = value
+
+    def get_matrix(self) -> List[List[Optional[int]]]:
+        """
+        Retourne la matrice des indices de couleur.
+        """
+        return self.matrix
+
+    def __str__(self) -> str:
+        """
+        Retourne une représentation string de la matrice (un chiffre par module).
+        """
+        return "\n".join("".join(' ' if cell is None else str(cell) for cell in row) for row in self.matrix) + "\n"
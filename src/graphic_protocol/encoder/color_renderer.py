@@ -0,0 +1,92 @@
+import os
+from ..core.lazy import lazy_import
+from .color_matrix import ColorEncodingMatrix
+
+# Chargés au premier rendu matriciel seulement
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+
+class ColorMatrixRenderer:
+    """
+    Classe qui génère une image à partir d'une matrice multi-couleurs (ColorEncodingMatrix).
+    Le rendu se fait par une seule indexation de palette sur le tableau des modules.
+    """
+
+    def __init__(self, matrix, module_size=10, margin=4, palette=None):
+        """
+        Initialise le renderer avec une matrice et des paramètres de rendu.
+
+        Args:
+            matrix (ColorEncodingMatrix): La matrice multi-couleurs à rendre
+            module_size (int): Taille en pixels de chaque module (cellule)
+            margin (int): Marge en nombre de modules autour de la matrice
+            palette (tuple, optional): Couleurs RGB par indice. Par défaut, la palette
+                                       de la matrice (l'indice 0 sert aussi de fond).
+        """
+        if not isinstance(matrix, ColorEncodingMatrix):
+            raise TypeError("Le paramètre 'matrix' doit être une instance de ColorEncodingMatrix")
+
+        self.matrix = matrix
+        self.module_size = module_size
+        self.margin = margin
+        self.palette = palette if palette is not None else matrix.palette
+
+        if len(self.palette) != matrix.palette_size:
+            raise ValueError("La palette doit contenir une couleur par indice de la matrice")
+
+    def _module_indices(self):
+        """
+        Construit le tableau des indices de couleur, marge comprise.
+
+        Returns:
+            numpy.ndarray: Tableau uint8 de taille (matrix_size + 2 * margin)²
+        """
+        matrix_data = self.matrix.get_matrix()
+        matrix_size = len(matrix_data)
+        total = matrix_size + 2 * self.margin
+
+        indices = np.zeros((total, total), dtype=np.uint8)
+        indices[self.margin:self.margin + matrix_size, self.margin:self.margin + matrix_size] = [
+            [cell or 0 for cell in row] for row in matrix_data
+        ]
+        return indices
+
+    def render_to_image(self):
+        """
+        Génère une image PIL à partir de la matrice sans la sauvegarder.
+
+        Returns:
+            PIL.Image: L'image générée (RGB)
+        """
+        indices = self._module_indices()
+        # Agrandissement des modules puis une unique indexation dans la palette
+        indices = np.repeat(np.repeat(indices, self.module_size, axis=0), self.module_size, axis=1)
+        palette = np.asarray(self.palette, dtype=np.uint8)
+        return Image.fromarray(palette[indices], "RGB")
+
+    def render(self, filename=None, output_dir="output"):
+        """
+        Génère une image à partir de la matrice et la sauvegarde dans le dossier output.
+
+        Args:
+            filename (str, optional): Nom du fichier de sortie (sans extension). Si non fourni,
+                                     un nom par défaut sera généré.
+            output_dir (str): Chemin du dossier de sortie (relatif ou absolu)
+
+        Returns:
+            str: Chemin complet du fichier sauvegardé
+        """
+        image = self.render_to_image()
+
+        # Création du dossier output s'il n'existe pas
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Génération du nom de fichier s'il n'est pas fourni
+        if filename is None:
+            size = self.matrix.size
+            filename = f"color_matrix_{size}x{size}_{self.matrix.palette_size}c"
+
+        file_path = os.path.join(output_dir, f"{filename}.png")
+        image.save(file_path)
+
+        return file_path
@@ -0,0 +1,72 @@
+import zlib
+from typing import Optional
+
+# Dictionnaire prédéfini partagé entre l'encodeur et le décodeur.
+# zlib donne la priorité aux chaînes placées en fin de dictionnaire : les
+# motifs les plus fréquents (JSON, URLs) sont donc regroupés à la fin.
+DEFAULT_PRESET_DICTIONARY: bytes = (
+    b'application/json; charset=utf-8text/html'
+    b'"timestamp":"created_at":"updated_at":"status":"message":'
+    b'"description":"value":"type":"name":"data":"id":'
+    b'null,false,true,'
+    b'.html.php.json?id=&page=&utm_source=&utm_medium=&utm_campaign='
+    b'.org/.net/.fr/.com/www.'
+    b'http://https://'
+)
+
+# Niveau de compression zlib utilisé par défaut (maximal : les charges
+# utiles sont petites, le coût CPU est négligeable).
+DEFAULT_COMPRESSION_LEVEL = 9
+
+# Taille de fenêtre deflate brute (négative : pas d'en-tête zlib ni de
+# somme de contrôle, soit 6 octets économisés par symbole).
+_WBITS = -15
+
+
+def compress_payload(data: bytes,
+                     preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY,
+                     level: int = DEFAULT_COMPRESSION_LEVEL) -> bytes:
+    """
+    Compresse une charge utile avec deflate brut et un dictionnaire prédéfini.
+
+    Args:
+        data: Octets à compresser
+        preset_dictionary: Dictionnaire prédéfini partagé (None pour aucun)
+        level: Niveau de compression zlib (0-9)
+
+    Returns:
+        bytes: Flux deflate brut
+    """
+    if preset_dictionary:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS, zdict=preset_dictionary)
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def decompress_payload(data: bytes,
+                       preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY) -> bytes:
+    """
+    Décompresse un flux produit par `compress_payload`.
+
+    Args:
+        data: Flux deflate brut
+        preset_dictionary: Dictionnaire utilisé lors de la compression
+
+    Returns:
+        bytes: Octets décompressés
+
+    Raises:
+        ValueError: Si le flux est corrompu ou le dictionnaire incorrect
+    """
+    if preset_dictionary:
+        decompressor = zlib.decompressobj(_WBITS, zdict=preset_dictionary)
+    else:
+        decompressor = zlib.decompressobj(_WBITS)
+    try:
+        result = decompressor.decompress(data) + decompressor.flush()
+    except zlib.error as e:
+        raise ValueError(f"Données compressées invalides: {e}") from e
+    if not decompressor.eof:
+        raise ValueError("Flux compressé incomplet")
+    return result
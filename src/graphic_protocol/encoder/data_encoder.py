@@ -0,0 +1,356 @@
+from typing import List, Tuple, Dict, Optional, cast
+from enum import Enum
+from .compression import DEFAULT_PRESET_DICTIONARY, DEFAULT_COMPRESSION_LEVEL, compress_payload
+from .error_correction import BlockLayout, add_error_correction, block_layout, pad_data
+
+class EncodingMode(Enum):
+    """Modes d'encodage supportés par le QR Code."""
+    NUMERIC = 0b0001      # 0-9
+    ALPHANUMERIC = 0b0010 # 0-9, A-Z, espace et $%*+-./:
+    BYTE = 0b0100        # ISO-8859-1 / UTF-8
+    KANJI = 0b1000       # Shift JIS (non implémenté pour l'instant)
+    DEFLATE = 0b0110     # Octets UTF-8 compressés (deflate + dictionnaire prédéfini)
+
+class Version:
+    """Représente une version de QR Code avec sa capacité."""
+    
+    # Table des capacités en octets pour chaque version
+    # Format: version: (taille, {mode: {niveau_correction: capacité}})
+    CAPACITIES = {
+        1:  (21,  {EncodingMode.BYTE: {'L': 17, 'M': 14, 'Q': 11, 'H': 7}}),
+        2:  (25,  {EncodingMode.BYTE: {'L': 32, 'M': 26, 'Q': 20, 'H': 14}}),
+        3:  (29,  {EncodingMode.BYTE: {'L': 53, 'M': 42, 'Q': 32, 'H': 24}}),
+        4:  (33,  {EncodingMode.BYTE: {'L': 78, 'M': 62, 'Q': 46, 'H': 34}}),
+        5:  (37,  {EncodingMode.BYTE: {'L': 106, 'M': 84, 'Q': 60, 'H': 44}}),
+        6:  (41,  {EncodingMode.BYTE: {'L': 134, 'M': 106, 'Q': 74, 'H': 58}}),
+        7:  (45,  {EncodingMode.BYTE: {'L': 154, 'M': 122, 'Q': 86, 'H': 64}}),
+        8:  (49,  {EncodingMode.BYTE: {'L': 192, 'M': 152, 'Q': 108, 'H': 84}}),
+        9:  (53,  {EncodingMode.BYTE: {'L': 230, 'M': 180, 'Q': 130, 'H': 98}}),
+        10: (57,  {EncodingMode.BYTE: {'L': 271, 'M': 213, 'Q': 151, 'H': 119}}),
+        11: (61,  {EncodingMode.BYTE: {'L': 321, 'M': 251, 'Q': 177, 'H': 137}}),
+        12: (65,  {EncodingMode.BYTE: {'L': 367, 'M': 287, 'Q': 203, 'H': 155}}),
+        13: (69,  {EncodingMode.BYTE: {'L': 425, 'M': 331, 'Q': 241, 'H': 177}}),
+        14: (73,  {EncodingMode.BYTE: {'L': 458, 'M': 362, 'Q': 258, 'H': 194}}),
+        15: (77,  {EncodingMode.BYTE: {'L': 520, 'M': 412, 'Q': 292, 'H': 220}})
+    }
+
+    def __init__(self, version_number: int, size: int, capacity: Dict):
+        """
+        Args:
+            version_number: Numéro de version (1-40)
+            size: Taille de la matrice
+            capacity: Dictionnaire des capacités par mode et niveau de correction
+        """
+        self.version_number = version_number
+        self.size = size
+        self.capacity = capacity
+
+    @staticmethod
+    def get_version_for_length(text: str, mode: EncodingMode, error_correction: str = 'M') -> 'Version':
+        """
+        Détermine la version minimale nécessaire pour encoder le texte.
+        
+        Args:
+            text: Le texte à encoder
+            mode: Mode d'encodage à utiliser
+            error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+            
+        Returns:
+            Version: La version minimale capable de contenir le texte
+            
+        Raises:
+            ValueError: Si le texte est trop long pour être encodé
+        """
+        return Version.get_version_for_byte_count(len(text), mode, error_correction)
+
+    @staticmethod
+    def get_version_for_byte_count(byte_count: int, mode: EncodingMode, error_correction: str = 'M') -> 'Version':
+        """
+        Détermine la version minimale nécessaire pour encoder `byte_count` unités de données.
+        
+        Le mode DEFLATE transporte des octets et partage donc les capacités du mode BYTE.
+        
+        Args:
+            byte_count: Nombre de caractères (ou d'octets) à encoder
+            mode: Mode d'encodage à utiliser
+            error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+            
+        Returns:
+            Version: La version minimale capable de contenir les données
+            
+        Raises:
+            ValueError: Si les données sont trop longues pour être encodées
+        """
+        table_mode = EncodingMode.BYTE if mode == EncodingMode.DEFLATE else mode
+        
+        # Parcourir les versions dans l'ordre croissant
+        for version, (size, capacities) in sorted(Version.CAPACITIES.items()):
+            if table_mode in capacities and error_correction in capacities[table_mode]:
+                if byte_count <= capacities[table_mode][error_correction]:
+                    return Version(version, size, capacities[table_mode])
+        
+        raise ValueError(
+            f"Le texte est trop long ({byte_count} caractères) pour être encodé. "
+            f"Maximum supporté: {Version.CAPACITIES[max(Version.CAPACITIES.keys())][1][table_mode][error_correction]} caractères"
+        )
+
+    @staticmethod
+    def number_for_size(size: int) -> int:
+        """
+        Retrouve le numéro de version correspondant à une taille de matrice.
+        
+        Args:
+            size: Taille de la matrice (côté, en modules)
+            
+        Returns:
+            int: Numéro de version (1 pour les tailles inconnues)
+        """
+        for version, (version_size, _) in Version.CAPACITIES.items():
+            if version_size == size:
+                return version
+        return 1
+
+    @staticmethod
+    def length_bits_count_for(version_number: int) -> int:
+        """Nombre de bits du champ longueur (8 bits pour version 1-9, 16 bits pour version 10+)."""
+        return 16 if version_number >= 10 else 8
+
+    @staticmethod
+    def codeword_count(size: int) -> int:
+        """
+        Nombre de mots de code (octets) que porte une matrice de cette taille : tous
+        les modules hors des trois marqueurs de position 7x7.
+        """
+        return (size * size - 3 * 7 * 7) // 8
+
+    @staticmethod
+    def data_codeword_count(version_number: int, error_correction: str) -> int:
+        """
+        Nombre de mots de code de données d'une version : capacité du mode BYTE plus
+        l'en-tête (mode, longueur) et le terminateur.
+        """
+        capacity = Version.CAPACITIES[version_number][1][EncodingMode.BYTE][error_correction]
+        header_bits = 4 + Version.length_bits_count_for(version_number) + 4
+        return capacity + header_bits // 8
+
+    @staticmethod
+    def block_layout_for(version_number: int, error_correction: str) -> BlockLayout:
+        """Découpage Reed-Solomon des mots de code d'une version et d'un niveau de correction."""
+        size = Version.CAPACITIES[version_number][0]
+        return block_layout(
+            Version.codeword_count(size), Version.data_codeword_count(version_number, error_correction)
+        )
+
+class DataEncoder:
+    """Encode les données textuelles en bits selon les spécifications QR Code."""
+
+    def __init__(self, text: str, error_correction: str = 'M',
+                 compression: bool = False,
+                 preset_dictionary: Optional[bytes] = DEFAULT_PRESET_DICTIONARY,
+                 compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+                 length_bits_count: Optional[int] = None,
+                 version_number: Optional[int] = None):
+        """
+        Args:
+            text: Le texte à encoder
+            error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+            compression: Active la compression deflate de la charge utile. Elle n'est
+                         appliquée que si elle réduit effectivement le nombre de bits.
+            preset_dictionary: Dictionnaire prédéfini partagé avec le décodeur
+            compression_level: Niveau de compression zlib (0-9)
+            length_bits_count: Force la taille du champ longueur au lieu de la déduire
+                               de la version (utilisé par les symboles multi-couleurs)
+            version_number: Force la version du symbole au lieu de la plus petite
+                            qui contient les données
+
+        Raises:
+            ValueError: Si le texte sort du Latin-1 alors que la compression est désactivée
+
+        La version n'est choisie qu'au premier accès à `version` : les symboles
+        multi-couleurs, dont la capacité ne suit pas les tables monochromes,
+        n'y accèdent jamais.
+        """
+        self.text = text
+        self._length_bits_count = length_bits_count
+        self.error_correction = error_correction
+        self.compressed_payload: Optional[bytes] = None
+        if compression:
+            self.compressed_payload = compress_payload(
+                text.encode('utf-8'), preset_dictionary, compression_level
+            )
+        self.mode = self._determine_encoding_mode()
+        self._version_number = version_number
+        self._version: Optional[Version] = None
+
+    @property
+    def version(self) -> Version:
+        """
+        Version du symbole : celle demandée, sinon la plus petite qui contient les données.
+
+        Raises:
+            ValueError: Si les données sont trop longues, ou ne tiennent pas dans la
+                        version demandée
+        """
+        if self._version is None:
+            version = Version.get_version_for_byte_count(self._payload_length(), self.mode, self.error_correction)
+            requested = self._version_number
+            if requested is not None and requested != version.version_number:
+                if requested not in Version.CAPACITIES:
+                    raise ValueError(f"Version inconnue: {requested}")
+                if requested < version.version_number:
+                    raise ValueError(
+                        f"Les données ne tiennent pas dans la version {requested} "
+                        f"(version {version.version_number} nécessaire)"
+                    )
+                size, capacities = Version.CAPACITIES[requested]
+                version = Version(requested, size, capacities[EncodingMode.BYTE])
+            self._version = version
+        return self._version
+
+    @version.setter
+    def version(self, version: Version) -> None:
+        self._version = version
+
+    def _determine_encoding_mode(self) -> EncodingMode:
+        """
+        Détermine le mode d'encodage optimal pour le texte.
+        Le mode DEFLATE est retenu si la compression est active et plus compacte
+        que le mode BYTE, sinon on utilise le mode BYTE.
+
+        Le mode BYTE ne porte que du Latin-1 (un octet par caractère) : un texte qui
+        en sort n'est encodable qu'en DEFLATE, dont la charge est en UTF-8.
+
+        Raises:
+            ValueError: Si le texte sort du Latin-1 et que la compression est désactivée
+        """
+        try:
+            byte_payload = self.text.encode('latin-1')
+        except UnicodeEncodeError:
+            if self.compressed_payload is not None:
+                return EncodingMode.DEFLATE
+            raise ValueError(
+                "Le mode BYTE n'accepte que les caractères Latin-1 : "
+                "activer la compression pour encoder ce texte en UTF-8"
+            )
+        if self.compressed_payload is not None and len(self.compressed_payload) < len(byte_payload):
+            return EncodingMode.DEFLATE
+        return EncodingMode.BYTE
+
+    def _payload_length(self) -> int:
+        """Retourne le nombre d'unités (caractères ou octets) écrites dans le champ longueur."""
+        if self.mode == EncodingMode.DEFLATE:
+            return len(cast(bytes, self.compressed_payload))
+        return len(self.text)
+
+    @property
+    def length_bits_count(self) -> int:
+        """Nombre de bits du champ longueur pour la version retenue."""
+        if self._length_bits_count is not None:
+            return self._length_bits_count
+        return Version.length_bits_count_for(self.version.version_number)
+
+    @property
+    def bit_count(self) -> int:
+        """
+        Nombre de bits produits par `encode()` (terminateur et remplissage compris),
+        calculé sans construire la séquence de bits. Le mode BYTE n'acceptant que le
+        Latin-1, chaque caractère y compte pour un octet ; en mode DEFLATE, on compte
+        les octets compressés.
+        """
+        count = 4 + self.length_bits_count + 8 * self._payload_length() + 4
+        return count + (-count) % 8
+
+    def _encode_header(self, mode: EncodingMode) -> List[bool]:
+        """Encode l'indicateur de mode (4 bits) suivi du champ longueur."""
+        bits: List[bool] = []
+        
+        # Indicateur de mode (4 bits)
+        mode_bits = format(mode.value, '04b')
+        bits.extend(bool(int(bit)) for bit in mode_bits)
+        
+        # Longueur des données (8 bits pour version 1-9, 16 bits pour version 10+)
+        length_bits = format(self._payload_length(), f'0{self.length_bits_count}b')
+        bits.extend(bool(int(bit)) for bit in length_bits)
+        
+        return bits
+
+    def _encode_byte_mode(self) -> List[bool]:
+        """Encode le texte en mode BYTE."""
+        bits = self._encode_header(EncodingMode.BYTE)
+        
+        # Données
+        for char in self.text:
+            char_bits = format(ord(char), '08b')
+            bits.extend(bool(int(bit)) for bit in char_bits)
+        
+        return bits
+
+    def _encode_deflate_mode(self) -> List[bool]:
+        """Encode la charge utile compressée en mode DEFLATE."""
+        bits = self._encode_header(EncodingMode.DEFLATE)
+        
+        # Données compressées
+        for byte in cast(bytes, self.compressed_payload):
+            bits.extend(bool(int(bit)) for bit in format(byte, '08b'))
+        
+        return bits
+
+    def encode(self) -> Tuple[List[bool], Version]:
+        """
+        Encode le texte en une séquence de bits.
+        
+        Returns:
+            Tuple contenant:
+            - Liste de bits (booléens)
+            - Version du QR Code nécessaire
+        """
+        return self._data_bits(), self.version
+
+    def _data_bits(self) -> List[bool]:
+        """Bits des données (en-tête, charge utile, terminateur et alignement sur l'octet)."""
+        if self.mode == EncodingMode.BYTE:
+            bits = self._encode_byte_mode()
+        elif self.mode == EncodingMode.DEFLATE:
+            bits = self._encode_deflate_mode()
+        else:
+            raise NotImplementedError(f"Mode {self.mode} non implémenté")
+            
+        # Ajouter le terminateur (4 bits de 0)
+        bits.extend([False, False, False, False])
+        
+        # Ajouter des 0 jusqu'à ce que la longueur soit multiple de 8
+        while len(bits) % 8 != 0:
+            bits.append(False)
+            
+        return bits
+
+    def encode_data(self) -> bytes:
+        """
+        Encode le texte en mots de code de données (en-tête, charge utile et
+        terminateur), sans remplissage ni correction.
+        
+        Returns:
+            bytes: Mots de code de données
+        """
+        if self.mode == EncodingMode.DEFLATE:
+            payload = cast(bytes, self.compressed_payload)
+        else:
+            # Latin-1 garanti par `_determine_encoding_mode`
+            payload = self.text.encode('latin-1')
+
+        # Mode, longueur, charge utile et terminateur, complétés par des 0 jusqu'à l'octet
+        value = self.mode.value << self.length_bits_count | self._payload_length()
+        value = (value << 8 * len(payload) | int.from_bytes(payload, 'big')) << 4
+        used = 4 + self.length_bits_count + 8 * len(payload) + 4
+        return (value << (-used % 8)).to_bytes((used + 7) // 8, 'big')
+
+    def encode_codewords(self) -> bytes:
+        """
+        Encode le texte en mots de code prêts à placer : données complétées par les
+        octets de remplissage, suivies de la correction Reed-Solomon entrelacée.
+        
+        Returns:
+            bytes: Flux de mots de code du symbole
+        """
+        layout = Version.block_layout_for(self.version.version_number, self.error_correction)
+        return add_error_correction(pad_data(self.encode_data(), layout.data_codewords), layout) 
\ No newline at end of file
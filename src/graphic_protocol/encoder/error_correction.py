@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+import reedsolo
+from ..core.lazy import lazy_import
+
+# Utilisé seulement au décodage (vérification vectorisée des syndromes)
+np = lazy_import("numpy")
+
+# Longueur maximale d'un bloc Reed-Solomon sur GF(256)
+MAX_BLOCK_LENGTH = 255
+
+# Confiance (0-1) en dessous de laquelle un mot de code est candidat à l'effacement
+ERASURE_CONFIDENCE = 0.35
+
+# Octets de remplissage alternés après le terminateur (comme pour le QR Code)
+_PAD_BYTES = (0xEC, 0x11)
+
+# Polynôme primitif de GF(256), identique à celui de reedsolo.RSCodec par défaut
+_PRIMITIVE = 0x11D
+
+
+class BlockLayout(NamedTuple):
+    """
+    Découpage des mots de code d'un symbole en blocs Reed-Solomon.
+
+    Attributes:
+        data_sizes: Nombre de mots de code de données de chaque bloc
+        ec_codewords: Nombre de mots de code de correction par bloc
+        total_codewords: Nombre de mots de code que le symbole peut porter
+    """
+    data_sizes: Tuple[int, ...]
+    ec_codewords: int
+    total_codewords: int
+
+    @property
+    def data_codewords(self) -> int:
+        """Nombre total de mots de code de données."""
+        return sum(self.data_sizes)
+
+
+@lru_cache(maxsize=None)
+def block_layout(total_codewords: int, data_codewords: int) -> BlockLayout:
+    """
+    Répartit les mots de code en blocs d'au plus 255 octets ; les blocs les plus
+    courts viennent en premier et chaque bloc reçoit autant de mots de correction.
+
+    Args:
+        total_codewords: Nombre de mots de code disponibles dans le symbole
+        data_codewords: Nombre de mots de code de données
+
+    Returns:
+        BlockLayout: Découpage retenu
+
+    Raises:
+        ValueError: S'il ne reste aucune place pour la correction d'erreur
+    """
+    block_count = -(-total_codewords // MAX_BLOCK_LENGTH)
+    ec_codewords = (total_codewords - data_codewords) // block_count
+    if ec_codewords < 2:
+        raise ValueError("Pas assez de place pour la correction d'erreur")
+    short, longer = divmod(data_codewords, block_count)
+    sizes = (short,) * (block_count - longer) + (short + 1,) * longer
+    return BlockLayout(sizes, ec_codewords, total_codewords)
+
+
+@lru_cache(maxsize=None)
+def block_indices(layout: BlockLayout) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Positions, dans le flux entrelacé, des mots de code (données puis correction)
+    de chaque bloc. L'entrelacement répartit une zone endommagée sur tous les blocs.
+
+    Args:
+        layout: Découpage en blocs
+
+    Returns:
+        Pour chaque bloc, les indices de ses mots de code dans le flux
+    """
+    indices: List[List[int]] = [[] for _ in layout.data_sizes]
+    position = 0
+    for column in range(max(layout.data_sizes)):
+        for block, size in enumerate(layout.data_sizes):
+            if column < size:
+                indices[block].append(position)
+                position += 1
+    for _ in range(layout.ec_codewords):
+        for block in indices:
+            block.append(position)
+            position += 1
+    return tuple(tuple(block) for block in indices)
+
+
+@lru_cache(maxsize=None)
+def _codec(ec_codewords: int) -> reedsolo.RSCodec:
+    return reedsolo.RSCodec(ec_codewords)
+
+
+@lru_cache(maxsize=None)
+def _gf_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tables exponentielle et logarithme de GF(256) (partagées, en lecture seule).
+    
+    log(0) vaut 510 et la table exponentielle est prolongée par des zéros au-delà de
+    509 : un octet nul donne un terme nul sans masque ni modulo, même dans un produit
+    de deux octets nuls (somme de logarithmes jusqu'à 1020).
+    """
+    exp = np.zeros(1021, dtype=np.uint8)
+    log = np.full(256, 510, dtype=np.int16)
+    value = 1
+    for power in range(255):
+        exp[power] = exp[power + 255] = value
+        log[value] = power
+        value <<= 1
+        if value & 0x100:
+            value ^= _PRIMITIVE
+    exp.setflags(write=False)
+    log.setflags(write=False)
+    return exp, log
+
+
+@lru_cache(maxsize=None)
+def _syndrome_exponents(length: int, ec_codewords: int) -> np.ndarray:
+    """
+    Exposants j * (length - 1 - i) mod 255 du calcul des syndromes d'un bloc :
+    S_j = somme des c_i * alpha^(j * (length - 1 - i)) (partagés, en lecture seule).
+    """
+    powers = np.arange(length - 1, -1, -1, dtype=np.int16)
+    exponents = (np.outer(np.arange(ec_codewords, dtype=np.int32), powers) % 255).astype(np.int16)
+    exponents.setflags(write=False)
+    return exponents
+
+
+@lru_cache(maxsize=None)
+def _parity_logs(data_size: int, ec_codewords: int) -> np.ndarray:
+    """
+    Logarithmes de la correction de chaque mot de code de données pris isolément,
+    tableau (data_size, ec_codewords) partagé en lecture seule.
+
+    La correction du mot de données en position i (valeur 1) est le reste de
+    x^(ec + data_size - 1 - i) par le polynôme générateur : elle s'obtient de proche
+    en proche en multipliant le reste précédent par x.
+    """
+    exp, log = (table.tolist() for table in _gf_tables())
+
+    def multiply(a: int, b: int) -> int:
+        return exp[log[a] + log[b]]
+
+    # Polynôme générateur (x - alpha^0)...(x - alpha^(ec-1)), coefficients de poids fort en premier
+    generator = [1]
+    for power in range(ec_codewords):
+        generator = [c ^ multiply(exp[power], p) for c, p in zip(generator + [0], [0] + generator)]
+
+    rows: List[List[int]] = [[]] * data_size
+    remainder = generator[1:]
+    for degree in range(data_size):
+        rows[data_size - 1 - degree] = remainder
+        lead = remainder[0]
+        remainder = [a ^ multiply(lead, g) for a, g in zip(remainder[1:] + [0], generator[1:])]
+    logs = np.asarray(log, dtype=np.int16)[np.array(rows, dtype=np.uint8)]
+    logs.setflags(write=False)
+    return logs
+
+
+def _is_codeword(block: bytes, ec_codewords: int) -> bool:
+    """Vérifie qu'un bloc a tous ses syndromes nuls (calcul vectorisé, sans correction)."""
+    exp, log = _gf_tables()
+    exponents = _syndrome_exponents(len(block), ec_codewords)
+    terms = exp[exponents + log[np.frombuffer(block, dtype=np.uint8)]]
+    return not np.bitwise_xor.reduce(terms, axis=1).any()
+
+
+def pad_data(data: bytes, data_codewords: int) -> bytes:
+    """
+    Complète les données avec les octets de remplissage alternés.
+
+    Raises:
+        ValueError: Si les données dépassent la capacité
+    """
+    if len(data) > data_codewords:
+        raise ValueError(f"{len(data)} octets de données pour {data_codewords} mots de code")
+    padding = bytes(_PAD_BYTES[i % 2] for i in range(data_codewords - len(data)))
+    return data + padding
+
+
+def add_error_correction(data: bytes, layout: BlockLayout) -> bytes:
+    """
+    Calcule la correction Reed-Solomon de chaque bloc et entrelace les mots de code.
+
+    Args:
+        data: Mots de code de données (déjà complétés)
+        layout: Découpage en blocs
+
+    Returns:
+        bytes: Flux de `layout.total_codewords` mots de code (zéros en fin de flux
+               pour les mots de code inutilisés)
+    """
+    stream = bytearray(layout.total_codewords)
+    codec = _codec(layout.ec_codewords)
+    start = 0
+    for size, indices in zip(layout.data_sizes, block_indices(layout)):
+        block = codec.encode(data[start:start + size])
+        start += size
+        for index, value in zip(indices, block):
+            stream[index] = value
+    return bytes(stream)
+
+
+def parity_delta(data_size: int, ec_codewords: int, positions: Sequence[int],
+                 deltas: bytes) -> bytes:
+    """
+    Variation de la correction d'un bloc lorsque certains de ses mots de données
+    changent. Le code est linéaire : la correction de (ancien XOR différence) est
+    l'ancienne correction XOR la correction de la différence, qui ne dépend que des
+    mots modifiés. Le coût est proportionnel au nombre de mots modifiés, et non à la
+    taille du bloc.
+
+    Args:
+        data_size: Nombre de mots de données du bloc
+        ec_codewords: Nombre de mots de correction du bloc
+        positions: Positions, dans le bloc, des mots de données modifiés
+        deltas: Différence (ancien XOR nouveau) de chacun de ces mots
+
+    Returns:
+        bytes: Différence à appliquer (XOR) aux mots de correction du bloc
+    """
+    exp, log = _gf_tables()
+    rows = _parity_logs(data_size, ec_codewords)[np.asarray(positions, dtype=np.intp)]
+    terms = exp[rows + log[np.frombuffer(deltas, dtype=np.uint8)][:, None]]
+    return np.bitwise_xor.reduce(terms, axis=0).tobytes()
+
+
+def is_clean(codewords: bytes, layout: BlockLayout) -> bool:
+    """Vérifie, sans corriger, que tous les blocs ont un syndrome nul."""
+    return all(
+        _is_codeword(bytes(codewords[i] for i in indices), layout.ec_codewords)
+        for indices in block_indices(layout)
+    )
+
+
+def correct_errors(codewords: bytes, layout: BlockLayout,
+                   confidence: Optional[Sequence[float]] = None) -> bytes:
+    """
+    Corrige chaque bloc et retourne les mots de code de données.
+
+    Un effacement (position connue) coûte un mot de correction, une erreur en coûte
+    deux : lorsque la confiance par mot de code est connue, les mots les moins sûrs
+    de chaque bloc sont d'abord déclarés effacés, ce qui double la capacité de
+    correction pour ces mots. Quelques mots de correction sont toujours gardés en
+    réserve pour détecter une correction erronée.
+
+    Args:
+        codewords: Flux entrelacé lu dans le symbole
+        layout: Découpage en blocs
+        confidence: Confiance (0-1) de chaque mot de code du flux, ou None
+
+    Returns:
+        bytes: Mots de code de données corrigés
+
+    Raises:
+        ValueError: Si un bloc contient trop d'erreurs
+    """
+    codec = _codec(layout.ec_codewords)
+    reserve = max(2, layout.ec_codewords // 4)
+    data = bytearray()
+    for size, indices in zip(layout.data_sizes, block_indices(layout)):
+        block = bytearray(codewords[i] for i in indices)
+        if _is_codeword(bytes(block), layout.ec_codewords):
+            data += block[:size]
+            continue
+
+        attempts: List[List[int]] = []
+        if confidence is not None:
+            weak = sorted(
+                (position for position, index in enumerate(indices) if confidence[index] < ERASURE_CONFIDENCE),
+                key=lambda position: confidence[indices[position]],
+            )[:layout.ec_codewords - reserve]
+            attempts.extend(e for e in (weak, weak[:len(weak) // 2]) if e)
+        attempts.append([])
+
+        for erasures in attempts:
+            try:
+                message, _, _ = codec.decode(block, erase_pos=erasures or None)
+            except reedsolo.ReedSolomonError:
+                continue
+            data += message
+            break
+        else:
+            raise ValueError("Trop d'erreurs pour être corrigées")
+    return bytes(data)
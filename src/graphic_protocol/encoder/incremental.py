@@ -0,0 +1,196 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Sequence, Tuple
+from ..core.lazy import lazy_import
+from .data_encoder import DataEncoder, Version
+from .error_correction import block_indices, pad_data, parity_delta
+from .matrix import EncodingMatrix, data_positions
+from .renderer import MatrixRenderer
+
+# Chargé au premier rendu seulement
+np = lazy_import("numpy")
+
+
+class SymbolUpdate(NamedTuple):
+    """
+    Différence entre deux contenus successifs d'un symbole.
+
+    Attributes:
+        codewords: Indices, dans le flux entrelacé, des mots de code modifiés
+                   (données et correction)
+        blocks: Blocs Reed-Solomon dont la correction a été mise à jour
+        modules: Modules (ligne, colonne) qui ont changé de couleur
+    """
+    codewords: Tuple[int, ...]
+    blocks: Tuple[int, ...]
+    modules: Tuple[Tuple[int, int], ...]
+
+
+class IncrementalSymbol:
+    """
+    Met à jour en place un symbole déjà encodé lorsque son message change, sans
+    changer de version (compteur ou horodatage d'un ticket, par exemple).
+
+    Seuls les mots de code de données modifiés sont réécrits ; la correction de
+    leurs blocs est ajustée à partir des seules différences (le code Reed-Solomon
+    est linéaire) et seuls les modules correspondants sont modifiés dans la matrice.
+    Le coût d'une mise à jour dépend donc de l'ampleur du changement, et le résultat
+    est identique à un encodage complet du nouveau message dans la même version.
+    """
+
+    def __init__(self, matrix: EncodingMatrix):
+        """
+        Args:
+            matrix: Matrice encodée (à partir d'un texte), modifiée en place par `update`
+
+        Raises:
+            ValueError: Si la matrice ne porte aucun message
+        """
+        if not matrix.codewords:
+            raise ValueError("La matrice ne contient aucun message à mettre à jour")
+        self.matrix = matrix
+        self.version = matrix.version
+        self.error_correction = matrix.encoder.error_correction
+        self.compression = matrix.encoder.compressed_payload is not None
+        self.layout = Version.block_layout_for(self.version.version_number, self.error_correction)
+        self._length_bits_count = Version.length_bits_count_for(self.version.version_number)
+        self._blocks = block_indices(self.layout)
+        self._block_starts = list(accumulate(self.layout.data_sizes, initial=0))
+        self._stream = bytearray(matrix.codewords)
+        self._data = bytearray(self._stream[index] for size, indices in zip(self.layout.data_sizes, self._blocks)
+                               for index in indices[:size])
+
+    @property
+    def text(self) -> str:
+        """Message actuellement encodé."""
+        return self.matrix.encoder.text
+
+    def update(self, text: str) -> SymbolUpdate:
+        """
+        Remplace le message du symbole.
+
+        Args:
+            text: Nouveau message
+
+        Returns:
+            SymbolUpdate: Mots de code, blocs et modules modifiés
+
+        Raises:
+            ValueError: Si le message ne tient pas dans la version du symbole, ou sort
+                        du Latin-1 alors que le symbole n'est pas compressé
+        """
+        # Le champ longueur garde la taille de la version du symbole, même si le
+        # nouveau message tiendrait dans une version plus petite
+        encoder = DataEncoder(text, error_correction=self.error_correction, compression=self.compression,
+                              length_bits_count=self._length_bits_count)
+        if encoder.version.version_number > self.version.version_number:
+            raise ValueError(
+                f"Le message ne tient plus dans la version {self.version.version_number} du symbole"
+            )
+        data = pad_data(encoder.encode_data(), self.layout.data_codewords)
+
+        # Différences de données regroupées par bloc : {bloc: [(position, différence)]}
+        changes: Dict[int, List[Tuple[int, int]]] = {}
+        for index, (old, new) in enumerate(zip(self._data, data)):
+            if old != new:
+                block = bisect_right(self._block_starts, index) - 1
+                changes.setdefault(block, []).append((index - self._block_starts[block], old ^ new))
+        self._data[:] = data
+
+        deltas: Dict[int, int] = {}
+        for block, block_changes in changes.items():
+            indices = self._blocks[block]
+            size = self.layout.data_sizes[block]
+            positions = [position for position, _ in block_changes]
+            for position, delta in block_changes:
+                deltas[indices[position]] = delta
+            parity = parity_delta(size, self.layout.ec_codewords, positions,
+                                  bytes(delta for _, delta in block_changes))
+            for index, delta in zip(indices[size:], parity):
+                if delta:
+                    deltas[index] = delta
+
+        modules = self._apply(deltas)
+        # La version du symbole prime sur la version minimale du nouveau message
+        encoder.version = self.version
+        self.matrix.encoder = encoder
+        return SymbolUpdate(tuple(sorted(deltas)), tuple(sorted(changes)), modules)
+
+    def _apply(self, deltas: Dict[int, int]) -> Tuple[Tuple[int, int], ...]:
+        """Applique les différences au flux et à la matrice ; retourne les modules modifiés."""
+        positions = data_positions(self.matrix.size)
+        cells = self.matrix.matrix
+        bits = self.matrix.bits
+        modules = []
+        for index in sorted(deltas):
+            self._stream[index] ^= deltas[index]
+            for bit in range(8):
+                if deltas[index] >> (7 - bit) & 1:
+                    offset = index * 8 + bit
+                    row, col = positions[offset]
+                    bits[offset] = not bits[offset]
+                    cells[row][col] = bits[offset]
+                    modules.append((row, col))
+        self.matrix.codewords = bytes(self._stream)
+        return tuple(modules)
+
+
+class IncrementalRenderer(MatrixRenderer):
+    """
+    Rendu matriciel qui conserve son tampon de pixels entre deux rendus : après une
+    mise à jour du symbole, seuls les modules modifiés sont repeints.
+
+    Toutes les sorties de MatrixRenderer (PNG, flux, image PIL) partent du tampon
+    conservé ; la compression PNG porte toujours sur l'image entière.
+    """
+
+    def __init__(self, matrix, module_size=10, margin=4, color_background=(255, 255, 255), color_module=(0, 0, 0)):
+        """
+        Args:
+            matrix (EncodingMatrix): La matrice d'encodage à rendre (mise à jour en place)
+            module_size (int): Taille en pixels de chaque module (cellule)
+            margin (int): Marge en nombre de modules autour de la matrice
+            color_background (tuple): Couleur RGB de l'arrière-plan (blanc par défaut)
+            color_module (tuple): Couleur RGB des modules actifs (noir par défaut)
+        """
+        super().__init__(matrix, module_size, margin, color_background, color_module)
+        self.pixels = super()._pixel_indices()
+
+    def _pixel_indices(self):
+        """Retourne le tampon conservé (0 pour l'arrière-plan, 1 pour les modules actifs)."""
+        return self.pixels
+
+    def repaint(self, modules: Sequence[Tuple[int, int]]) -> List[Tuple[int, int, int, int]]:
+        """
+        Repeint des modules d'après l'état actuel de la matrice.
+
+        Args:
+            modules: Modules (ligne, colonne) à repeindre, par exemple SymbolUpdate.modules
+
+        Returns:
+            Zones repeintes (x, y, largeur, hauteur) en pixels, les modules voisins
+            d'une même ligne étant regroupés
+        """
+        cells = self.matrix.get_matrix()
+        step = self.module_size
+        modules = sorted(modules)
+        if not modules:
+            return []
+        rows, cols = zip(*modules)
+
+        # Vue (module, pixel, module, pixel) du tampon : une seule affectation indexée
+        total = self.pixels.shape[0] // step
+        view = self.pixels.reshape(total, step, total, step)
+        assert np.shares_memory(view, self.pixels)
+        view[np.add(rows, self.margin), :, np.add(cols, self.margin), :] = \
+            np.array([1 if cells[row][col] == 1 else 0 for row, col in modules], dtype=np.uint8)[:, None, None]
+
+        # Zones repeintes : modules consécutifs d'une même ligne regroupés
+        regions: List[List[int]] = []
+        for row, col in modules:
+            if regions and regions[-1][0] == row and regions[-1][1] + regions[-1][2] == col:
+                regions[-1][2] += 1
+            else:
+                regions.append([row, col, 1])
+        return [((col + self.margin) * step, (row + self.margin) * step, count * step, step)
+                for row, col, count in regions]
@@ -1,17 +1,48 @@
-from typing import List, Optional, Union, cast
-from encoder.data_encoder import DataEncoder, Version
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union, cast
+from .data_encoder import DataEncoder, Version
 
+# Taille (en modules) des marqueurs de position
+MARKER_SIZE = 7
 
 
+def _is_position_marker(row: int, col: int, size: int) -> bool:
+    """Vérifie si une cellule fait partie d'un des trois marqueurs de position."""
+    return (row < MARKER_SIZE and col < MARKER_SIZE) or \
+           (row < MARKER_SIZE and col >= size - MARKER_SIZE) or \
+           (row >= size - MARKER_SIZE and col < MARKER_SIZE)
 
 
+@lru_cache(maxsize=None)
+def data_positions(size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Positions (ligne, colonne) des modules de données dans l'ordre de placement :
+    colonnes deux par deux de droite à gauche, de bas en haut, hors marqueurs.
+    Partagé par l'encodeur et le décodeur.
+
+    Args:
+        size: Taille de la matrice
+
+    Returns:
+        Tuple des positions, dans l'ordre des bits
+    """
+    positions = []
+    for col in range(size - 1, -1, -2):
+        for row in range(size - 1, -1, -1):
+            for x in range(2):
+                current_col = col - x
+                if current_col >= 0 and not _is_position_marker(row, current_col, size):
+                    positions.append((row, current_col))
+    return tuple(positions)
+
 
 class EncodingMatrix:
     """
     Représente la matrice d'encodage pour un protocole graphique (type QR Code).
     """
 
-    def __init__(self, text: Optional[str] = None, size: Optional[int] = None, error_correction: str = 'M'):
+    def __init__(self, text: Optional[str] = None, size: Optional[int] = None, error_correction: str = 'M',
+                 compression: bool = False):
         """
         Initialise une matrice pour encoder un message.
         
@@ -19,14 +50,17 @@ class EncodingMatrix:
             text: Le texte à encoder. Si None, crée une matrice vide de taille donnée.
             size: Taille de la matrice. Requis si text est None.
             error_correction: Niveau de correction d'erreur ('L', 'M', 'Q', 'H')
+            compression: Compresse le texte (deflate) si cela réduit la taille du symbole
         """
         if text is None and size is None:
             raise ValueError("Soit text soit size doit être fourni")
             
         if text is not None:
-            # Encoder le texte et obtenir la version nécessaire
-            self.encoder = DataEncoder(text, error_correction=error_correction)
-            self.bits, self.version = self.encoder.encode()
+            # Encoder le texte (données et correction Reed-Solomon) et obtenir la version nécessaire
+            self.encoder = DataEncoder(text, error_correction=error_correction, compression=compression)
+            self.version = self.encoder.version
+            self.codewords = self.encoder.encode_codewords()
+            self.bits = [bool(byte >> (7 - i) & 1) for byte in self.codewords for i in range(8)]
             self.size = self.version.size
         else:
             size = cast(int, size)  # On sait que size n'est pas None ici
@@ -34,6 +68,7 @@ class EncodingMatrix:
                 raise ValueError("La taille de la matrice doit être au minimum 21.")
             self.size = size
             self.bits = []
+            self.codewords = b""
             self.version = Version(1, size, {})  # Version factice pour matrice vide
             
         # Initialiser la matrice avec None
@@ -48,7 +83,7 @@ class EncodingMatrix:
         """
         Ajoute les marqueurs de positionnement aux coins de la matrice.
         """
-        marker_size = 7
+        marker_size = MARKER_SIZE
         # Marqueur en haut à gauche
         self._draw_square(0, 0, marker_size)
         # Marqueur en haut à droite
@@ -71,26 +106,11 @@ class EncodingMatrix:
 
     def _place_data(self) -> None:
         """
-        Place les bits de données dans la matrice selon le motif en zigzag.
-        Pour l'instant, utilise un motif simple de gauche à droite, de bas en haut.
+        Place les bits des mots de code dans la matrice selon le motif en zigzag
+        (voir `data_positions`). Les quelques modules restants restent vides.
         """
-        if not self.bits:
-            return
-            
-        bit_index = 0
-        # Parcourir la matrice de bas en haut, de droite à gauche
-        for col in range(self.size - 1, -1, -2):  # Commencer par la dernière colonne
-            for row in range(self.size - 1, -1, -1):  # De bas en haut
-                for x in range(2):  # Traiter deux colonnes à la fois
-                    current_col = col - x
-                    if current_col < 0:
-                        continue
-                        
-                    # Vérifier si la cellule est disponible (pas un marqueur de position)
-                    if self.matrix[row][current_col] is None:
-                        if bit_index < len(self.bits):
-                            self.matrix[row][current_col] = self.bits[bit_index]
-                            bit_index += 1
+        for (row, col), bit in zip(data_positions(self.size), self.bits):
+            self.matrix[row][col] = bit
 
     def get_matrix(self) -> List[List[Optional[bool]]]:
         """
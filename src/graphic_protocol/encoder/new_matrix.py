@@ -0,0 +1,160 @@
+from typing import Final, Iterator, Literal
+from ..core.matrix import BitMatrix, BitRow, Matrix
+from .data_encoder import DataEncoder, Version
+from .matrix import data_positions
+
+
+class EncodingMatrix(Matrix[bool]):
+    """
+    Encoding matrix built lazily on first access and cached.
+
+    Cheap metadata (version, size, bit count) only runs the mode/version selection
+    of `DataEncoder`; the symbol itself is built once, on the first cell access,
+    and rebuilt only after one of its inputs (text, size, error correction) changes.
+    """
+
+    MARKER_SIZE: Final[int] = 7
+    MIN_SIZE: Final[int] = 21
+
+    def __init__(self, 
+                 text: str,
+                 size: int | None = None,
+                 error_correction: Literal['L', 'M', 'Q', 'H'] = 'M') -> None:
+        self._text = text
+        self._size = self._check_size(size)
+        self._error_correction = error_correction
+
+        self._encoder: DataEncoder | None = None
+        self._matrix: BitMatrix | None = None
+
+    @classmethod
+    def _check_size(cls, size: int | None) -> int | None:
+        if size is not None and size < cls.MIN_SIZE:
+            raise ValueError(f"Matrix size must be at least {cls.MIN_SIZE}")
+        # The decoder derives the block layout from the size: only version sizes are readable
+        if size is not None and Version.CAPACITIES[Version.number_for_size(size)][0] != size:
+            raise ValueError(f"Matrix size {size} does not match any version")
+        return size
+
+    def _invalidate(self) -> None:
+        self._encoder = None
+        self._matrix = None
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        if text != self._text:
+            self._text = text
+            self._invalidate()
+
+    @property
+    def error_correction(self) -> Literal['L', 'M', 'Q', 'H']:
+        return self._error_correction
+
+    @error_correction.setter
+    def error_correction(self, error_correction: Literal['L', 'M', 'Q', 'H']) -> None:
+        if error_correction != self._error_correction:
+            self._error_correction = error_correction
+            self._invalidate()
+
+    @property
+    def size(self) -> int:
+        """Returns the explicit size, or the size of the smallest fitting version."""
+        if self._size is not None:
+            return self._size
+        return self.version.size
+
+    @size.setter
+    def size(self, size: int | None) -> None:
+        size = self._check_size(size)
+        if size != self._size:
+            self._size = size
+            self._invalidate()
+
+    @property
+    def encoder(self) -> DataEncoder:
+        """Encodes for the version matching the explicit size, or the smallest fitting one."""
+        if self._encoder is None:
+            version_number = Version.number_for_size(self._size) if self._size is not None else None
+            self._encoder = DataEncoder(self._text, error_correction=self._error_correction,
+                                        version_number=version_number)
+        return self._encoder
+
+    @property
+    def version(self) -> Version:
+        return self.encoder.version
+
+    @property
+    def bit_count(self) -> int:
+        """Returns the number of data bits, without building the symbol."""
+        return self.encoder.bit_count
+
+    @property
+    def is_built(self) -> bool:
+        return self._matrix is not None
+
+    def _add_position_markers(self) -> None:
+        # Top-left marker
+        self._draw_square(0, 0, self.MARKER_SIZE)
+
+        # Top-right marker
+        self._draw_square(0, self.size - self.MARKER_SIZE, self.MARKER_SIZE)
+
+        # Bottom-left marker
+        self._draw_square(self.size - self.MARKER_SIZE, 0, self.MARKER_SIZE)
+
+    def _draw_square(self, row_start: int, col_start: int, square_size: int) -> None:
+        matrix = self._matrix
+        assert matrix is not None
+        matrix.fill_region(row_start, col_start, square_size, square_size, True)
+        matrix.fill_region(row_start + 1, col_start + 1, square_size - 2, square_size - 2, False)
+        matrix.fill_region(row_start + 2, col_start + 2, square_size - 4, square_size - 4, True)
+
+    def _place_data(self) -> None:
+        matrix = self._matrix
+        assert matrix is not None
+        codewords = self.encoder.encode_codewords()
+        size = self.size
+
+        positions = data_positions(size)
+        if len(codewords) * 8 > len(positions):
+            raise ValueError(f"{len(codewords) * 8} bits do not fit in a {size}x{size} matrix")
+        # Same zigzag order as the list-based matrix, so both decode identically
+        for index, (row, col) in enumerate(positions[:len(codewords) * 8]):
+            if codewords[index >> 3] >> (7 - (index & 7)) & 1:
+                matrix[row, col] = True
+
+    @property
+    def _value(self) -> BitMatrix:
+        if self._matrix is None:
+            self._matrix = BitMatrix(self.size, self.size)
+            try:
+                self._add_position_markers()
+                self._place_data()
+            except ValueError:
+                self._matrix = None
+                raise
+        return self._matrix
+
+    @property
+    def rows(self) -> int:
+        return self.size
+
+    @property
+    def cols(self) -> int:
+        return self.size
+
+    def __getitem__(self, key: tuple[int, int]) -> bool:
+        return self._value[key]
+
+    def __iter__(self) -> Iterator[BitRow]:
+        return iter(self._value)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __str__(self) -> str:
+        return "\n".join("".join("1" if cell else "0" for cell in row) for row in self._value) + "\n"
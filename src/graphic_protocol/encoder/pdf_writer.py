@@ -0,0 +1,167 @@
+import zlib
+from typing import BinaryIO, List
+
+
+class PdfWriter:
+    """
+    Écrivain PDF minimal, en flux : chaque page est écrite dans le flux dès
+    qu'elle est ajoutée, seule la table des références croisées reste en mémoire.
+    """
+
+    # Numéros d'objets réservés au catalogue et à l'arbre des pages
+    _CATALOG = 1
+    _PAGES = 2
+
+    def __init__(self, stream: BinaryIO, compress: bool = True):
+        """
+        Args:
+            stream: Flux binaire accessible en écriture
+            compress: Compresse les flux de contenu (FlateDecode)
+        """
+        self.stream = stream
+        self.compress = compress
+        self._offsets = {}
+        self._pages: List[int] = []
+        self._next_object = 3
+        self._position = 0
+        self._closed = False
+        self._write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self._position += len(data)
+
+    def _write_object(self, number: int, body: bytes) -> None:
+        self._offsets[number] = self._position
+        self._write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    def _allocate(self) -> int:
+        number = self._next_object
+        self._next_object += 1
+        return number
+
+    def add_page(self, width: float, height: float, content: bytes, resources: bytes = b"<< >>") -> None:
+        """
+        Ajoute une page et l'écrit immédiatement dans le flux.
+
+        Args:
+            width: Largeur de la page en points
+            height: Hauteur de la page en points
+            content: Flux de contenu PDF (opérateurs de dessin)
+            resources: Dictionnaire de ressources de la page (polices...)
+        """
+        if self._closed:
+            raise ValueError("Le document PDF est déjà fermé")
+
+        content_number = self._allocate()
+        page_number = self._allocate()
+
+        if self.compress:
+            data = zlib.compress(content, 9)
+            header = b"<< /Length %d /Filter /FlateDecode >>" % len(data)
+        else:
+            data = content
+            header = b"<< /Length %d >>" % len(data)
+        self._write_object(content_number, header + b"\nstream\n" + data + b"\nendstream")
+
+        self._write_object(
+            page_number,
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %s %s] /Contents %d 0 R /Resources %s >>"
+            % (self._PAGES, _number(width), _number(height), content_number, resources),
+        )
+        self._pages.append(page_number)
+
+    def close(self) -> None:
+        """Écrit l'arbre des pages, le catalogue et la table des références croisées."""
+        if self._closed:
+            return
+        self._closed = True
+
+        kids = b" ".join(b"%d 0 R" % number for number in self._pages)
+        self._write_object(self._PAGES, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._pages)))
+        self._write_object(self._CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self._PAGES)
+
+        xref_position = self._position
+        count = self._next_object
+        lines = [b"xref\n0 %d\n" % count, b"0000000000 65535 f \n"]
+        for number in range(1, count):
+            lines.append(b"%010d 00000 n \n" % self._offsets[number])
+        self._write(b"".join(lines))
+        self._write(
+            b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+            % (count, self._CATALOG, xref_position)
+        )
+
+    def __enter__(self) -> "PdfWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Sur exception, le document reste inachevé (sans table des références
+        # croisées) : un lecteur le rejette au lieu d'afficher un PDF tronqué
+        if exc_type is None:
+            self.close()
+
+
+def _number(value: float) -> bytes:
+    """Formate un nombre PDF sans zéros inutiles."""
+    return (b"%.4f" % value).rstrip(b"0").rstrip(b".")
+
+
+def rgb_operator(color, stroke: bool = False) -> bytes:
+    """
+    Convertit une couleur RGB (0-255) en opérateur PDF `rg` (ou `RG`).
+
+    Args:
+        color: Tuple (r, g, b)
+        stroke: Couleur de trait au lieu de remplissage
+
+    Returns:
+        bytes: Opérateur PDF
+    """
+    r, g, b = (_number(component / 255) for component in color)
+    return b"%s %s %s %s" % (r, g, b, b"RG" if stroke else b"rg")
+
+
+def rectangles_operator(rects, scale: float, page_height: float, offset_x: float = 0, offset_y: float = 0) -> bytes:
+    """
+    Convertit des rectangles en modules (ligne, colonne, hauteur, largeur) en
+    opérateurs `re`, l'origine PDF étant en bas à gauche.
+
+    Args:
+        rects: Itérable de tuples (ligne, colonne, hauteur, largeur)
+        scale: Taille d'un module en points
+        page_height: Hauteur de la page en points
+        offset_x: Décalage horizontal en points
+        offset_y: Décalage vertical (depuis le haut) en points
+
+    Returns:
+        bytes: Opérateurs PDF (sans remplissage final)
+    """
+    parts = []
+    for row, col, height, width in rects:
+        x = offset_x + col * scale
+        y = page_height - offset_y - (row + height) * scale
+        parts.append(b"%s %s %s %s re\n" % (_number(x), _number(y), _number(width * scale), _number(height * scale)))
+    return b"".join(parts)
+
+
+# Police standard (Helvetica) déclarée directement dans les ressources de page
+HELVETICA_RESOURCES = b"<< /Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >> >>"
+
+
+def text_operator(text: str, x: float, y: float, font_size: float) -> bytes:
+    """
+    Construit les opérateurs d'affichage d'une ligne de texte en Helvetica (/F1).
+
+    Args:
+        text: Texte à afficher (les caractères hors Latin-1 sont remplacés)
+        x: Abscisse de la ligne de base en points
+        y: Ordonnée de la ligne de base en points (origine en bas)
+        font_size: Corps en points
+
+    Returns:
+        bytes: Opérateurs PDF
+    """
+    raw = text.encode("latin-1", "replace")
+    escaped = raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"BT /F1 %s Tf %s %s Td (%s) Tj ET\n" % (_number(font_size), _number(x), _number(y), escaped)
@@ -0,0 +1,113 @@
+import struct
+import zlib
+from typing import BinaryIO, Optional, Sequence, Tuple
+from ..core.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+# Filtres PNG supportés (appliqués identiquement à toutes les lignes)
+PNG_FILTERS = {"none": 0, "sub": 1, "up": 2}
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Construit un bloc PNG (longueur, type, données, CRC)."""
+    crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def _bit_depth_for(color_count: int) -> int:
+    """Plus petite profondeur PNG (1, 2, 4 ou 8 bits) capable d'indexer `color_count` couleurs."""
+    for depth in (1, 2, 4, 8):
+        if color_count <= 1 << depth:
+            return depth
+    raise ValueError("Une palette PNG contient au plus 256 couleurs")
+
+
+def _pack_rows(pixels, bit_depth: int):
+    """Regroupe les pixels de chaque ligne sur `bit_depth` bits (poids fort en premier)."""
+    if bit_depth == 8:
+        return np.ascontiguousarray(pixels, dtype=np.uint8)
+    if bit_depth == 1:
+        return np.packbits(pixels.astype(bool), axis=1)
+
+    per_byte = 8 // bit_depth
+    height, width = pixels.shape
+    padded_width = -(-width // per_byte) * per_byte
+    padded = np.zeros((height, padded_width), dtype=np.uint8)
+    padded[:, :width] = pixels
+    shifts = np.arange(per_byte - 1, -1, -1, dtype=np.uint8) * bit_depth
+    grouped = padded.reshape(height, padded_width // per_byte, per_byte) << shifts
+    return np.bitwise_or.reduce(grouped, axis=2).astype(np.uint8)
+
+
+def _filter_rows(rows, png_filter: str):
+    """Applique le filtre PNG demandé et préfixe chaque ligne de son type de filtre."""
+    if png_filter not in PNG_FILTERS:
+        raise ValueError(f"Filtre PNG non supporté: {png_filter} (attendu: {', '.join(PNG_FILTERS)})")
+
+    filtered = rows.copy()
+    # Les soustractions uint8 bouclent modulo 256, comme l'exige la norme
+    if png_filter == "sub":
+        filtered[:, 1:] -= rows[:, :-1]
+    elif png_filter == "up":
+        filtered[1:] -= rows[:-1]
+
+    filter_column = np.full((rows.shape[0], 1), PNG_FILTERS[png_filter], dtype=np.uint8)
+    return np.hstack((filter_column, filtered))
+
+
+def encode_png(pixels,
+               palette: Optional[Sequence[Tuple[int, int, int]]] = None,
+               bit_depth: Optional[int] = None,
+               compress_level: int = 6,
+               png_filter: str = "none") -> bytes:
+    """
+    Encode un tableau de pixels en PNG indexé (palette) ou en niveaux de gris.
+
+    Args:
+        pixels: Tableau 2D uint8 (indices de palette, ou niveaux de gris si palette est None)
+        palette: Couleurs RGB de la palette (None pour une image en niveaux de gris)
+        bit_depth: Profondeur en bits. Par défaut : la plus petite adaptée à la palette,
+                   ou 8 bits en niveaux de gris.
+        compress_level: Niveau de compression zlib (0-9)
+        png_filter: Filtre appliqué aux lignes ('none', 'sub' ou 'up')
+
+    Returns:
+        bytes: Fichier PNG complet
+    """
+    height, width = pixels.shape
+    if palette is not None:
+        color_type = 3
+        depth = bit_depth or _bit_depth_for(len(palette))
+    else:
+        color_type = 0
+        depth = bit_depth or 8
+
+    rows = _filter_rows(_pack_rows(pixels, depth), png_filter)
+
+    header = struct.pack(">IIBBBBB", width, height, depth, color_type, 0, 0, 0)
+    parts = [_SIGNATURE, _chunk(b"IHDR", header)]
+    if palette is not None:
+        parts.append(_chunk(b"PLTE", b"".join(bytes(color) for color in palette)))
+    parts.append(_chunk(b"IDAT", zlib.compress(rows.tobytes(), compress_level)))
+    parts.append(_chunk(b"IEND", b""))
+    return b"".join(parts)
+
+
+def write_png(stream: BinaryIO, pixels, **kwargs) -> int:
+    """
+    Écrit un PNG dans un flux binaire.
+
+    Args:
+        stream: Flux accessible en écriture
+        pixels: Tableau 2D uint8 (voir `encode_png`)
+        **kwargs: Options de `encode_png`
+
+    Returns:
+        int: Nombre d'octets écrits
+    """
+    data = encode_png(pixels, **kwargs)
+    stream.write(data)
+    return len(data)
@@ -0,0 +1,133 @@
+import io
+import os
+from ..core.lazy import lazy_import
+from .matrix import EncodingMatrix
+from .png_writer import write_png
+
+# Chargés au premier rendu matriciel seulement
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+
+class MatrixRenderer:
+    """
+    Classe qui génère une image à partir d'une matrice d'encodage (EncodingMatrix)
+    et la sauvegarde dans un dossier output, un flux ou un tampon mémoire.
+    """
+
+    def __init__(self, matrix, module_size=10, margin=4, color_background=(255, 255, 255), color_module=(0, 0, 0)):
+        """
+        Initialise le renderer avec une matrice et des paramètres de rendu.
+
+        Args:
+            matrix (EncodingMatrix): La matrice d'encodage à rendre
+            module_size (int): Taille en pixels de chaque module (cellule)
+            margin (int): Marge en nombre de modules autour de la matrice
+            color_background (tuple): Couleur RGB de l'arrière-plan (blanc par défaut)
+            color_module (tuple): Couleur RGB des modules actifs (noir par défaut)
+        """
+        if not isinstance(matrix, EncodingMatrix):
+            raise TypeError("Le paramètre 'matrix' doit être une instance de EncodingMatrix")
+
+        self.matrix = matrix
+        self.module_size = module_size
+        self.margin = margin
+        self.color_background = color_background
+        self.color_module = color_module
+
+    def _pixel_indices(self):
+        """
+        Construit le tableau des pixels de l'image : 0 pour l'arrière-plan, 1 pour
+        les modules actifs.
+
+        Returns:
+            numpy.ndarray: Tableau uint8 de taille (matrix_size + 2 * margin) * module_size
+        """
+        matrix_data = self.matrix.get_matrix()
+        matrix_size = len(matrix_data)
+        total = matrix_size + 2 * self.margin
+
+        modules = np.zeros((total, total), dtype=np.uint8)
+        modules[self.margin:self.margin + matrix_size, self.margin:self.margin + matrix_size] = [
+            [1 if cell == 1 else 0 for cell in row] for row in matrix_data
+        ]
+        return np.repeat(np.repeat(modules, self.module_size, axis=0), self.module_size, axis=1)
+
+    def render_to_stream(self, stream, compress_level=6, png_filter="none"):
+        """
+        Écrit l'image PNG dans un flux binaire fourni par l'appelant.
+
+        L'image est un PNG à palette de 1 bit par pixel, bien plus compact qu'un
+        PNG RGB 24 bits pour un symbole bicolore.
+
+        Args:
+            stream: Flux binaire accessible en écriture (fichier, BytesIO, socket...)
+            compress_level (int): Niveau de compression zlib (0-9)
+            png_filter (str): Filtre PNG des lignes ('none', 'sub' ou 'up')
+
+        Returns:
+            int: Nombre d'octets écrits
+        """
+        return write_png(
+            stream,
+            self._pixel_indices(),
+            palette=(self.color_background, self.color_module),
+            compress_level=compress_level,
+            png_filter=png_filter,
+        )
+
+    def render_to_bytes(self, compress_level=6, png_filter="none"):
+        """
+        Génère l'image PNG en mémoire.
+
+        Args:
+            compress_level (int): Niveau de compression zlib (0-9)
+            png_filter (str): Filtre PNG des lignes ('none', 'sub' ou 'up')
+
+        Returns:
+            bytes: Contenu du fichier PNG
+        """
+        buffer = io.BytesIO()
+        self.render_to_stream(buffer, compress_level=compress_level, png_filter=png_filter)
+        return buffer.getvalue()
+
+    def render(self, filename=None, output_dir="output", compress_level=6, png_filter="none"):
+        """
+        Génère une image à partir de la matrice et la sauvegarde dans le dossier output.
+
+        Args:
+            filename (str, optional): Nom du fichier de sortie (sans extension). Si non fourni,
+                                     un nom par défaut sera généré.
+            output_dir (str): Chemin du dossier de sortie (relatif ou absolu)
+            compress_level (int): Niveau de compression zlib (0-9)
+            png_filter (str): Filtre PNG des lignes ('none', 'sub' ou 'up')
+
+        Returns:
+            str: Chemin complet du fichier sauvegardé
+        """
+        matrix_size = len(self.matrix.get_matrix())
+
+        # Création du dossier output s'il n'existe pas
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Génération du nom de fichier s'il n'est pas fourni
+        if filename is None:
+            filename = f"matrix_{matrix_size}x{matrix_size}"
+
+        # Chemin complet du fichier
+        file_path = os.path.join(output_dir, f"{filename}.png")
+
+        # Sauvegarde de l'image
+        with open(file_path, "wb") as f:
+            self.render_to_stream(f, compress_level=compress_level, png_filter=png_filter)
+
+        return file_path
+
+    def render_to_image(self):
+        """
+        Génère une image PIL à partir de la matrice sans la sauvegarder.
+
+        Returns:
+            PIL.Image: L'image générée
+        """
+        palette = np.array([self.color_background, self.color_module], dtype=np.uint8)
+        return Image.fromarray(palette[self._pixel_indices()], "RGB")
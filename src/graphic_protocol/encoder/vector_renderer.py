@@ -0,0 +1,156 @@
+import io
+import os
+from typing import List, Sequence, Tuple
+from .renderer import MatrixRenderer
+from .pdf_writer import PdfWriter, rgb_operator, rectangles_operator
+
+
+def merge_module_runs(matrix_data: Sequence[Sequence]) -> List[Tuple[int, int, int, int]]:
+    """
+    Regroupe les modules actifs en rectangles : les séries horizontales sont
+    d'abord fusionnées, puis les séries identiques de lignes consécutives.
+
+    Args:
+        matrix_data: Matrice (liste de lignes), un module est actif s'il vaut 1/True
+
+    Returns:
+        Liste de tuples (ligne, colonne, hauteur, largeur) en modules
+    """
+    rects: List[Tuple[int, int, int, int]] = []
+    # Rectangles encore extensibles vers le bas, indexés par (colonne, largeur)
+    open_rects = {}
+
+    for i, row in enumerate(matrix_data):
+        runs = []
+        j = 0
+        cols = len(row)
+        while j < cols:
+            if row[j] == 1:
+                start = j
+                while j < cols and row[j] == 1:
+                    j += 1
+                runs.append((start, j - start))
+            else:
+                j += 1
+
+        next_open = {}
+        for run in runs:
+            if run in open_rects:
+                top, height = open_rects.pop(run)
+                next_open[run] = (top, height + 1)
+            else:
+                next_open[run] = (i, 1)
+        for (col, width), (top, height) in open_rects.items():
+            rects.append((top, col, height, width))
+        open_rects = next_open
+
+    for (col, width), (top, height) in open_rects.items():
+        rects.append((top, col, height, width))
+    return rects
+
+
+def _hex_color(color) -> str:
+    """Convertit une couleur RGB en notation hexadécimale SVG."""
+    return "#{:02x}{:02x}{:02x}".format(*color)
+
+
+class VectorRenderer(MatrixRenderer):
+    """
+    Classe qui génère une image vectorielle (SVG ou PDF) à partir d'une matrice d'encodage.
+
+    Les modules actifs sont fusionnés en rectangles : le temps de rendu et la taille
+    du fichier dépendent du nombre de séries, pas du nombre de pixels. Les paramètres
+    (module_size, margin, couleurs) sont ceux du rendu matriciel.
+    """
+
+    FORMATS = ("svg", "pdf")
+
+    def _rects(self) -> List[Tuple[int, int, int, int]]:
+        return merge_module_runs(self.matrix.get_matrix())
+
+    def _total_size(self) -> int:
+        """Taille totale en modules, marges comprises."""
+        return len(self.matrix.get_matrix()) + 2 * self.margin
+
+    def to_svg(self) -> str:
+        """
+        Génère le document SVG.
+
+        Returns:
+            str: Document SVG (un seul chemin pour l'ensemble des modules)
+        """
+        total = self._total_size()
+        pixels = total * self.module_size
+        path = "".join(
+            f"M{col + self.margin} {row + self.margin}h{width}v{height}h-{width}z"
+            for row, col, height, width in self._rects()
+        )
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{pixels}" height="{pixels}" '
+            f'viewBox="0 0 {total} {total}" shape-rendering="crispEdges">'
+            f'<rect width="{total}" height="{total}" fill="{_hex_color(self.color_background)}"/>'
+            f'<path fill="{_hex_color(self.color_module)}" d="{path}"/>'
+            f'</svg>\n'
+        )
+
+    def page_content(self) -> bytes:
+        """
+        Génère le flux de contenu PDF de la page (fond puis modules).
+
+        Returns:
+            bytes: Opérateurs PDF
+        """
+        size = self._total_size() * self.module_size
+        offset = self.margin * self.module_size
+        return (
+            rgb_operator(self.color_background) + b"\n"
+            + b"0 0 %d %d re f\n" % (size, size)
+            + rgb_operator(self.color_module) + b"\n"
+            + rectangles_operator(self._rects(), self.module_size, size, offset, offset)
+            + b"f\n"
+        )
+
+    def to_pdf(self) -> bytes:
+        """
+        Génère un document PDF d'une page (un module_size vaut un point).
+
+        Returns:
+            bytes: Document PDF
+        """
+        buffer = io.BytesIO()
+        size = self._total_size() * self.module_size
+        with PdfWriter(buffer) as writer:
+            writer.add_page(size, size, self.page_content())
+        return buffer.getvalue()
+
+    def render(self, filename=None, output_dir="output", format="svg"):
+        """
+        Génère le document vectoriel et le sauvegarde dans le dossier output.
+
+        Args:
+            filename (str, optional): Nom du fichier de sortie (sans extension). Si non fourni,
+                                     un nom par défaut sera généré.
+            output_dir (str): Chemin du dossier de sortie (relatif ou absolu)
+            format (str): 'svg' ou 'pdf'
+
+        Returns:
+            str: Chemin complet du fichier sauvegardé
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Format non supporté: {format} (attendu: {', '.join(self.FORMATS)})")
+
+        os.makedirs(output_dir, exist_ok=True)
+
+        if filename is None:
+            matrix_size = len(self.matrix.get_matrix())
+            filename = f"matrix_{matrix_size}x{matrix_size}"
+
+        file_path = os.path.join(output_dir, f"{filename}.{format}")
+        if format == "svg":
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(self.to_svg())
+        else:
+            with open(file_path, "wb") as f:
+                f.write(self.to_pdf())
+
+        return file_path
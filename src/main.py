@@ -7,8 +7,8 @@ Ce fichier contient un exemple d'utilisation des classes EncodingMatrix et Matri
 """
 
 import os
-from encoder.matrix import EncodingMatrix
-from encoder.renderer import MatrixRenderer
+from graphic_protocol.encoder.matrix import EncodingMatrix
+from graphic_protocol.encoder.renderer import MatrixRenderer
 
 def main():
     """
@@ -0,0 +1,113 @@
+import unittest
+import json
+import os
+import shutil
+import numpy as np
+from click.testing import CliRunner
+from src.graphic_protocol.cli import cli
+
+class TestCli(unittest.TestCase):
+    """
+    Tests unitaires de l'interface en ligne de commande.
+    """
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.runner = CliRunner()
+        self.test_output_dir = "test_output"
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def _lines(self, output: str) -> list:
+        return [json.loads(line) for line in output.splitlines() if line.strip()]
+
+    def test_encode_single(self):
+        """Test de l'encodage d'un message passé en argument."""
+        result = self.runner.invoke(cli, ["encode", "Bonjour", "-o", self.test_output_dir, "--format", "svg"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        [line] = self._lines(result.output)
+        self.assertEqual(line["index"], 0)
+        self.assertTrue(os.path.exists(line["path"]))
+        self.assertTrue(line["path"].endswith(".svg"))
+
+    def test_encode_non_latin1(self):
+        """Test qu'un texte hors Latin-1 est refusé sans --compress et relu à l'identique avec."""
+        result = self.runner.invoke(cli, ["encode", "日本語", "-o", self.test_output_dir])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("error", self._lines(result.output)[0])
+
+        result = self.runner.invoke(cli, ["encode", "日本語", "--compress", "-o", self.test_output_dir])
+        self.assertEqual(result.exit_code, 0, result.output)
+        [line] = self._lines(result.output)
+        result = self.runner.invoke(cli, ["decode", line["path"], "--no-progress"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self._lines(result.output)[0]["text"], "日本語")
+
+    def test_encode_stdin_parallel_ordered(self):
+        """Test de l'encodage d'un flux stdin sur plusieurs processus, dans l'ordre."""
+        texts = [f"message {i}" for i in range(20)]
+        result = self.runner.invoke(
+            cli, ["encode", "-o", self.test_output_dir, "--workers", "2", "--no-progress"],
+            input="\n".join(texts) + "\n",
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        lines = self._lines(result.output)
+        self.assertEqual([line["index"] for line in lines], list(range(20)))
+        self.assertTrue(all(os.path.exists(line["path"]) for line in lines))
+
+    def test_encode_jsonl_ids(self):
+        """Test que l'identifiant JSONL est repris dans le résultat et le nom de fichier."""
+        items = [{"id": "ticket/1", "text": "A"}, {"id": "ticket/2", "text": "B"}]
+        result = self.runner.invoke(
+            cli, ["encode", "--jsonl", "-o", self.test_output_dir, "--unordered", "--no-progress"],
+            input="\n".join(json.dumps(item) for item in items),
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        lines = sorted(self._lines(result.output), key=lambda line: line["index"])
+        self.assertEqual([line["id"] for line in lines], ["ticket/1", "ticket/2"])
+        self.assertTrue(lines[0]["path"].endswith("ticket_1.png"))
+
+    def test_encode_jsonl_malformed_line(self):
+        """Test qu'une ligne JSONL invalide donne un message d'erreur avec son numéro, sans trace."""
+        for bad_line in ('{"text": "B"', '"texte seul"', '{"id": 3}'):
+            result = self.runner.invoke(
+                cli, ["encode", "--jsonl", "-o", self.test_output_dir, "--no-progress"],
+                input='{"text": "A"}\n' + bad_line + "\n",
+            )
+            self.assertEqual(result.exit_code, 1, result.output)
+            self.assertIsInstance(result.exception, SystemExit)
+            self.assertIn("Ligne 2", result.output)
+
+    def test_decode_reports_errors(self):
+        """Test qu'une image illisible produit une ligne d'erreur et un code de sortie non nul."""
+        result = self.runner.invoke(cli, ["decode", "introuvable.png", "--no-progress"])
+        self.assertEqual(result.exit_code, 1)
+        [line] = self._lines(result.output)
+        self.assertEqual(line["path"], "introuvable.png")
+        self.assertIn("error", line)
+
+    def test_decode_tiled(self):
+        """Test du décodage par tuiles : tous les symboles d'un scan avec leur position."""
+        from src.graphic_protocol.encoder.matrix import EncodingMatrix
+        from src.graphic_protocol.encoder.atlas import AtlasRenderer, SheetLayout
+
+        layout = SheetLayout(page_size=(100, 60), dpi=200)
+        texts = [f"lot {i}" for i in range(layout.per_page)]
+        page = next(AtlasRenderer(layout).iter_pages(EncodingMatrix(text=t) for t in texts))
+        os.makedirs(self.test_output_dir)
+        path = os.path.join(self.test_output_dir, "scan.npy")
+        np.save(path, (255 - 255 * page).astype(np.uint8))
+
+        result = self.runner.invoke(cli, ["decode", "--tiled", "--tile-size", "400", "--tile-overlap", "200",
+                                          path, "--no-progress"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        [line] = self._lines(result.output)
+        self.assertEqual(sorted(symbol["text"] for symbol in line["symbols"]), sorted(texts))
+        self.assertTrue(all({"x", "y", "width", "height"} <= set(symbol) for symbol in line["symbols"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
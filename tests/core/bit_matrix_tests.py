@@ -0,0 +1,89 @@
+import unittest
+import random
+import sys
+import numpy as np
+from src.graphic_protocol.core.matrix import BitMatrix, ListMatrix, Matrix, MutableMatrix
+
+class TestBitMatrix(unittest.TestCase):
+    """Unit tests for the packed BitMatrix implementation."""
+
+    def setUp(self):
+        rng = random.Random(0)
+        self.data = [[rng.random() < 0.5 for _ in range(21)] for _ in range(19)]
+        self.matrix = BitMatrix.from_nested_lists(self.data)
+
+    def test_satisfies_protocols(self):
+        """BitMatrix implements both Matrix and MutableMatrix."""
+        self.assertIsInstance(self.matrix, Matrix)
+        self.assertIsInstance(self.matrix, MutableMatrix)
+
+    def test_get_and_set(self):
+        """Cells round-trip through the packed buffer."""
+        for i, row in enumerate(self.data):
+            for j, cell in enumerate(row):
+                self.assertEqual(self.matrix[i, j], cell)
+        self.matrix[3, 20] = not self.data[3][20]
+        self.assertEqual(self.matrix[3, 20], not self.data[3][20])
+        with self.assertRaises(IndexError):
+            self.matrix[19, 0]
+
+    def test_row_view_does_not_copy(self):
+        """Writes through a row view are visible in the matrix."""
+        row = self.matrix.row(5)
+        self.assertEqual(list(row), self.data[5])
+        row[7] = not self.data[5][7]
+        self.assertEqual(self.matrix[5, 7], not self.data[5][7])
+
+    def test_fill_and_copy_region(self):
+        """Bulk region operations match a cell-by-cell reference."""
+        self.matrix.fill_region(2, 3, 4, 11, True)
+        target = BitMatrix(19, 21)
+        target.copy_region(self.matrix, 1, 2, 6, 13, dst_row=10, dst_col=5)
+        for i in range(6):
+            for j in range(13):
+                self.assertEqual(target[10 + i, 5 + j], self.matrix[1 + i, 2 + j])
+        self.assertEqual(target.popcount(), sum(self.matrix[1 + i, 2 + j] for i in range(6) for j in range(13)))
+
+    def test_xor_and_popcount(self):
+        """XOR with a mask flips exactly the masked cells."""
+        mask = BitMatrix(19, 21)
+        mask.fill_region(0, 0, 19, 21, True)
+        inverted = self.matrix ^ mask
+        self.assertEqual(inverted.popcount(), 19 * 21 - self.matrix.popcount())
+        inverted ^= mask
+        self.assertEqual(inverted, self.matrix)
+        self.assertEqual(hash(inverted), hash(self.matrix))
+
+    def test_numpy_export(self):
+        """Packed export shares memory, unpacked export matches the cells."""
+        packed = self.matrix.to_numpy()
+        self.assertTrue(np.shares_memory(packed, np.frombuffer(self.matrix._buffer, dtype=np.uint8)))
+        np.testing.assert_array_equal(self.matrix.to_numpy(packed=False), np.array(self.data))
+        self.assertEqual(BitMatrix.from_numpy(np.array(self.data)), self.matrix)
+
+    def test_resize_and_clear(self):
+        """Resize keeps the overlapping region and fills the rest."""
+        self.matrix.resize(25, 10, fill_value=True)
+        self.assertEqual((self.matrix.rows, self.matrix.cols), (25, 10))
+        self.assertEqual(self.matrix[0, 9], self.data[0][9])
+        self.assertTrue(self.matrix[24, 0])
+        self.matrix.clear()
+        self.assertEqual(self.matrix.popcount(), 0)
+
+    def test_memory_use(self):
+        """Packed storage uses a byte per eight cells, a small fraction of nested lists."""
+        rng = random.Random(1)
+        data = [[rng.random() < 0.5 for _ in range(177)] for _ in range(177)]
+        packed = BitMatrix.from_nested_lists(data)
+        self.assertEqual(packed.nbytes, 177 * 23)
+
+        # Footprint of ListMatrix: outer list, row lists and each distinct cell object
+        rows = ListMatrix.from_nested_lists(data)._data
+        cells = {id(cell): cell for row in rows for cell in row}
+        footprint = (sys.getsizeof(rows) + sum(sys.getsizeof(row) for row in rows)
+                     + sum(sys.getsizeof(cell) for cell in cells.values()))
+        self.assertLess(packed.nbytes * 32, footprint)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+import os
+import shutil
+import cv2
+import numpy as np
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.renderer import MatrixRenderer
+from src.graphic_protocol.decoder.image_detector import ImageDetector
+from src.graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+class TestImageDetectorFastPath(unittest.TestCase):
+    """
+    Tests unitaires de la voie rapide du détecteur (symboles rendus numériquement).
+    """
+
+    TEXT = "Voie rapide du détecteur"
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.matrix = EncodingMatrix(text=self.TEXT, error_correction='M')
+        self.expected = np.array([[1 if cell == 1 else 0 for cell in row] for row in self.matrix.get_matrix()])
+        self.test_output_dir = "test_output"
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def _render(self, **kwargs) -> np.ndarray:
+        return np.asarray(MatrixRenderer(self.matrix, **kwargs).render_to_image())[:, :, ::-1].copy()
+
+    def test_fast_path_extracts_modules(self):
+        """Test que la voie rapide retrouve exactement les modules, quels que soient taille et marge."""
+        detector = ImageDetector()
+        for module_size, margin in ((1, 4), (3, 1), (10, 4), (7, 8)):
+            image = self._render(module_size=module_size, margin=margin)
+            gray = image[:, :, 0]
+            self.assertEqual(detector._detect_axis_aligned(gray), (margin * module_size, margin * module_size,
+                                                                  module_size, self.matrix.size))
+            matrix, confidence = detector.detect_with_confidence(gray)
+            np.testing.assert_array_equal(matrix, self.expected)
+            self.assertTrue((confidence > 0.9).all())
+            # Découpage à pas constant : aucune image intégrale n'est calculée
+            self.assertFalse(detector._frames[gray.shape].integral_ready)
+
+    def test_round_trip_from_file(self):
+        """Test d'un aller-retour fichier PNG -> texte."""
+        path = MatrixRenderer(self.matrix).render(output_dir=self.test_output_dir)
+        matrix = ImageDetector().detect_from_image(path)
+        self.assertEqual(MatrixDecoder().decode(matrix), self.TEXT)
+
+    def test_fallback_on_rotation(self):
+        """Test que la voie rapide refuse un symbole tourné."""
+        image = cv2.rotate(self._render(), cv2.ROTATE_90_CLOCKWISE)
+        self.assertIsNone(ImageDetector()._detect_axis_aligned(image[:, :, 0]))
+
+    def test_fallback_without_quiet_zone(self):
+        """Test que la voie rapide refuse un symbole sans zone de silence."""
+        image = self._render(margin=0)
+        self.assertIsNone(ImageDetector()._detect_axis_aligned(image[:, :, 0]))
+
+    def test_locate_all_symbols(self):
+        """Test que locate_symbols trouve chaque symbole d'une image qui en contient plusieurs."""
+        other = EncodingMatrix(text="Second symbole", error_correction='M')
+        left = self._render(module_size=4)
+        right = np.asarray(MatrixRenderer(other, module_size=4).render_to_image())[:, :, ::-1]
+        right = np.pad(right, ((0, left.shape[0] - right.shape[0]), (0, 0), (0, 0)), constant_values=255)
+        image = np.hstack([left, right])
+        found = {}
+        for (x0, _, _, size), matrix, _ in ImageDetector().locate_symbols(image, adaptive=False):
+            found[round(x0) // left.shape[1]] = MatrixDecoder().decode(matrix)
+        self.assertEqual(found, {0: self.TEXT, 1: "Second symbole"})
+
+    def test_workspaces_reused(self):
+        """Test que les tampons sont réutilisés d'une image à l'autre et que leur nombre est borné."""
+        detector = ImageDetector()
+        gray = self._render(module_size=4)[:, :, 0]
+        first, _ = detector.detect_with_confidence(gray)
+        frame, grid = detector._frames[gray.shape], detector._grids[self.matrix.size]
+        dark, sampled = frame.dark, grid.matrix
+
+        # Un second symbole de même taille réutilise les tampons sans altérer le premier résultat
+        other = EncodingMatrix(text="Voie rapide du décodeur", error_correction='M')
+        self.assertEqual(other.size, self.matrix.size)
+        image = np.asarray(MatrixRenderer(other, module_size=4).render_to_image())[:, :, 0].copy()
+        second, _ = detector.detect_with_confidence(image)
+        self.assertIs(detector._frames[gray.shape], frame)
+        self.assertIs(detector._grids[self.matrix.size], grid)
+        self.assertIs(frame.dark, dark)
+        self.assertIs(grid.matrix, sampled)
+        self.assertFalse(np.shares_memory(first, second) or np.shares_memory(first, grid.matrix))
+        np.testing.assert_array_equal(first, self.expected)
+        self.assertEqual(MatrixDecoder().decode(second), "Voie rapide du décodeur")
+
+        for module_size in range(1, 8):
+            detector.detect_with_confidence(self._render(module_size=module_size)[:, :, 0])
+        self.assertLessEqual(len(detector._frames), 4)
+        self.assertEqual(list(detector._grids), [self.matrix.size])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import numpy as np
+from src.graphic_protocol.encoder.matrix import EncodingMatrix, data_positions
+from src.graphic_protocol.encoder.new_matrix import EncodingMatrix as LazyEncodingMatrix
+from src.graphic_protocol.encoder.renderer import MatrixRenderer
+from src.graphic_protocol.decoder.image_detector import ImageDetector
+from src.graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+class TestMatrixDecoder(unittest.TestCase):
+    """
+    Tests unitaires du décodage des matrices, correction d'erreur comprise.
+    """
+
+    TEXT = "Ticket 000123"
+
+    def _modules(self, matrix: EncodingMatrix) -> np.ndarray:
+        return np.array([[1 if cell else 0 for cell in row] for row in matrix.get_matrix()], dtype=np.uint8)
+
+    def test_round_trip_all_levels(self):
+        """Test que le niveau de correction est retrouvé sans être connu du décodeur."""
+        for level in 'LMQH':
+            for text in (self.TEXT, "x" * 200):
+                matrix = EncodingMatrix(text=text, error_correction=level)
+                self.assertEqual(MatrixDecoder().decode(self._modules(matrix)), text)
+                self.assertEqual(MatrixDecoder(error_correction=level).decode(self._modules(matrix)), text)
+
+    def test_lazy_matrix_same_layout(self):
+        """Test que la matrice compacte place les mots de code au même endroit."""
+        matrix = LazyEncodingMatrix(self.TEXT)
+        modules = np.array([[int(matrix[row, col]) for col in range(matrix.cols)] for row in range(matrix.rows)])
+        self.assertEqual(MatrixDecoder().decode(modules), self.TEXT)
+
+    def test_scattered_errors_corrected(self):
+        """Test de la correction de modules inversés dans la zone de données."""
+        modules = self._modules(EncodingMatrix(text=self.TEXT, error_correction='M'))
+        for row, col in data_positions(modules.shape[0])[:64:9]:
+            modules[row, col] ^= 1
+        self.assertEqual(MatrixDecoder().decode(modules), self.TEXT)
+
+    def test_unknown_size(self):
+        """Test qu'une taille de matrice hors des versions connues est refusée."""
+        with self.assertRaises(ValueError):
+            MatrixDecoder().decode(np.zeros((23, 23), dtype=np.uint8))
+
+    def test_workspace_reused(self):
+        """Test que les tampons de lecture sont réutilisés, quel que soit le type de la matrice."""
+        modules = self._modules(EncodingMatrix(text=self.TEXT, error_correction='M'))
+        decoder = MatrixDecoder()
+        self.assertEqual(decoder.decode(modules), self.TEXT)
+        workspace = decoder._workspaces[modules.shape[0]]
+        self.assertEqual(decoder.decode(modules.astype(bool)), self.TEXT)
+        self.assertEqual(decoder.decode(modules.astype(np.int64), np.ones(modules.shape)), self.TEXT)
+        self.assertIs(decoder._workspaces[modules.shape[0]], workspace)
+
+    def test_stain_recovered_with_confidence(self):
+        """Test qu'une tache grise est corrigée grâce aux effacements, et pas par décision dure."""
+        matrix = EncodingMatrix(text=self.TEXT, error_correction='M')
+        image = np.asarray(MatrixRenderer(matrix, module_size=6, margin=4).render_to_image())[:, :, 0].copy()
+        start = (4 + 9) * 6
+        image[start:start + 7 * 6, start:start + 12 * 6] = 140
+
+        modules, confidence = ImageDetector().detect_with_confidence(image)
+        with self.assertRaises(ValueError):
+            MatrixDecoder().decode(modules)
+        self.assertEqual(MatrixDecoder().decode(modules, confidence), self.TEXT)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import os
+import shutil
+import numpy as np
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.atlas import AtlasRenderer, SheetLayout
+from src.graphic_protocol.decoder.tiled import TiledDecoder, open_scan, tile_origins
+
+class TestTiledDecoder(unittest.TestCase):
+    """
+    Tests unitaires du décodage par tuiles des grands scans.
+    """
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.layout = SheetLayout(page_size=(150, 150), dpi=200)
+        self.texts = [f"ticket-{i:04d}" for i in range(self.layout.per_page)]
+        page = next(AtlasRenderer(self.layout).iter_pages(EncodingMatrix(text=t) for t in self.texts))
+        self.page = (255 - 255 * page).astype(np.uint8)
+        self.test_output_dir = "test_output"
+        os.makedirs(self.test_output_dir, exist_ok=True)
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def test_tile_origins(self):
+        """Test que les tuiles couvrent tout l'axe, la dernière collée au bord."""
+        self.assertEqual(tile_origins(100, 200, 50), [0])
+        self.assertEqual(tile_origins(1000, 400, 100), [0, 300, 600])
+        self.assertEqual(tile_origins(1050, 400, 100), [0, 300, 600, 650])
+
+    def test_decode_array_dedupes_overlaps(self):
+        """Test que chaque symbole est trouvé une fois, avec sa position dans la page."""
+        symbols = TiledDecoder(tile_size=400, overlap=250, workers=2).decode_array(self.page)
+        self.assertEqual(sorted(s.text for s in symbols), self.texts)
+
+        # Position attendue : origine de la cellule + marge (en modules) de l'atlas
+        first = symbols[0]
+        x_mm, y_mm = self.layout.cell_origin(0)
+        cell = self.layout.to_pixels(self.layout.cell_size)
+        offset = (cell - first.size * int(first.module_size)) // 2
+        self.assertAlmostEqual(first.x, self.layout.to_pixels(x_mm) + offset, delta=1)
+        self.assertAlmostEqual(first.y, self.layout.to_pixels(y_mm) + offset, delta=1)
+
+    def test_decode_memory_mapped_files(self):
+        """Test du décodage de fichiers .npy et PGM/PPM projetés en mémoire."""
+        npy_path = os.path.join(self.test_output_dir, "scan.npy")
+        np.save(npy_path, self.page)
+        ppm_path = os.path.join(self.test_output_dir, "scan.ppm")
+        with open(ppm_path, "wb") as f:
+            height, width = self.page.shape
+            f.write(b"P6\n# scan\n%d %d\n255\n" % (width, height))
+            f.write(np.repeat(self.page[:, :, None], 3, axis=2).tobytes())
+
+        decoder = TiledDecoder(tile_size=512, overlap=200)
+        for path in (npy_path, ppm_path):
+            self.assertIsInstance(open_scan(path)[0], np.memmap)
+            self.assertEqual(sorted(s.text for s in decoder.decode_file(path)), self.texts)
+
+    def test_high_bit_depth_scans(self):
+        """Test d'un scan 12 bits enregistré en PGM 16 bits, et du refus des pixels flottants."""
+        pgm_path = os.path.join(self.test_output_dir, "scan.pgm")
+        with open(pgm_path, "wb") as f:
+            height, width = self.page.shape
+            f.write(b"P5\n%d %d\n4095\n" % (width, height))
+            f.write((self.page.astype(">u2") * 4095 // 255).tobytes())
+        self.assertEqual(open_scan(pgm_path)[1], 4095)
+        decoder = TiledDecoder(tile_size=512, overlap=200)
+        self.assertEqual(sorted(s.text for s in decoder.decode_file(pgm_path)), self.texts)
+
+        npy_path = os.path.join(self.test_output_dir, "scan.npy")
+        np.save(npy_path, self.page.astype(np.float32))
+        with self.assertRaises(ValueError):
+            decoder.decode_file(npy_path)
+
+    def test_blank_page(self):
+        """Test qu'une page vierge ne produit aucun symbole."""
+        blank = np.full((600, 600), 255, dtype=np.uint8)
+        self.assertEqual(TiledDecoder(tile_size=256, overlap=64).decode_array(blank), [])
+
+    def test_invalid_overlap(self):
+        """Test qu'un recouvrement supérieur à la taille des tuiles est refusé."""
+        with self.assertRaises(ValueError):
+            TiledDecoder(tile_size=256, overlap=256)
+
+
+if __name__ == "__main__":
+    unittest.main()
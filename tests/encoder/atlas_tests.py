@@ -0,0 +1,91 @@
+import unittest
+import io
+import os
+import re
+import shutil
+import numpy as np
+from src.graphic_protocol.encoder.atlas import AtlasRenderer, SheetLayout
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+
+class TestAtlasRenderer(unittest.TestCase):
+    """
+    Tests unitaires du rendu de planches d'étiquettes.
+    """
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.layout = SheetLayout(dpi=150, cell_size=30.0, gutter=2.0, page_margin=10.0)
+        self.matrices = [EncodingMatrix(text=f"Étiquette {i}", error_correction='L') for i in range(40)]
+        self.test_output_dir = "test_output"
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def test_layout_grid(self):
+        """Test du calcul de la grille sur une page A4."""
+        self.assertEqual((self.layout.columns, self.layout.rows), (6, 8))
+        with self.assertRaises(ValueError):
+            SheetLayout(cell_size=300.0)
+
+    def test_pages_stream_with_single_buffer(self):
+        """Test que les pages sont produites une à une dans le même tampon."""
+        buffers = [id(page) for page in AtlasRenderer(self.layout).iter_pages(self.matrices)]
+        self.assertEqual(len(buffers), 1)
+        more = self.matrices * 3
+        buffers = [id(page) for page in AtlasRenderer(self.layout).iter_pages(iter(more))]
+        self.assertEqual(len(buffers), 3)
+        self.assertEqual(len(set(buffers)), 1)
+
+    def test_symbol_pixels(self):
+        """Test que chaque symbole est écrit module par module dans sa cellule."""
+        page = next(AtlasRenderer(self.layout).iter_pages(self.matrices[:2]))
+        modules = np.array(self.matrices[1].get_matrix(), dtype=bool)
+        size = modules.shape[0]
+        cell = self.layout.to_pixels(self.layout.cell_size)
+        module_size = cell // (size + 2 * self.layout.margin)
+        offset = (cell - size * module_size) // 2
+        x, y = (self.layout.to_pixels(v) for v in self.layout.cell_origin(1))
+        sampled = page[y + offset + module_size // 2::module_size, x + offset + module_size // 2::module_size]
+        np.testing.assert_array_equal(sampled[:size, :size].astype(bool), modules)
+
+    def test_png_pages_with_captions(self):
+        """Test de l'écriture des pages PNG avec légendes."""
+        layout = SheetLayout(dpi=150, cell_size=30.0, captions=True)
+        paths = list(AtlasRenderer(layout).render_png_pages(
+            self.matrices * 2, output_dir=self.test_output_dir, captions=(f"N°{i}" for i in range(80))
+        ))
+        self.assertEqual(len(paths), -(-80 // layout.per_page))
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def test_caption_count_mismatch(self):
+        """Test qu'un nombre de légendes différent du nombre de symboles est refusé."""
+        renderer = AtlasRenderer(SheetLayout(captions=True))
+        for captions in (["a"] * (len(self.matrices) - 1), ["a"] * (len(self.matrices) + 1)):
+            with self.assertRaises(ValueError):
+                list(renderer.iter_pages(self.matrices, captions))
+            stream = io.BytesIO()
+            with self.assertRaises(ValueError):
+                renderer.write_pdf(self.matrices, stream, captions)
+            self.assertEqual(stream.getvalue(), b"")
+
+        # Générateur : erreur détectée en cours d'écriture, document laissé inachevé
+        stream = io.BytesIO()
+        captions = ["a"] * (len(self.matrices) - 1)
+        with self.assertRaises(ValueError):
+            AtlasRenderer(SheetLayout(captions=True, cell_size=60)).write_pdf(iter(self.matrices), stream, captions)
+        self.assertIn(b"/Type /Page ", stream.getvalue())
+        self.assertNotIn(b"%%EOF", stream.getvalue())
+
+    def test_pdf_pages(self):
+        """Test de la variante vectorielle multi-pages."""
+        stream = io.BytesIO()
+        pages = AtlasRenderer(SheetLayout(captions=True)).write_pdf(self.matrices * 2, stream)
+        pdf = stream.getvalue()
+        self.assertEqual(int(re.search(rb"/Count (\d+)", pdf).group(1)), pages)
+        self.assertTrue(pdf.rstrip().endswith(b"%%EOF"))
+
+
+if __name__ == "__main__":
+    unittest.main()
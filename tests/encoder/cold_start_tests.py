@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "src")
+
+class TestEncoderColdStart(unittest.TestCase):
+    """
+    Vérifie que l'encodeur ne charge pas les dépendances lourdes (cv2, numpy, PIL).
+    """
+
+    def _loaded_modules(self, code: str) -> set:
+        """Exécute `code` dans un interpréteur neuf et retourne les modules lourds chargés."""
+        probe = code + "\nimport sys\nprint(','.join(m for m in ('cv2', 'numpy', 'PIL') if m in sys.modules))"
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        output = subprocess.run([sys.executable, "-c", probe], env=env, check=True,
+                                capture_output=True, text=True).stdout.strip()
+        return set(filter(None, output.split(",")))
+
+    def test_encoder_import_is_light(self):
+        """Test que l'import de l'encodeur ne charge aucune dépendance lourde."""
+        loaded = self._loaded_modules(
+            "from graphic_protocol.encoder.data_encoder import DataEncoder\n"
+            "from graphic_protocol.encoder.matrix import EncodingMatrix\n"
+            "from graphic_protocol.encoder.new_matrix import EncodingMatrix as LazyEncodingMatrix\n"
+            "from graphic_protocol.encoder.renderer import MatrixRenderer\n"
+            "from graphic_protocol.encoder.vector_renderer import VectorRenderer\n"
+            "from graphic_protocol.decoder.image_detector import ImageDetector\n"
+            "from graphic_protocol.decoder.matrix_decoder import MatrixDecoder\n"
+        )
+        self.assertEqual(loaded, set())
+
+    def test_vector_encode_is_light(self):
+        """Test qu'un encodage complet jusqu'au SVG ne charge aucune dépendance lourde."""
+        loaded = self._loaded_modules(
+            "from graphic_protocol.encoder.matrix import EncodingMatrix\n"
+            "from graphic_protocol.encoder.vector_renderer import VectorRenderer\n"
+            "VectorRenderer(EncodingMatrix(text='Bonjour')).to_svg()\n"
+        )
+        self.assertEqual(loaded, set())
+
+    def test_raster_output_never_loads_opencv(self):
+        """Test que le rendu PNG charge NumPy mais jamais OpenCV."""
+        loaded = self._loaded_modules(
+            "from graphic_protocol.encoder.matrix import EncodingMatrix\n"
+            "from graphic_protocol.encoder.renderer import MatrixRenderer\n"
+            "MatrixRenderer(EncodingMatrix(text='Bonjour')).render_to_bytes()\n"
+        )
+        self.assertIn("numpy", loaded)
+        self.assertNotIn("cv2", loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
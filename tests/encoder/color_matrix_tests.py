@@ -0,0 +1,120 @@
+import unittest
+import cv2
+import numpy as np
+from src.graphic_protocol.encoder.color_matrix import (
+    PALETTE_4, ColorEncodingMatrix, color_block_layout, data_positions
+)
+from src.graphic_protocol.encoder.color_renderer import ColorMatrixRenderer
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.decoder.color_decoder import ColorMatrixDecoder
+
+class TestColorEncodingMatrix(unittest.TestCase):
+    """
+    Tests unitaires du mode multi-couleurs haute densité.
+    """
+
+    TEXT = "Protocole graphique multi-couleurs : plus de bits par module, symboles plus petits."
+
+    def _round_trip(self, bits_per_module: int, **render_kwargs) -> str:
+        matrix = ColorEncodingMatrix(self.TEXT, bits_per_module=bits_per_module, error_correction='L')
+        renderer = ColorMatrixRenderer(matrix, **render_kwargs)
+        image = np.asarray(renderer.render_to_image())
+        decoder = ColorMatrixDecoder(bits_per_module=bits_per_module)
+        return decoder.decode_image(image, renderer.module_size, renderer.margin)
+
+    def test_invalid_bits_per_module(self):
+        """Test que seuls 2 ou 3 bits par module sont acceptés."""
+        with self.assertRaises(ValueError):
+            ColorEncodingMatrix(self.TEXT, bits_per_module=4)
+
+    def test_smaller_than_monochrome(self):
+        """Test que le même texte tient dans un symbole plus petit."""
+        mono = EncodingMatrix(text=self.TEXT, error_correction='L')
+        color = ColorEncodingMatrix(self.TEXT, bits_per_module=3, error_correction='L')
+        self.assertLess(color.size, mono.size)
+
+    def test_round_trip_4_colors(self):
+        """Test d'un aller-retour rendu -> décodage avec 4 couleurs."""
+        self.assertEqual(self._round_trip(2), self.TEXT)
+
+    def test_round_trip_8_colors(self):
+        """Test d'un aller-retour rendu -> décodage avec 8 couleurs."""
+        self.assertEqual(self._round_trip(3, module_size=6, margin=2), self.TEXT)
+
+    def test_capacity_follows_bits_per_module(self):
+        """Test que la capacité dépend des modules et non de la table monochrome (max 520 octets)."""
+        text = "x" * 600
+        matrix = ColorEncodingMatrix(text, bits_per_module=3, error_correction='L')
+        self.assertLessEqual(matrix.size, 77)
+        self.assertGreater(color_block_layout(77, 3, 'L').total_codewords, 2000)
+        renderer = ColorMatrixRenderer(matrix, module_size=4, margin=2)
+        image = np.asarray(renderer.render_to_image())
+        decoder = ColorMatrixDecoder(bits_per_module=3)
+        self.assertEqual(decoder.decode_image(image, renderer.module_size, renderer.margin), text)
+
+    def test_error_correction_levels(self):
+        """Test que le niveau de correction change le symbole et que les modules altérés sont corrigés."""
+        low = ColorEncodingMatrix(self.TEXT, bits_per_module=2, error_correction='L')
+        high = ColorEncodingMatrix(self.TEXT, bits_per_module=2, error_correction='H')
+        self.assertNotEqual(str(low), str(high))
+        self.assertLess(color_block_layout(high.size, 2, 'H').data_codewords,
+                        color_block_layout(high.size, 2, 'L').data_codewords)
+
+        renderer = ColorMatrixRenderer(high)
+        image = np.array(renderer.render_to_image())
+        step = renderer.module_size
+        for row, col in data_positions(high.size, 4)[:40:3]:
+            y, x = (row + renderer.margin) * step, (col + renderer.margin) * step
+            cell = image[y:y + step, x:x + step]
+            cell[...] = 255 - cell
+        decoder = ColorMatrixDecoder(bits_per_module=2)
+        self.assertEqual(decoder.decode_image(image, step, renderer.margin), self.TEXT)
+
+    def test_locate_in_scan(self):
+        """Test du décodage sans grille connue : symbole décalé, redimensionné, flou ou bruité."""
+        rng = np.random.default_rng(0)
+        for bits_per_module in (2, 3):
+            matrix = ColorEncodingMatrix(self.TEXT, bits_per_module=bits_per_module, error_correction='M')
+            image = np.asarray(ColorMatrixRenderer(matrix, module_size=6, margin=2).render_to_image())
+            page = np.full((image.shape[0] + 90, image.shape[1] + 140, 3), 240, dtype=np.uint8)
+            page[37:37 + image.shape[0], 51:51 + image.shape[1]] = image
+            scaled = cv2.GaussianBlur(cv2.resize(page, None, fx=1.43, fy=1.43), (5, 5), 0)
+            noisy = np.clip(page + rng.normal(0, 18, page.shape), 0, 255).astype(np.uint8)
+
+            decoder = ColorMatrixDecoder(bits_per_module=bits_per_module)
+            for scan in (page, scaled, noisy):
+                self.assertEqual(decoder.decode_image(scan), self.TEXT)
+            geometry, modules = next(decoder.locate_symbols(page))
+            self.assertEqual(geometry[3], matrix.size)
+            self.assertEqual(modules.shape, (matrix.size, matrix.size, 3))
+
+        with self.assertRaises(ValueError):
+            ColorMatrixDecoder().decode_image(np.full((200, 200, 3), 255, dtype=np.uint8))
+
+    def test_confidence_marks_erasures(self):
+        """Test que decode accepte la confiance de MatrixDecoder.decode et s'en sert comme effacements."""
+        matrix = ColorEncodingMatrix(self.TEXT, bits_per_module=2, error_correction='M')
+        image = np.asarray(ColorMatrixRenderer(matrix, module_size=4, margin=0).render_to_image())
+        decoder = ColorMatrixDecoder(bits_per_module=2)
+        modules = decoder.sample_modules(image, 4, 0)
+        confidence = np.ones(modules.shape[:2])
+        cells = matrix.get_matrix()
+        for row, col in data_positions(matrix.size, 4)[:200]:
+            modules[row, col] = PALETTE_4[(cells[row][col] + 1) % 4]
+            confidence[row, col] = 0
+        with self.assertRaises(ValueError):
+            decoder.decode(modules)
+        self.assertEqual(decoder.decode(modules, confidence), self.TEXT)
+
+    def test_calibration_follows_printed_colors(self):
+        """Test que la classification s'appuie sur les couleurs mesurées (impression délavée)."""
+        matrix = ColorEncodingMatrix(self.TEXT, bits_per_module=2, error_correction='L')
+        faded = ((200, 200, 200), (170, 60, 60), (60, 60, 170), (70, 70, 70))
+        renderer = ColorMatrixRenderer(matrix, palette=faded)
+        image = np.asarray(renderer.render_to_image())
+        decoder = ColorMatrixDecoder(bits_per_module=2)
+        self.assertEqual(decoder.decode_image(image, renderer.module_size, renderer.margin), self.TEXT)
+
+
+if __name__ == '__main__':
+    unittest.main()
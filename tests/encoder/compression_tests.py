@@ -0,0 +1,76 @@
+import unittest
+import numpy as np
+from src.graphic_protocol.encoder.data_encoder import DataEncoder, EncodingMode
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+class TestPayloadCompression(unittest.TestCase):
+    """
+    Tests unitaires du mode de compression DEFLATE.
+    """
+
+    JSON_TEXT = '{"id":1,"type":"ticket","status":"active","data":{"name":"Client","value":42}}'
+
+    def _decode(self, matrix: EncodingMatrix, **kwargs) -> str:
+        data = np.array([[1 if cell else 0 for cell in row] for row in matrix.get_matrix()], dtype=np.uint8)
+        return MatrixDecoder(**kwargs).decode(data)
+
+    def test_compression_disabled_by_default(self):
+        """Test que le mode BYTE reste utilisé sans demande explicite."""
+        encoder = DataEncoder(self.JSON_TEXT)
+        self.assertEqual(encoder.mode.value, EncodingMode.BYTE.value)
+
+    def test_compression_reduces_version(self):
+        """Test qu'une charge utile répétitive tient dans une version plus petite."""
+        raw = DataEncoder(self.JSON_TEXT, error_correction='L')
+        packed = DataEncoder(self.JSON_TEXT, error_correction='L', compression=True)
+        self.assertEqual(packed.mode.value, EncodingMode.DEFLATE.value)
+        self.assertLess(packed.version.version_number, raw.version.version_number)
+
+    def test_compression_skipped_when_not_smaller(self):
+        """Test que la compression n'est pas appliquée si elle n'économise rien."""
+        encoder = DataEncoder("xq7", compression=True)
+        self.assertEqual(encoder.mode.value, EncodingMode.BYTE.value)
+
+    def test_non_latin1_round_trip(self):
+        """Test qu'un texte hors Latin-1 passe par DEFLATE (UTF-8), même sans gain de taille."""
+        for text in ("日本語のテキスト、日本語のテキスト", "日", "Prix : 12 €"):
+            encoder = DataEncoder(text, compression=True)
+            self.assertEqual(encoder.mode.value, EncodingMode.DEFLATE.value)
+            matrix = EncodingMatrix(text=text, error_correction='L', compression=True)
+            self.assertEqual(self._decode(matrix), text)
+
+    def test_data_codewords_match_bits(self):
+        """Test que encode_data et bit_count correspondent aux bits de encode(), texte multi-octets compris."""
+        for text, compression in (("Café crème", False), ("Café crème " * 4, True),
+                                  ("日本語のテキスト", True), (self.JSON_TEXT, True)):
+            encoder = DataEncoder(text, compression=compression)
+            bits = encoder.encode()[0]
+            self.assertEqual(encoder.bit_count, len(bits))
+            expected = bytes(int(''.join('1' if bit else '0' for bit in bits[i:i + 8]), 2)
+                             for i in range(0, len(bits), 8))
+            self.assertEqual(encoder.encode_data(), expected)
+
+    def test_non_latin1_requires_compression(self):
+        """Test que le mode BYTE refuse un texte hors Latin-1 au lieu de le corrompre."""
+        with self.assertRaises(ValueError):
+            DataEncoder("日本語")
+        with self.assertRaises(ValueError):
+            EncodingMatrix(text="日本語", error_correction='L')
+        matrix = EncodingMatrix(text="Café crème", error_correction='L')
+        self.assertEqual(self._decode(matrix), "Café crème")
+
+    def test_round_trip(self):
+        """Test que le décodeur décompresse la charge utile de façon transparente."""
+        matrix = EncodingMatrix(text=self.JSON_TEXT, error_correction='L', compression=True)
+        self.assertEqual(self._decode(matrix), self.JSON_TEXT)
+
+    def test_wrong_dictionary_fails(self):
+        """Test qu'un dictionnaire différent de celui de l'encodeur est détecté."""
+        matrix = EncodingMatrix(text=self.JSON_TEXT, error_correction='L', compression=True)
+        with self.assertRaises(ValueError):
+            self._decode(matrix, preset_dictionary=b'autre dictionnaire')
+
+
+if __name__ == '__main__':
+    unittest.main()
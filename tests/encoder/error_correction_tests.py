@@ -0,0 +1,78 @@
+import unittest
+from src.graphic_protocol.encoder.error_correction import (
+    MAX_BLOCK_LENGTH, add_error_correction, block_indices, block_layout, correct_errors, is_clean, pad_data,
+    parity_delta
+)
+from src.graphic_protocol.encoder.data_encoder import Version
+
+class TestErrorCorrection(unittest.TestCase):
+    """
+    Tests unitaires de la correction d'erreur Reed-Solomon.
+    """
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.layout = block_layout(281, 154)
+        self.data = pad_data(b"correction d'erreur", self.layout.data_codewords)
+        self.codewords = add_error_correction(self.data, self.layout)
+
+    def test_layouts_fit_in_blocks(self):
+        """Test que chaque version et niveau tient dans des blocs d'au plus 255 octets."""
+        for version in Version.CAPACITIES:
+            for level in 'LMQH':
+                layout = Version.block_layout_for(version, level)
+                self.assertTrue(all(size + layout.ec_codewords <= MAX_BLOCK_LENGTH for size in layout.data_sizes))
+                used = layout.data_codewords + layout.ec_codewords * len(layout.data_sizes)
+                self.assertLessEqual(used, layout.total_codewords)
+
+    def test_interleaving_is_a_permutation(self):
+        """Test que l'entrelacement utilise chaque position du flux une seule fois."""
+        positions = [index for block in block_indices(self.layout) for index in block]
+        self.assertEqual(sorted(positions), list(range(len(positions))))
+
+    def test_parity_delta_is_linear(self):
+        """Test que la correction mise à jour par différences égale celle d'un encodage complet."""
+        changed = bytearray(self.data)
+        changed[3] ^= 0x5A
+        changed[20] ^= 0x01
+        block = block_indices(self.layout)[0]
+        size, ec = self.layout.data_sizes[0], self.layout.ec_codewords
+        delta = parity_delta(size, ec, [3, 20], bytes([0x5A, 0x01]))
+        before = [self.codewords[i] for i in block[size:]]
+        after = add_error_correction(bytes(changed), self.layout)
+        self.assertEqual([a ^ d for a, d in zip(before, delta)], [after[i] for i in block[size:]])
+
+    def test_padding(self):
+        """Test des octets de remplissage alternés et du dépassement de capacité."""
+        self.assertEqual(pad_data(b"ab", 6), b"ab\xec\x11\xec\x11")
+        with self.assertRaises(ValueError):
+            pad_data(b"abc", 2)
+
+    def test_clean_round_trip(self):
+        """Test qu'un flux intact est reconnu et restitué tel quel."""
+        self.assertTrue(is_clean(self.codewords, self.layout))
+        self.assertEqual(correct_errors(self.codewords, self.layout), self.data)
+
+    def test_errors_corrected(self):
+        """Test de la correction d'erreurs (jusqu'à la moitié des mots de correction par bloc)."""
+        damaged = bytearray(self.codewords)
+        for index in range(0, 2 * (self.layout.ec_codewords // 2), 2):
+            damaged[index] ^= 0xFF
+        self.assertFalse(is_clean(bytes(damaged), self.layout))
+        self.assertEqual(correct_errors(bytes(damaged), self.layout), self.data)
+
+    def test_erasures_double_capacity(self):
+        """Test que des mots de code peu sûrs, déclarés effacés, sont corrigés au-delà de la limite des erreurs."""
+        damaged = bytearray(self.codewords)
+        confidence = [1.0] * len(damaged)
+        [first_block, _] = block_indices(self.layout)
+        for index in first_block[:self.layout.ec_codewords * 2 // 3]:
+            damaged[index] ^= 0x5A
+            confidence[index] = 0.1
+        with self.assertRaises(ValueError):
+            correct_errors(bytes(damaged), self.layout)
+        self.assertEqual(correct_errors(bytes(damaged), self.layout, confidence), self.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
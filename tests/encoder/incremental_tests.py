@@ -0,0 +1,73 @@
+import unittest
+import numpy as np
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.renderer import MatrixRenderer
+from src.graphic_protocol.encoder.incremental import IncrementalRenderer, IncrementalSymbol
+from src.graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+class TestIncrementalSymbol(unittest.TestCase):
+    """
+    Tests unitaires de la mise à jour incrémentale des symboles.
+    """
+
+    def _modules(self, matrix: EncodingMatrix) -> np.ndarray:
+        return np.array([[1 if cell else 0 for cell in row] for row in matrix.get_matrix()], dtype=np.uint8)
+
+    def test_update_matches_full_encoding(self):
+        """Test qu'une mise à jour donne exactement la matrice d'un encodage complet."""
+        for level, old, new in (('M', "Ticket 000123", "Ticket 000124"),
+                                ('H', "Ticket 000123", "Caisse 4 10:42"),
+                                ('L', "x" * 250, "x" * 120 + "y" + "x" * 129)):
+            matrix = EncodingMatrix(text=old, error_correction=level)
+            before = self._modules(matrix)
+            update = IncrementalSymbol(matrix).update(new)
+
+            expected = EncodingMatrix(text=new, error_correction=level)
+            self.assertEqual(matrix.codewords, expected.codewords)
+            np.testing.assert_array_equal(self._modules(matrix), self._modules(expected))
+            flipped = sorted(zip(*np.nonzero(before != self._modules(expected))))
+            self.assertEqual(sorted(update.modules), [(int(r), int(c)) for r, c in flipped])
+
+    def test_only_changed_blocks_recomputed(self):
+        """Test qu'un changement localisé ne touche qu'un bloc d'un symbole multi-blocs."""
+        matrix = EncodingMatrix(text="x" * 250, error_correction='L')
+        symbol = IncrementalSymbol(matrix)
+        self.assertGreater(len(symbol.layout.data_sizes), 1)
+        update = symbol.update("x" * 120 + "y" + "x" * 129)
+        self.assertEqual(len(update.blocks), 1)
+        self.assertEqual(symbol.update(symbol.text), ((), (), ()))
+
+    def test_shorter_message_keeps_version(self):
+        """Test qu'un message plus court reste dans la version du symbole et se décode."""
+        matrix = EncodingMatrix(text="Ticket 000123 - guichet 7", error_correction='M')
+        size = matrix.size
+        IncrementalSymbol(matrix).update("Ticket 9")
+        self.assertEqual(matrix.size, size)
+        self.assertEqual(MatrixDecoder().decode(self._modules(matrix)), "Ticket 9")
+
+    def test_message_too_long(self):
+        """Test qu'un message dépassant la version du symbole est refusé."""
+        symbol = IncrementalSymbol(EncodingMatrix(text="Ticket 000123", error_correction='M'))
+        with self.assertRaises(ValueError):
+            symbol.update("Ticket " + "0" * 40)
+        with self.assertRaises(ValueError):
+            symbol.update("Ticket 日本")
+        with self.assertRaises(ValueError):
+            IncrementalSymbol(EncodingMatrix(size=21))
+
+    def test_repaint_matches_full_render(self):
+        """Test que repeindre les modules modifiés donne l'image d'un rendu complet."""
+        matrix = EncodingMatrix(text="Ticket 000123", error_correction='M')
+        renderer = IncrementalRenderer(matrix, module_size=3, margin=2)
+        update = IncrementalSymbol(matrix).update("Ticket 000124")
+        regions = renderer.repaint(update.modules)
+
+        expected = MatrixRenderer(EncodingMatrix(text="Ticket 000124", error_correction='M'),
+                                  module_size=3, margin=2)._pixel_indices()
+        np.testing.assert_array_equal(renderer.pixels, expected)
+        self.assertEqual(sum(width * height for _, _, width, height in regions), len(update.modules) * 9)
+        self.assertEqual(renderer.render_to_bytes(), MatrixRenderer(matrix, module_size=3, margin=2).render_to_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()
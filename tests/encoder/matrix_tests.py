@@ -1,5 +1,5 @@
 import unittest
-from src.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
 
 class TestEncodingMatrix(unittest.TestCase):
 
@@ -0,0 +1,64 @@
+import unittest
+from unittest import mock
+import numpy as np
+from src.graphic_protocol.encoder.new_matrix import EncodingMatrix
+from src.graphic_protocol.decoder.matrix_decoder import MatrixDecoder
+
+class TestLazyEncodingMatrix(unittest.TestCase):
+    """
+    Tests unitaires de la matrice d'encodage paresseuse (new_matrix).
+    """
+
+    def test_metadata_without_build(self):
+        """Test que version, taille et nombre de bits ne construisent pas le symbole."""
+        matrix = EncodingMatrix("Bonjour", error_correction='L')
+        self.assertEqual(matrix.version.version_number, 1)
+        self.assertEqual(matrix.size, 21)
+        self.assertEqual(matrix.bit_count, len(matrix.encoder.encode()[0]))
+        self.assertFalse(matrix.is_built)
+
+    def test_build_is_cached(self):
+        """Test que des lectures répétées ne reconstruisent pas le symbole."""
+        matrix = EncodingMatrix("Bonjour")
+        with mock.patch.object(EncodingMatrix, "_place_data", autospec=True,
+                               side_effect=EncodingMatrix._place_data) as place_data:
+            for _ in range(3):
+                matrix[0, 0]
+                list(matrix)
+            self.assertEqual(place_data.call_count, 1)
+
+    def test_cache_invalidated_on_input_change(self):
+        """Test que la modification d'une entrée invalide le cache."""
+        matrix = EncodingMatrix("Bonjour")
+        before = str(matrix)
+        matrix.text = "Bonjour"
+        self.assertTrue(matrix.is_built)
+        matrix.text = "Au revoir"
+        self.assertFalse(matrix.is_built)
+        self.assertNotEqual(str(matrix), before)
+        matrix.size = 25
+        self.assertFalse(matrix.is_built)
+        self.assertEqual(len(list(matrix)), 25)
+        data = np.array([list(row) for row in matrix], dtype=np.uint8)
+        self.assertEqual(MatrixDecoder().decode(data), "Au revoir")
+
+    def test_round_trip(self):
+        """Test que le symbole construit est lisible par MatrixDecoder."""
+        matrix = EncodingMatrix("Matrice paresseuse", error_correction='M')
+        data = np.array([list(row) for row in matrix], dtype=np.uint8)
+        self.assertEqual(MatrixDecoder().decode(data), "Matrice paresseuse")
+
+    def test_invalid_size(self):
+        """Test des tailles invalides (trop petite, hors des versions ou trop petite pour les données)."""
+        with self.assertRaises(ValueError):
+            EncodingMatrix("Bonjour", size=20)
+        with self.assertRaises(ValueError):
+            EncodingMatrix("Bonjour", size=22)
+        matrix = EncodingMatrix("x" * 100, size=21)
+        with self.assertRaises(ValueError):
+            matrix[0, 0]
+        self.assertFalse(matrix.is_built)
+
+
+if __name__ == '__main__':
+    unittest.main()
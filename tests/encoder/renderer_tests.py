@@ -1,9 +1,11 @@
 import unittest
 import os
+import io
 import shutil
+import numpy as np
 from PIL import Image
-from src.encoder.matrix import EncodingMatrix
-from src.encoder.renderer import MatrixRenderer
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.renderer import MatrixRenderer
 
 class TestMatrixRenderer(unittest.TestCase):
     """
@@ -82,6 +84,39 @@ class TestMatrixRenderer(unittest.TestCase):
         expected_size = (21 + 2 * 4) * 10  # (matrix_size + 2 * margin) * module_size
         self.assertEqual(image.size, (expected_size, expected_size))
     
+    def test_render_to_bytes(self):
+        """Test que render_to_bytes produit un PNG identique au rendu PIL."""
+        renderer = MatrixRenderer(self.matrix, color_module=(20, 40, 60))
+        data = renderer.render_to_bytes()
+
+        self.assertTrue(data.startswith(b"\x89PNG"))
+        decoded = Image.open(io.BytesIO(data))
+        self.assertEqual(decoded.mode, "P")
+        np.testing.assert_array_equal(
+            np.asarray(decoded.convert("RGB")), np.asarray(renderer.render_to_image())
+        )
+
+    def test_render_to_bytes_is_compact(self):
+        """Test que le PNG à palette 1 bit est plus petit qu'un PNG RGB."""
+        renderer = MatrixRenderer(self.matrix)
+        rgb = io.BytesIO()
+        renderer.render_to_image().save(rgb, format="PNG")
+        self.assertLess(len(renderer.render_to_bytes()), len(rgb.getvalue()))
+
+    def test_render_to_stream_filters(self):
+        """Test que chaque filtre et niveau de compression produit la même image."""
+        renderer = MatrixRenderer(self.matrix)
+        expected = np.asarray(renderer.render_to_image())
+        for png_filter in ("none", "sub", "up"):
+            for level in (0, 9):
+                stream = io.BytesIO()
+                written = renderer.render_to_stream(stream, compress_level=level, png_filter=png_filter)
+                self.assertEqual(written, len(stream.getvalue()))
+                stream.seek(0)
+                np.testing.assert_array_equal(np.asarray(Image.open(stream).convert("RGB")), expected)
+        with self.assertRaises(ValueError):
+            renderer.render_to_bytes(png_filter="paeth")
+
     def test_invalid_matrix_type(self):
         """Test que le renderer rejette les types de matrice non valides."""
         with self.assertRaises(TypeError):
@@ -0,0 +1,70 @@
+import unittest
+import os
+import re
+import shutil
+import xml.etree.ElementTree as ET
+from src.graphic_protocol.encoder.matrix import EncodingMatrix
+from src.graphic_protocol.encoder.vector_renderer import VectorRenderer, merge_module_runs
+
+class TestVectorRenderer(unittest.TestCase):
+    """
+    Tests unitaires pour la classe VectorRenderer.
+    """
+
+    def setUp(self):
+        """Initialisation commune à tous les tests."""
+        self.matrix = EncodingMatrix(text="Rendu vectoriel", error_correction='L')
+        self.test_output_dir = "test_output"
+
+    def tearDown(self):
+        """Nettoyage après chaque test."""
+        if os.path.exists(self.test_output_dir):
+            shutil.rmtree(self.test_output_dir)
+
+    def test_merged_runs_cover_active_modules(self):
+        """Test que les rectangles fusionnés couvrent exactement les modules actifs."""
+        data = self.matrix.get_matrix()
+        covered = set()
+        for row, col, height, width in merge_module_runs(data):
+            for i in range(row, row + height):
+                for j in range(col, col + width):
+                    self.assertNotIn((i, j), covered)
+                    covered.add((i, j))
+        expected = {(i, j) for i, r in enumerate(data) for j, cell in enumerate(r) if cell == 1}
+        self.assertEqual(covered, expected)
+        self.assertLess(len(merge_module_runs(data)), len(expected))
+
+    def test_svg_output(self):
+        """Test que le SVG est bien formé et respecte les dimensions du rendu matriciel."""
+        renderer = VectorRenderer(self.matrix, module_size=5, margin=2, color_module=(10, 20, 30))
+        root = ET.fromstring(renderer.to_svg())
+        expected_size = str((self.matrix.size + 2 * 2) * 5)
+        self.assertEqual(root.get("width"), expected_size)
+        self.assertEqual(root.get("height"), expected_size)
+        path = root.find("{http://www.w3.org/2000/svg}path")
+        self.assertEqual(path.get("fill"), "#0a141e")
+
+    def test_pdf_output(self):
+        """Test que le PDF contient une table de références croisées valide."""
+        pdf = VectorRenderer(self.matrix).to_pdf()
+        self.assertTrue(pdf.startswith(b"%PDF-"))
+        self.assertTrue(pdf.rstrip().endswith(b"%%EOF"))
+        xref_position = int(re.search(rb"startxref\n(\d+)", pdf).group(1))
+        self.assertEqual(pdf[xref_position:xref_position + 4], b"xref")
+        offsets = re.findall(rb"(\d{10}) 00000 n", pdf)
+        for number, offset in enumerate(offsets, start=1):
+            self.assertTrue(pdf[int(offset):].startswith(b"%d 0 obj" % number))
+
+    def test_render_creates_files(self):
+        """Test que render écrit les fichiers SVG et PDF."""
+        renderer = VectorRenderer(self.matrix)
+        for fmt in VectorRenderer.FORMATS:
+            file_path = renderer.render(filename="vector", output_dir=self.test_output_dir, format=fmt)
+            self.assertTrue(os.path.exists(file_path))
+            self.assertTrue(file_path.endswith(f".{fmt}"))
+        with self.assertRaises(ValueError):
+            renderer.render(output_dir=self.test_output_dir, format="eps")
+
+
+if __name__ == "__main__":
+    unittest.main()